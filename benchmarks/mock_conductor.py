@@ -0,0 +1,141 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+A local stand-in for the Conductor API used by the benchmarks.
+
+Every endpoint the benchmark scenarios touch is served with a configurable latency, payload size and error rate. The
+server runs on its own thread and event loop so that it does not compete with the MCP server under test for the loop.
+"""
+
+import asyncio
+import base64
+import json
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+
+@dataclass
+class MockSettings:
+    latency_ms: float = 20.0
+    payload_kb: float = 16.0
+    error_rate: float = 0.0
+    seed: int = 42
+
+
+def _jwt(lifetime_seconds: int = 3600) -> str:
+    def encode(value) -> str:
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'none'})}.{encode({'exp': int(time.time()) + lifetime_seconds})}.mock"
+
+
+def build_app(settings: MockSettings) -> Starlette:
+    rng = random.Random(settings.seed)
+    filler = "x" * int(settings.payload_kb * 1024)
+
+    async def respond(body) -> Response:
+        await asyncio.sleep(settings.latency_ms / 1000)
+        if settings.error_rate and rng.random() < settings.error_rate:
+            return JSONResponse({"status": 503, "message": "mock overload"}, status_code=503)
+        return JSONResponse(body)
+
+    def task(task_id: str, status: str = "COMPLETED") -> dict:
+        return {
+            "taskId": task_id,
+            "taskType": "SIMPLE",
+            "referenceTaskName": f"ref_{task_id}",
+            "status": status,
+            "inputData": {"filler": filler},
+            "outputData": {"filler": filler},
+            "scheduledTime": 1_700_000_000_000,
+            "startTime": 1_700_000_000_500,
+            "endTime": 1_700_000_001_000,
+        }
+
+    async def token(request: Request) -> Response:
+        return JSONResponse({"token": _jwt()})
+
+    async def workflow(request: Request) -> Response:
+        workflow_id = request.path_params["workflow_id"]
+        tasks = [task(f"{workflow_id}-{i}", "FAILED" if i == 3 else "COMPLETED") for i in range(4)]
+        return await respond({"workflowId": workflow_id, "workflowName": "bench", "status": "FAILED", "tasks": tasks})
+
+    async def search(request: Request) -> Response:
+        start = int(request.query_params.get("start", 0))
+        size = int(request.query_params.get("size", 100))
+        results = [
+            {"workflowId": f"wf-{i}", "workflowType": "bench", "status": "FAILED"} for i in range(start, start + size)
+        ]
+        return await respond({"totalHits": 10_000, "results": results})
+
+    async def workflow_definitions(request: Request) -> Response:
+        return await respond([{"name": f"bench_{i}", "version": 1, "description": filler[:256]} for i in range(50)])
+
+    async def task_by_id(request: Request) -> Response:
+        return await respond(task(request.path_params["task_id"]))
+
+    async def task_logs(request: Request) -> Response:
+        return await respond([{"log": filler[:512], "taskId": request.path_params["task_id"], "createdTime": 0}])
+
+    async def queue(request: Request) -> Response:
+        return await respond({f"task_{i}": i * 10 for i in range(100)})
+
+    return Starlette(
+        routes=[
+            Route("/api/token", token, methods=["POST"]),
+            Route("/api/workflow/search", search),
+            Route("/api/metadata/workflow", workflow_definitions),
+            Route("/api/tasks/queue/all", queue),
+            Route("/api/tasks/{task_id}/log", task_logs),
+            Route("/api/tasks/{task_id}", task_by_id),
+            Route("/api/workflow/{workflow_id}", workflow),
+        ]
+    )
+
+
+class MockConductor:
+    """Runs the mock Conductor on a background thread, use as a context manager"""
+
+    def __init__(self, settings: MockSettings, host: str = "127.0.0.1", port: int = 0):
+        self.settings = settings
+        self.host = host
+        self.port = port or _free_port(host)
+        self._server = uvicorn.Server(
+            uvicorn.Config(build_app(settings), host=self.host, port=self.port, log_level="warning", lifespan="off")
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/api"
+
+    def __enter__(self) -> "MockConductor":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+
+def _free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
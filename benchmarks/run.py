@@ -0,0 +1,236 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+Benchmarks the real FastMCP tools and resources against a local mock Conductor.
+
+Example:
+    python -m benchmarks.run --concurrency 16 --requests 500 --latency_ms 20 --output bench_output.json
+    python -m benchmarks.run --baseline bench_output.json --max_regression 0.2
+"""
+
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+import click
+from fastmcp import Client
+from benchmarks.mock_conductor import MockConductor, MockSettings
+from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL, CONDUCTOR_AUTH_KEY, CONDUCTOR_AUTH_SECRET
+from conductor_mcp.utils.stats import percentile
+
+
+@dataclass
+class Scenario:
+    name: str
+    kind: str  # tool or resource
+    target: str
+    arguments: Callable[[int], Dict[str, Any]] = lambda i: {}
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario("get_workflow_by_id", "tool", "workflow_get_workflow_by_id", lambda i: {"workflow_id": f"wf-{i}"}),
+        Scenario(
+            "get_workflow_by_id_failed_tasks",
+            "tool",
+            "workflow_get_workflow_by_id",
+            lambda i: {"workflow_id": f"wf-{i}", "failed_tasks_only": True, "summarize_payloads": True},
+        ),
+        Scenario(
+            "query_workflow_executions",
+            "tool",
+            "workflow_query_workflow_executions",
+            lambda i: {"query": 'status="FAILED"', "size": 100},
+        ),
+        Scenario("get_all_workflows", "tool", "workflow_get_all_workflows"),
+        Scenario("get_task_by_id", "tool", "task_get_task_by_id", lambda i: {"task_id": f"task-{i}"}),
+        Scenario("get_task_logs", "tool", "task_get_task_logs", lambda i: {"task_id": f"task-{i}"}),
+        Scenario("task_queue_resource", "resource", "conductor://resource/tasks/queue"),
+    ]
+}
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss is in kilobytes on linux and bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+async def call(client: Client, scenario: Scenario, i: int):
+    if scenario.kind == "tool":
+        await client.call_tool(scenario.target, scenario.arguments(i))
+    else:
+        await client.read_resource(scenario.target)
+
+
+async def run_scenario(client: Client, scenario: Scenario, requests: int, concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            i = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                await call(client, scenario, i)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    rss_before = current_rss_bytes()
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_per_second": round(requests / elapsed, 2),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 3),
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+        },
+        "rss_bytes": current_rss_bytes(),
+        "rss_growth_bytes": current_rss_bytes() - rss_before,
+    }
+
+
+async def measure_allocations(client: Client, scenario: Scenario, calls: int) -> Dict[str, float]:
+    """Traces a separate sequential pass, since tracemalloc would distort the latency numbers"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(calls):
+            await call(client, scenario, i)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename") if stat.size_diff > 0)
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return {
+        "allocated_bytes_per_call": round(allocated / calls, 1),
+        "allocated_blocks_per_call": round(blocks / calls, 1),
+        "traced_peak_bytes": peak,
+    }
+
+
+async def run_benchmarks(
+    scenarios: List[Scenario], requests: int, concurrency: int, warmup: int, allocation_calls: int
+) -> Dict[str, Any]:
+    # imported late so the server picks up the environment pointing it at the mock
+    from conductor_mcp.server import mcp
+
+    results = {}
+    async with Client(mcp) as client:
+        for scenario in scenarios:
+            for i in range(warmup):
+                await call(client, scenario, i)
+            result = await run_scenario(client, scenario, requests, concurrency)
+            if allocation_calls:
+                result["allocations"] = await measure_allocations(client, scenario, allocation_calls)
+            results[scenario.name] = result
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Lists the scenarios whose p95 latency or throughput regressed by more than max_regression"""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        if result["latency_ms"]["p95"] > previous["latency_ms"]["p95"] * (1 + max_regression):
+            regressions.append(f"{name}: p95 {previous['latency_ms']['p95']}ms -> {result['latency_ms']['p95']}ms")
+        if result["throughput_per_second"] < previous["throughput_per_second"] * (1 - max_regression):
+            regressions.append(
+                f"{name}: throughput {previous['throughput_per_second']}/s -> {result['throughput_per_second']}/s"
+            )
+    return regressions
+
+
+@click.command()
+@click.option("--scenario", "-s", "scenario_names", multiple=True, type=click.Choice(sorted(SCENARIOS)))
+@click.option("--requests", "-n", default=200, show_default=True, help="Calls per scenario.")
+@click.option("--concurrency", "-c", default=8, show_default=True, help="Concurrent MCP calls.")
+@click.option("--warmup", default=5, show_default=True, help="Untimed calls per scenario before measuring.")
+@click.option("--latency_ms", default=20.0, show_default=True, help="Mock Conductor latency per request.")
+@click.option("--payload_kb", default=16.0, show_default=True, help="Mock Conductor payload filler size.")
+@click.option("--error_rate", default=0.0, show_default=True, help="Fraction of mock requests answered with 503.")
+@click.option("--allocation_calls", default=20, show_default=True, help="Calls traced for allocations, 0 disables.")
+@click.option("--output", "-o", default=None, help="Write the JSON results to this file instead of stdout.")
+@click.option("--baseline", default=None, help="A previous JSON result to compare against.")
+@click.option("--max_regression", default=0.2, show_default=True, help="Allowed p95/throughput regression.")
+def main(
+    scenario_names,
+    requests,
+    concurrency,
+    warmup,
+    latency_ms,
+    payload_kb,
+    error_rate,
+    allocation_calls,
+    output,
+    baseline,
+    max_regression,
+):
+    mock_settings = MockSettings(latency_ms=latency_ms, payload_kb=payload_kb, error_rate=error_rate)
+    scenarios = [SCENARIOS[name] for name in scenario_names] or list(SCENARIOS.values())
+    with MockConductor(mock_settings) as conductor:
+        os.environ[CONDUCTOR_SERVER_URL] = conductor.url
+        os.environ.setdefault(CONDUCTOR_AUTH_KEY, "benchmark")
+        os.environ.setdefault(CONDUCTOR_AUTH_SECRET, "benchmark")
+        scenario_results = asyncio.run(run_benchmarks(scenarios, requests, concurrency, warmup, allocation_calls))
+
+    results = {
+        "settings": {
+            "requests": requests,
+            "concurrency": concurrency,
+            "latency_ms": latency_ms,
+            "payload_kb": payload_kb,
+            "error_rate": error_rate,
+            "python": sys.version.split()[0],
+        },
+        "scenarios": scenario_results,
+    }
+    rendered = json.dumps(results, indent=2)
+    if output:
+        with open(output, "w") as file:
+            file.write(rendered)
+    else:
+        click.echo(rendered)
+
+    if baseline:
+        with open(baseline) as file:
+            regressions = compare(results, json.load(file), max_regression)
+        if regressions:
+            raise click.ClickException("Performance regressions:\n" + "\n".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+from click.testing import CliRunner
+from benchmarks import run
+from conductor_mcp.network import token_manager
+from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL, CONDUCTOR_AUTH_KEY, CONDUCTOR_AUTH_SECRET
+
+
+def test_benchmark_smoke(tmp_path, monkeypatch):
+    # the harness points the process at the mock, keep that from leaking into other tests
+    for name in (CONDUCTOR_SERVER_URL, CONDUCTOR_AUTH_KEY, CONDUCTOR_AUTH_SECRET):
+        monkeypatch.setenv(name, "unset")
+    monkeypatch.setattr(token_manager, "_provider", token_manager.TokenProvider())
+    output = tmp_path / "results.json"
+
+    result = CliRunner().invoke(
+        run.main,
+        ["-s", "get_task_by_id", "-n", "10", "-c", "2", "--latency_ms", "1", "--allocation_calls", "2", "-o", output],
+    )
+
+    assert result.exit_code == 0, result.output
+    scenario = json.loads(output.read_text())["scenarios"]["get_task_by_id"]
+    assert scenario["requests"] == 10
+    assert scenario["errors"] == 0
+    assert scenario["latency_ms"]["p50"] <= scenario["latency_ms"]["p99"]
+    assert scenario["allocations"]["allocated_bytes_per_call"] > 0
+
+
+def test_compare_flags_regressions():
+    baseline = {"scenarios": {"a": {"latency_ms": {"p95": 10.0}, "throughput_per_second": 100.0}}}
+    results = {"scenarios": {"a": {"latency_ms": {"p95": 15.0}, "throughput_per_second": 95.0}}}
+
+    assert run.compare(results, baseline, 0.2) == ["a: p95 10.0ms -> 15.0ms"]
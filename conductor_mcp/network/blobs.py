@@ -0,0 +1,257 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+Response bodies larger than CONDUCTOR_MAX_RESPONSE_BYTES are streamed to temporary files ("blobs") instead of memory.
+
+The client receives a short summary with the blob's id and reads the blob in pages, or extracts parts of it with
+JSONPath. Blobs are evicted least recently used first once there are too many or they take too much disk space.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import httpx
+from conductor_mcp.utils import projection, settings
+from conductor_mcp.utils.constants import (
+    CONDUCTOR_BLOB_MAX_BYTES,
+    CONDUCTOR_BLOB_MAX_COUNT,
+    CONDUCTOR_BLOB_MAX_PARSE_BYTES,
+    CONDUCTOR_MAX_RESPONSE_BYTES,
+)
+
+DEFAULT_MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+DEFAULT_BLOB_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_BLOB_MAX_COUNT = 32
+# JSONPath queries parse the whole blob in memory, so they are refused on blobs larger than this
+DEFAULT_BLOB_MAX_PARSE_BYTES = 64 * 1024 * 1024
+PREVIEW_BYTES = 1024
+# the largest page read() returns, so that paging through a blob never loads all of it
+MAX_PAGE_BYTES = 65536
+# hop-by-hop and encoding headers that no longer describe a body that was already decoded and buffered
+STALE_HEADERS = (b"content-encoding", b"content-length", b"transfer-encoding")
+
+
+@dataclass
+class Blob:
+    id: str
+    path: str
+    size: int
+    content_type: str
+    preview: bytes
+    created_at: float
+
+    @property
+    def uri(self) -> str:
+        return f"conductor://blobs/{self.id}"
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "truncated": True,
+            "bytes": self.size,
+            "blob_id": self.id,
+            "blob_uri": self.uri,
+            "preview": self.preview.decode("utf-8", errors="replace"),
+            "hint": "The response was too large to return. Read it in pages or extract parts of it with read_blob "
+            "(offset/length or a JSONPath such as $.tasks[*].status), or request less data.",
+        }
+
+
+class BlobWriter:
+    def __init__(self, store: "BlobStore"):
+        self.store = store
+        self.id = uuid.uuid4().hex[:16]
+        self.path = os.path.join(store.directory(), self.id)
+        self.file = open(self.path, "wb")
+        self.size = 0
+        self.preview = b""
+
+    def write(self, chunk: bytes):
+        if len(self.preview) < PREVIEW_BYTES:
+            self.preview += chunk[: PREVIEW_BYTES - len(self.preview)]
+        self.file.write(chunk)
+        self.size += len(chunk)
+
+    def close(self, content_type: str) -> Blob:
+        self.file.close()
+        blob = Blob(self.id, self.path, self.size, content_type, self.preview, time.time())
+        self.store.add(blob)
+        return blob
+
+    def discard(self):
+        """Closes and deletes a partially written blob, which the store never tracked"""
+        self.file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class BlobStore:
+    def __init__(self, max_count: int, max_bytes: int, max_parse_bytes: int = DEFAULT_BLOB_MAX_PARSE_BYTES):
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.max_parse_bytes = max_parse_bytes
+        self._directory: Optional[str] = None
+        self._blobs: "OrderedDict[str, Blob]" = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def directory(self) -> str:
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="conductor-mcp-blobs-")
+        return self._directory
+
+    def writer(self) -> BlobWriter:
+        return BlobWriter(self)
+
+    def add(self, blob: Blob):
+        self._blobs[blob.id] = blob
+        self._bytes += blob.size
+        while len(self._blobs) > 1 and (len(self._blobs) > self.max_count or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._blobs)))
+            self.evictions += 1
+
+    def get(self, blob_id: str) -> Blob:
+        blob = self._blobs.get(blob_id)
+        if blob is None:
+            raise KeyError(f"Unknown or evicted blob {blob_id}, request the data again")
+        self._blobs.move_to_end(blob_id)
+        return blob
+
+    def read(self, blob_id: str, offset: int, length: int) -> Dict[str, Any]:
+        """One page of a blob's text, with the offset of the next page when there is more
+
+        :param length: The page size, clamped to 1..MAX_PAGE_BYTES
+        :raises ValueError: When the offset is negative
+        """
+        if offset < 0:
+            raise ValueError(f"offset must not be negative, got {offset}")
+        blob = self.get(blob_id)
+        with open(blob.path, "rb") as file:
+            file.seek(offset)
+            data = file.read(min(max(length, 1), MAX_PAGE_BYTES))
+        end = offset + len(data)
+        return {
+            "blob_id": blob_id,
+            "bytes": blob.size,
+            "offset": offset,
+            "text": data.decode("utf-8", errors="replace"),
+            "next_offset": end if end < blob.size else None,
+        }
+
+    def load(self, blob_id: str) -> Any:
+        """Parses a JSON blob
+
+        :raises ValueError: When the blob is too large to parse in memory, with the blob's summary in the message
+        """
+        blob = self.get(blob_id)
+        if blob.size > self.max_parse_bytes:
+            raise ValueError(
+                f"Blob {blob_id} is {blob.size} bytes, JSON is only parsed from blobs of up to {self.max_parse_bytes} "
+                f"bytes. Read it in pages instead, or request less data: {json.dumps(blob.summary())}"
+            )
+        with open(blob.path, "rb") as file:
+            return json.load(file)
+
+    def extract(self, blob_id: str, expression: str) -> List[Any]:
+        """Parses a JSON blob and returns the matches of a JSONPath expression
+
+        :raises ValueError: When the blob is too large to parse in memory, it can still be read in pages
+        """
+        return projection.json_path(self.load(blob_id), expression)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"blobs": len(self._blobs), "bytes": self._bytes, "evictions": self.evictions}
+
+    def close(self):
+        self._blobs.clear()
+        self._bytes = 0
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def _remove(self, blob_id: str):
+        blob = self._blobs.pop(blob_id)
+        self._bytes -= blob.size
+        try:
+            os.remove(blob.path)
+        except OSError:
+            pass
+
+
+_store: Optional[BlobStore] = None
+
+
+def get_store() -> BlobStore:
+    """Returns the process wide blob store, configured from the environment on first use"""
+    global _store
+    if _store is None:
+        _store = BlobStore(
+            settings.get_int(CONDUCTOR_BLOB_MAX_COUNT, DEFAULT_BLOB_MAX_COUNT),
+            settings.get_int(CONDUCTOR_BLOB_MAX_BYTES, DEFAULT_BLOB_MAX_BYTES),
+            settings.get_int(CONDUCTOR_BLOB_MAX_PARSE_BYTES, DEFAULT_BLOB_MAX_PARSE_BYTES),
+        )
+    return _store
+
+
+def close():
+    if _store is not None:
+        _store.close()
+
+
+def max_response_bytes() -> int:
+    return settings.get_int(CONDUCTOR_MAX_RESPONSE_BYTES, DEFAULT_MAX_RESPONSE_BYTES)
+
+
+def spilled(response: httpx.Response) -> Optional[Blob]:
+    """The blob holding the body of a response that was too large to keep in memory, if any"""
+    return response.extensions.get("blob")
+
+
+async def read_capped(response: httpx.Response, max_bytes: int) -> httpx.Response:
+    """Reads a streamed response, keeping at most max_bytes of its body in memory and spilling the rest to a blob
+
+    :param response: A response opened with stream=True, the caller remains responsible for closing it
+    :param max_bytes: The largest body kept in memory
+    :return: A fully read response, with an empty body and the blob in its extensions when the body was spilled
+    """
+    buffer = bytearray()
+    writer = None
+    # file access runs in a worker thread so the event loop never blocks on disk
+    try:
+        async for chunk in response.aiter_bytes():
+            if writer is None and len(buffer) + len(chunk) <= max_bytes:
+                buffer += chunk
+                continue
+            if writer is None:
+                writer = await asyncio.to_thread(get_store().writer)
+                await asyncio.to_thread(writer.write, bytes(buffer))
+                buffer = bytearray()
+            await asyncio.to_thread(writer.write, chunk)
+    except BaseException:
+        # discarded inline rather than in a thread, the task may already be cancelled
+        if writer is not None:
+            writer.discard()
+        raise
+
+    extensions = dict(response.extensions)
+    if writer is not None:
+        extensions["blob"] = await asyncio.to_thread(writer.close, response.headers.get("Content-Type", ""))
+    headers = [(name, value) for name, value in response.headers.raw if name.lower() not in STALE_HEADERS]
+    return httpx.Response(
+        response.status_code, headers=headers, content=bytes(buffer), request=response.request, extensions=extensions
+    )
@@ -0,0 +1,189 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+"""
+Registry of the Conductor clusters the server can talk to.
+
+The cluster configured by CONDUCTOR_SERVER_URL, CONDUCTOR_AUTH_KEY and CONDUCTOR_AUTH_SECRET is the default cluster.
+Further named clusters are configured with CONDUCTOR_CLUSTERS, a JSON object mapping each name to its own
+CONDUCTOR_SERVER_URL, CONDUCTOR_AUTH_KEY and CONDUCTOR_AUTH_SECRET. Every cluster gets its own token, connection pool
+and response cache. Requests go to the cluster selected with use_cluster for the current task, or the default one.
+"""
+
+import asyncio
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import (
+    CONDUCTOR_AUTH_KEY,
+    CONDUCTOR_AUTH_SECRET,
+    CONDUCTOR_CLUSTERS,
+    CONDUCTOR_SERVER_URL,
+)
+
+T = TypeVar("T")
+
+DEFAULT_CLUSTER = "default"
+CLUSTER_ARGUMENT = "cluster"
+# tools named with this suffix query several clusters and take a `clusters` argument instead
+FAN_OUT_SUFFIX = "_all_clusters"
+CLUSTER_ARGUMENT_SCHEMA = {
+    "anyOf": [{"type": "string"}, {"type": "null"}],
+    "default": None,
+    "description": "Optional name of the Conductor cluster to send the request to, the default cluster when omitted",
+}
+
+# the selected named cluster, None selects the default cluster
+_active: ContextVar[Optional[str]] = ContextVar("conductor_cluster", default=None)
+_parsed: Tuple[Optional[str], Dict[str, "Cluster"]] = (None, {})
+
+
+class UnknownClusterError(ValueError):
+    """Raised when a cluster name is not configured"""
+
+    def __init__(self, name: str):
+        super().__init__(f"Unknown cluster '{name}', configured clusters are: {', '.join(names())}")
+
+
+@dataclass(frozen=True)
+class Cluster:
+    name: str
+    server_url: str
+    auth_key: Optional[str]
+    auth_secret: Optional[str]
+
+
+def _named() -> Dict[str, Cluster]:
+    """The clusters configured in CONDUCTOR_CLUSTERS, parsed again only when the setting changes"""
+    global _parsed
+    raw = settings.get_str(CONDUCTOR_CLUSTERS)
+    if raw != _parsed[0]:
+        config = settings.get_json(CONDUCTOR_CLUSTERS, {})
+        named = {
+            name: Cluster(
+                name, values[CONDUCTOR_SERVER_URL], values.get(CONDUCTOR_AUTH_KEY), values.get(CONDUCTOR_AUTH_SECRET)
+            )
+            for name, values in config.items()
+            if name != DEFAULT_CLUSTER
+        }
+        _parsed = (raw, named)
+    return _parsed[1]
+
+
+def default() -> Cluster:
+    return Cluster(
+        DEFAULT_CLUSTER,
+        os.environ[CONDUCTOR_SERVER_URL],
+        os.environ.get(CONDUCTOR_AUTH_KEY),
+        os.environ.get(CONDUCTOR_AUTH_SECRET),
+    )
+
+
+def names() -> List[str]:
+    """The names of every configured cluster, the default cluster first"""
+    return [DEFAULT_CLUSTER, *_named()]
+
+
+def get(name: Optional[str]) -> Cluster:
+    """Looks up a cluster by name
+
+    :param name: The cluster name, None or "default" for the default cluster
+    :return: The cluster
+    :raises UnknownClusterError: When no cluster with that name is configured
+    """
+    if name is None or name == DEFAULT_CLUSTER:
+        return default()
+    cluster = _named().get(name)
+    if cluster is None:
+        raise UnknownClusterError(name)
+    return cluster
+
+
+def active() -> Optional[str]:
+    """The name of the selected named cluster, None when requests go to the default cluster"""
+    return _active.get()
+
+
+def current() -> Cluster:
+    """The cluster requests made by the current task are sent to"""
+    return get(_active.get())
+
+
+@contextmanager
+def use_cluster(name: Optional[str]) -> Iterator[Cluster]:
+    """Sends the requests made inside the block, and the tasks it starts, to the named cluster
+
+    :param name: The cluster name, None or "default" for the default cluster
+    :raises UnknownClusterError: When no cluster with that name is configured
+    """
+    cluster = get(name)
+    token = _active.set(None if cluster.name == DEFAULT_CLUSTER else cluster.name)
+    try:
+        yield cluster
+    finally:
+        _active.reset(token)
+
+
+async def fan_out(
+    call: Callable[[], Awaitable[T]], cluster_names: Optional[Sequence[str]] = None
+) -> Tuple[Dict[str, T], Dict[str, str]]:
+    """Runs the same call against several clusters concurrently
+
+    :param call: The coroutine function to run, it is called once per cluster with that cluster selected
+    :param cluster_names: The clusters to query, every configured cluster when omitted
+    :return: The results keyed by cluster, and the error message of every cluster whose call failed
+    :raises UnknownClusterError: When one of the names is not configured
+    """
+    selected = list(dict.fromkeys(cluster_names or names()))
+    for name in selected:
+        get(name)
+
+    async def run(name: str) -> T:
+        with use_cluster(name):
+            return await call()
+
+    # gather runs each call in its own task, so selecting a cluster in one never leaks into another
+    outcomes = await asyncio.gather(*[run(name) for name in selected], return_exceptions=True)
+    results, errors = {}, {}
+    for name, outcome in zip(selected, outcomes):
+        if isinstance(outcome, BaseException):
+            errors[name] = str(outcome) or type(outcome).__name__
+        else:
+            results[name] = outcome
+    return results, errors
+
+
+class ClusterMiddleware(Middleware):
+    """Adds an optional cluster argument to every tool and runs the call with that cluster selected"""
+
+    async def on_list_tools(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        tools = await call_next(context)
+        return [_with_cluster_argument(tool) for tool in tools]
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        arguments = context.message.arguments
+        if not arguments or CLUSTER_ARGUMENT not in arguments or _takes_clusters(context.message.name):
+            return await call_next(context)
+        with use_cluster(arguments.pop(CLUSTER_ARGUMENT)):
+            return await call_next(context)
+
+
+def _takes_clusters(tool_name: str) -> bool:
+    return tool_name.endswith(FAN_OUT_SUFFIX)
+
+
+def _with_cluster_argument(tool: Any) -> Any:
+    properties = tool.parameters.get("properties", {})
+    if _takes_clusters(tool.name) or CLUSTER_ARGUMENT in properties:
+        return tool
+    parameters = {**tool.parameters, "properties": {**properties, CLUSTER_ARGUMENT: CLUSTER_ARGUMENT_SCHEMA}}
+    return tool.model_copy(update={"parameters": parameters})
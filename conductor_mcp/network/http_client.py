@@ -0,0 +1,99 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+Shared, pooled async HTTP client used for every call made to Conductor.
+
+The client is opened by the server lifespan and closed on shutdown. Code paths that run outside of the server (tests,
+scripts) get a client lazily on first use. Named clusters get their own client, created on first use.
+"""
+
+import importlib.util
+import logging
+from typing import Dict
+import httpx
+from conductor_mcp.network import clusters
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import (
+    CONDUCTOR_HTTP_MAX_CONNECTIONS,
+    CONDUCTOR_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    CONDUCTOR_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    CONDUCTOR_HTTP_TIMEOUT_SECONDS,
+    CONDUCTOR_HTTP_CONNECT_TIMEOUT_SECONDS,
+    CONDUCTOR_HTTP2,
+)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_TIMEOUT_SECONDS = 30.0
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
+
+_client: httpx.AsyncClient | None = None
+# the clients of the named clusters, the default cluster uses _client
+_cluster_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _http2_enabled() -> bool:
+    if not settings.get_bool(CONDUCTOR_HTTP2, True):
+        return False
+    # httpx only negotiates HTTP/2 when the optional h2 package is installed
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_client() -> httpx.AsyncClient:
+    """Creates an AsyncClient configured from the environment
+
+    :return: A new keep-alive pooled client
+    """
+    limits = httpx.Limits(
+        max_connections=settings.get_int(CONDUCTOR_HTTP_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS),
+        max_keepalive_connections=settings.get_int(
+            CONDUCTOR_HTTP_MAX_KEEPALIVE_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        keepalive_expiry=settings.get_float(CONDUCTOR_HTTP_KEEPALIVE_EXPIRY_SECONDS, DEFAULT_KEEPALIVE_EXPIRY_SECONDS),
+    )
+    timeout = httpx.Timeout(
+        settings.get_float(CONDUCTOR_HTTP_TIMEOUT_SECONDS, DEFAULT_TIMEOUT_SECONDS),
+        connect=settings.get_float(CONDUCTOR_HTTP_CONNECT_TIMEOUT_SECONDS, DEFAULT_CONNECT_TIMEOUT_SECONDS),
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout, http2=_http2_enabled())
+
+
+def get_client() -> httpx.AsyncClient:
+    """Returns the shared client of the current cluster, creating it if the server lifespan has not opened one yet"""
+    global _client
+    cluster = clusters.active()
+    if cluster is not None:
+        client = _cluster_clients.get(cluster)
+        if client is None or client.is_closed:
+            client = _cluster_clients[cluster] = build_client()
+        return client
+    if _client is None or _client.is_closed:
+        _client = build_client()
+    return _client
+
+
+async def open_client() -> httpx.AsyncClient:
+    """Opens the shared client at server startup, replacing any client created lazily before it"""
+    global _client
+    await close_client()
+    _client = build_client()
+    logging.info(f"Opened Conductor HTTP client (http2={_http2_enabled()})")
+    return _client
+
+
+async def close_client():
+    """Closes the shared clients of every cluster and releases their pooled connections"""
+    global _client
+    for client in [_client, *_cluster_clients.values()]:
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    _client = None
+    _cluster_clients.clear()
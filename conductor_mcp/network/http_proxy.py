@@ -7,33 +7,203 @@
 #  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 #  specific language governing permissions and limitations under the License.
 
+import asyncio
 import json
 import logging
+import time
 import httpx
 import os
-from typing import Dict, Any
-from conductor_mcp.network import token_manager
-from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL
+from typing import Dict, Any, Optional
+from conductor_mcp.network import (
+    blobs,
+    clusters,
+    coalescing,
+    http_client,
+    rate_limiter,
+    resilience,
+    response_cache,
+    token_manager,
+)
+from conductor_mcp.utils import metrics, tracing
 
 
-logging.basicConfig(
-    format="%(levelname)s [%(asctime)s] %(name)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S", level=logging.DEBUG
-)
+MAX_ERROR_LENGTH = 200
 
 
-async def http_get(resource_path: str):
-    """Executes token-authenticated HTTP GET requests to the provided URL
+class ConductorRequestError(Exception):
+    """Raised when Conductor answers a request with an error status"""
+
+    def __init__(self, response: httpx.Response):
+        self.status_code = response.status_code
+        super().__init__(error_text(response))
+
+
+def error_text(response: httpx.Response) -> str:
+    """A short description of an error response, suitable for per-item error summaries"""
+    text = response.text.strip() or response.reason_phrase
+    return f"{response.status_code}: {text[:MAX_ERROR_LENGTH]}"
 
+
+async def http_request(
+    method: str,
+    resource_path: str,
+    data: Any = None,
+    additional_headers: Dict[str, str] = {},
+    max_body_bytes: Optional[int] = None,
+) -> httpx.Response:
+    """Executes a token-authenticated HTTP request through the shared, pooled client of the current cluster
+
+    :param method: The HTTP verb to use
     :param resource_path: The resource path to apply to the server's API endpoint
-    :return: The results of the GET request
+    :param data: Any JSON serializable body to send with the request (optional)
+    :param additional_headers: A dictionary containing any additional key/values to add to the headers of the request
+    :param max_body_bytes: When given, the body is streamed and spilled to a blob once it grows past this size
+    :return: The full httpx response
     """
-    full_url = os.path.join(os.environ[CONDUCTOR_SERVER_URL], resource_path)
+    cluster = clusters.current()
+    full_url = os.path.join(cluster.server_url, resource_path)
+    if method == "GET":
+        # identical reads for the same principal that are already in flight share one upstream request
+        key = (
+            coalescing.normalize_url(full_url),
+            cluster.name,
+            cluster.auth_key,
+            frozenset(additional_headers.items()),
+            max_body_bytes,
+        )
+        return await coalescing.get_coalescer().do(
+            key, lambda: _request(method, full_url, resource_path, data, additional_headers, max_body_bytes)
+        )
+    return await _request(method, full_url, resource_path, data, additional_headers, max_body_bytes)
+
+
+async def _request(
+    method: str,
+    full_url: str,
+    resource_path: str,
+    data: Any,
+    additional_headers: Dict[str, str],
+    max_body_bytes: Optional[int],
+) -> httpx.Response:
     logging.debug(f"Requesting url: {full_url}")
+    content = json.dumps(data) if data is not None else None
+    replayable = resilience.is_replayable(method, additional_headers)
+    endpoint_class = rate_limiter.classify(method, resource_path)
+    endpoint = metrics.endpoint_template(resource_path)
+    with tracing.span(
+        f"{method} {endpoint}",
+        kind="client",
+        **{"http.request.method": method, "url.template": endpoint, "conductor.cluster": clusters.current().name},
+    ) as span:
+        response = await _authenticated(
+            method, full_url, endpoint, endpoint_class, replayable, content, additional_headers, max_body_bytes
+        )
+        blob = blobs.spilled(response)
+        size = blob.size if blob is not None else len(response.content)
+        tracing.set_attributes(
+            span, **{"http.response.status_code": response.status_code, "http.response.body.size": size}
+        )
+    metrics.UPSTREAM_RESPONSE_BYTES.observe(size, method=method, endpoint=endpoint)
+    return response
+
+
+async def _authenticated(
+    method: str,
+    full_url: str,
+    endpoint: str,
+    endpoint_class: str,
+    replayable: bool,
+    content: str | None,
+    additional_headers: Dict[str, str],
+    max_body_bytes: Optional[int],
+) -> httpx.Response:
     token = await token_manager.get_token()
-    response = httpx.get(
-        full_url, headers={"X-Authorization": token, "Content-Type": "application/json; charset=utf-8"}
+    response = await resilience.send(
+        full_url,
+        replayable,
+        lambda: _send(method, full_url, endpoint, endpoint_class, token, content, additional_headers, max_body_bytes),
     )
-    return response.text
+    if response.status_code == 401:
+        # the token was revoked or expired early, refresh it once and replay the request
+        logging.info("Conductor rejected the token, refreshing and retrying")
+        token = await token_manager.force_refresh(token)
+        response = await resilience.send(
+            full_url,
+            replayable,
+            lambda: _send(
+                method, full_url, endpoint, endpoint_class, token, content, additional_headers, max_body_bytes
+            ),
+        )
+    return response
+
+
+async def _send(
+    method: str,
+    full_url: str,
+    endpoint: str,
+    endpoint_class: str,
+    token: str,
+    content: str | None,
+    additional_headers: Dict[str, str],
+    max_body_bytes: Optional[int] = None,
+) -> httpx.Response:
+    headers = {
+        "X-Authorization": token,
+        "Content-Type": "application/json; charset=utf-8",
+        **additional_headers,
+    }
+    tracing.inject(headers)
+    # the limiter is held per attempt so that a request backing off between retries does not keep its slot
+    async with rate_limiter.get_limiter().acquire(endpoint_class):
+        started = time.perf_counter()
+        status = "error"
+        try:
+            client = http_client.get_client()
+            if max_body_bytes is None:
+                response = await client.request(method, full_url, headers=headers, content=content)
+            else:
+                request = client.build_request(method, full_url, headers=headers, content=content)
+                streamed = await client.send(request, stream=True)
+                try:
+                    response = await blobs.read_capped(streamed, max_body_bytes)
+                finally:
+                    await streamed.aclose()
+            status = str(response.status_code)
+            return response
+        finally:
+            metrics.UPSTREAM_LATENCY.observe(
+                time.perf_counter() - started, method=method, endpoint=endpoint, status=status
+            )
+
+
+async def http_get(resource_path: str):
+    """Executes token-authenticated HTTP GET requests to the provided URL
+
+    :param resource_path: The resource path to apply to the server's API endpoint
+    :return: The results of the GET request, or a summary pointing at a blob when the response is too large
+    """
+    max_body_bytes = blobs.max_response_bytes()
+    cache = response_cache.get_cache()
+    if cache.ttl_for(resource_path) <= 0:
+        response = await http_request("GET", resource_path, max_body_bytes=max_body_bytes)
+        return _response_text(response)
+
+    entry = cache.lookup(resource_path)
+    if entry is not None and entry.is_fresh():
+        return entry.text
+    validators = entry.validators() if entry is not None else {}
+    response = await http_request("GET", resource_path, additional_headers=validators, max_body_bytes=max_body_bytes)
+    if response.status_code == 304 and entry is not None:
+        cache.revalidated(resource_path, entry)
+        return entry.text
+    if blobs.spilled(response) is None:
+        cache.store(resource_path, response)
+    return _response_text(response)
+
+
+def _response_text(response: httpx.Response) -> str:
+    blob = blobs.spilled(response)
+    return json.dumps(blob.summary()) if blob is not None else response.text
 
 
 async def http_post(resource_path: str, data: Dict[str, Any] = {}, additional_headers: Dict[str, str] = {}):
@@ -44,18 +214,8 @@ async def http_post(resource_path: str, data: Dict[str, Any] = {}, additional_he
     :param additional_headers: A dictionary containing any additional key/values to add to the headers of the request
     :return: The results of the POST request
     """
-    full_url = os.path.join(os.environ[CONDUCTOR_SERVER_URL], resource_path)
-    logging.debug(f"Requesting url: {full_url}")
-    token = await token_manager.get_token()
-    response = httpx.post(
-        full_url,
-        headers={
-            "X-Authorization": token,
-            "Content-Type": "application/json; charset=utf-8",
-            **additional_headers,
-        },
-        data=json.dumps(data),
-    )
+    response = await http_request("POST", resource_path, data=data, additional_headers=additional_headers)
+    response_cache.get_cache().invalidate(resource_path)
     return response.text
 
 
@@ -67,18 +227,8 @@ async def http_put(resource_path: str, data: Dict[str, Any] = None, additional_h
     :param additional_headers: A dictionary containing any additional key/values to add to the headers of the request
     :return: The results of the PUT request
     """
-    full_url = os.path.join(os.environ[CONDUCTOR_SERVER_URL], resource_path)
-    logging.debug(f"Requesting url: {full_url}")
-    token = await token_manager.get_token()
-    headers = {
-        "X-Authorization": token,
-        "Content-Type": "application/json; charset=utf-8",
-        **additional_headers,
-    }
-    if data is not None:
-        response = httpx.put(full_url, headers=headers, data=json.dumps(data))
-    else:
-        response = httpx.put(full_url, headers=headers)
+    response = await http_request("PUT", resource_path, data=data, additional_headers=additional_headers)
+    response_cache.get_cache().invalidate(resource_path)
     return response.text
 
 
@@ -89,15 +239,26 @@ async def http_delete(resource_path: str, additional_headers: Dict[str, str] = {
     :param additional_headers: A dictionary containing any additional key/values to add to the headers of the request
     :return: The results of the DELETE request
     """
-    full_url = os.path.join(os.environ[CONDUCTOR_SERVER_URL], resource_path)
-    logging.debug(f"Requesting url: {full_url}")
-    token = await token_manager.get_token()
-    response = httpx.delete(
-        full_url,
-        headers={
-            "X-Authorization": token,
-            "Content-Type": "application/json; charset=utf-8",
-            **additional_headers,
-        },
-    )
+    response = await http_request("DELETE", resource_path, additional_headers=additional_headers)
+    response_cache.get_cache().invalidate(resource_path)
     return response.text
+
+
+async def http_get_json(resource_path: str) -> Any:
+    """Executes a token-authenticated HTTP GET request and parses the JSON result
+
+    Bodies larger than CONDUCTOR_MAX_RESPONSE_BYTES are spilled to a blob and parsed from there, so the raw body is
+    never buffered in memory.
+
+    :param resource_path: The resource path to apply to the server's API endpoint
+    :return: The parsed JSON body
+    :raises ConductorRequestError: When Conductor responds with an error status
+    :raises ValueError: When the body was spilled to a blob too large to parse, with the blob's summary in the message
+    """
+    response = await http_request("GET", resource_path, max_body_bytes=blobs.max_response_bytes())
+    if not response.is_success:
+        raise ConductorRequestError(response)
+    blob = blobs.spilled(response)
+    if blob is not None:
+        return await asyncio.to_thread(blobs.get_store().load, blob.id)
+    return response.json()
@@ -0,0 +1,334 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+A local SQLite mirror of the workflow and task definitions, indexed by the tasks and sub-workflows each workflow uses.
+
+The index survives restarts in CONDUCTOR_CACHE_DIR and is synced incrementally: only definitions whose version or
+updateTime changed are fetched again. All SQLite access runs in a worker thread so the event loop never blocks on disk.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from conductor_mcp.network import clusters, http_proxy
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.concurrency import batch_concurrency, gather_bounded
+from conductor_mcp.utils.constants import (
+    CONDUCTOR_CACHE_DIR,
+    CONDUCTOR_METADATA_SYNC_SECONDS,
+    CONDUCTOR_SERVER_URL,
+)
+
+DEFAULT_SYNC_SECONDS = 300.0
+WORKFLOW_LIST_PATH = "metadata/workflow?short=true&metadata=true"
+TASK_DEFINITIONS_PATH = "metadata/taskdefs?access=READ&metadata=false"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    name TEXT NOT NULL, version INTEGER NOT NULL, update_time INTEGER NOT NULL, description TEXT,
+    PRIMARY KEY (name, version)
+);
+CREATE TABLE IF NOT EXISTS workflow_tasks (
+    workflow_name TEXT NOT NULL, workflow_version INTEGER NOT NULL, task_reference_name TEXT, task_name TEXT,
+    task_type TEXT, sub_workflow_name TEXT, sub_workflow_version INTEGER, http_uri TEXT
+);
+CREATE INDEX IF NOT EXISTS workflow_tasks_by_workflow ON workflow_tasks (workflow_name, workflow_version);
+CREATE INDEX IF NOT EXISTS workflow_tasks_by_task ON workflow_tasks (task_name);
+CREATE INDEX IF NOT EXISTS workflow_tasks_by_sub_workflow ON workflow_tasks (sub_workflow_name);
+CREATE TABLE IF NOT EXISTS task_definitions (
+    name TEXT PRIMARY KEY, update_time INTEGER NOT NULL, description TEXT
+);
+"""
+FTS_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS descriptions USING fts5(kind UNINDEXED, name, version UNINDEXED, text)"
+# used when SQLite was built without FTS5, searched with LIKE instead
+PLAIN_SCHEMA = "CREATE TABLE IF NOT EXISTS descriptions (kind TEXT, name TEXT, version INTEGER, text TEXT)"
+
+
+def _stamp(definition: Dict[str, Any]) -> int:
+    return definition.get("updateTime") or definition.get("createTime") or 0
+
+
+def walk_tasks(tasks: Optional[List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """Yields every task of a workflow, including the ones nested in switch, fork and do while tasks"""
+    for task in tasks or []:
+        yield task
+        for branch in (task.get("decisionCases") or {}).values():
+            yield from walk_tasks(branch)
+        yield from walk_tasks(task.get("defaultCase"))
+        for fork in task.get("forkTasks") or []:
+            yield from walk_tasks(fork)
+        yield from walk_tasks(task.get("loopOver"))
+
+
+def _http_uri(task: Dict[str, Any]) -> Optional[str]:
+    parameters = task.get("inputParameters")
+    if not isinstance(parameters, dict):
+        return None
+    request = parameters.get("http_request")
+    uri = request.get("uri") if isinstance(request, dict) else parameters.get("uri")
+    return uri if isinstance(uri, str) else None
+
+
+def _task_rows(workflow: Dict[str, Any]) -> List[Tuple]:
+    rows = []
+    for task in walk_tasks(workflow.get("tasks")):
+        sub_workflow = task.get("subWorkflowParam") or {}
+        rows.append(
+            (
+                workflow["name"],
+                workflow.get("version", 1),
+                task.get("taskReferenceName"),
+                task.get("name"),
+                task.get("type"),
+                sub_workflow.get("name"),
+                sub_workflow.get("version"),
+                _http_uri(task),
+            )
+        )
+    return rows
+
+
+def default_path() -> str:
+    """One index file per Conductor server, in CONDUCTOR_CACHE_DIR or the user's cache directory"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    directory = settings.get_str(CONDUCTOR_CACHE_DIR, os.path.join(cache_home, "conductor-mcp"))
+    server_url = clusters.current().server_url if clusters.active() else os.environ.get(CONDUCTOR_SERVER_URL, "")
+    server = hashlib.sha256(server_url.encode()).hexdigest()[:12]
+    return os.path.join(directory, f"metadata-{server}.sqlite3")
+
+
+class MetadataIndex:
+    def __init__(self, path: str, sync_seconds: float):
+        self.path = path
+        self.sync_seconds = sync_seconds
+        self.synced_at: Optional[float] = None
+        self.fts = True
+        self._sync: Optional[asyncio.Task] = None
+        self._sync_full = False
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        if not self._initialized:
+            connection.executescript(SCHEMA)
+            try:
+                connection.execute(FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                self.fts = False
+                connection.execute(PLAIN_SCHEMA)
+            connection.commit()
+            self._initialized = True
+        return connection
+
+    def _stamps(self) -> Tuple[Dict[Tuple[str, int], int], Dict[str, int]]:
+        with closing(self._connect()) as connection:
+            workflows = {
+                (name, version): stamp
+                for name, version, stamp in connection.execute("SELECT name, version, update_time FROM workflows")
+            }
+            task_definitions = dict(connection.execute("SELECT name, update_time FROM task_definitions"))
+        return workflows, task_definitions
+
+    def _apply(
+        self,
+        workflows: List[Dict[str, Any]],
+        removed_workflows: List[Tuple[str, int]],
+        task_definitions: List[Dict[str, Any]],
+        removed_task_definitions: List[str],
+    ):
+        with closing(self._connect()) as connection, connection:
+            for name, version in removed_workflows + [(w["name"], w.get("version", 1)) for w in workflows]:
+                connection.execute("DELETE FROM workflows WHERE name = ? AND version = ?", (name, version))
+                connection.execute(
+                    "DELETE FROM workflow_tasks WHERE workflow_name = ? AND workflow_version = ?", (name, version)
+                )
+                connection.execute(
+                    "DELETE FROM descriptions WHERE kind = 'workflow' AND name = ? AND version = ?", (name, version)
+                )
+            for name in removed_task_definitions + [t["name"] for t in task_definitions]:
+                connection.execute("DELETE FROM task_definitions WHERE name = ?", (name,))
+                connection.execute("DELETE FROM descriptions WHERE kind = 'task' AND name = ?", (name,))
+
+            for workflow in workflows:
+                version = workflow.get("version", 1)
+                description = workflow.get("description") or ""
+                connection.execute(
+                    "INSERT INTO workflows VALUES (?, ?, ?, ?)",
+                    (workflow["name"], version, _stamp(workflow), description),
+                )
+                connection.executemany(
+                    "INSERT INTO workflow_tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)", _task_rows(workflow)
+                )
+                connection.execute(
+                    "INSERT INTO descriptions VALUES ('workflow', ?, ?, ?)", (workflow["name"], version, description)
+                )
+            for task_definition in task_definitions:
+                description = task_definition.get("description") or ""
+                connection.execute(
+                    "INSERT INTO task_definitions VALUES (?, ?, ?)",
+                    (task_definition["name"], _stamp(task_definition), description),
+                )
+                connection.execute(
+                    "INSERT INTO descriptions VALUES ('task', ?, NULL, ?)", (task_definition["name"], description)
+                )
+
+    async def _run_sync(self, full: bool) -> Dict[str, Any]:
+        listing = await http_proxy.http_get_json(WORKFLOW_LIST_PATH)
+        task_definitions = await http_proxy.http_get_json(TASK_DEFINITIONS_PATH)
+        known_workflows, known_task_definitions = await asyncio.to_thread(self._stamps)
+
+        listed = {(w["name"], w.get("version", 1)): w for w in listing}
+        changed = [w for key, w in listed.items() if full or known_workflows.get(key) != _stamp(w)]
+        # the short listing of some servers already carries the tasks, the rest need one request per definition
+        incomplete = [w for w in changed if "tasks" not in w]
+        concurrency = batch_concurrency()
+        fetched = await gather_bounded(
+            incomplete,
+            lambda w: http_proxy.http_get_json(f"metadata/workflow/{w['name']}?version={w.get('version', 1)}"),
+            concurrency,
+        )
+        # a definition that cannot be read (e.g. a 403) keeps its previous stamp, so the next sync retries it
+        failed = {
+            f"{w['name']}:{w.get('version', 1)}": str(result)
+            for w, result in zip(incomplete, fetched)
+            if isinstance(result, Exception)
+        }
+        workflows = [w for w in changed if "tasks" in w] + [w for w in fetched if not isinstance(w, Exception)]
+
+        listed_task_definitions = {t["name"]: t for t in task_definitions}
+        changed_task_definitions = [
+            t for name, t in listed_task_definitions.items() if full or known_task_definitions.get(name) != _stamp(t)
+        ]
+        removed_workflows = [key for key in known_workflows if key not in listed]
+        removed_task_definitions = [name for name in known_task_definitions if name not in listed_task_definitions]
+
+        await asyncio.to_thread(
+            self._apply, workflows, removed_workflows, changed_task_definitions, removed_task_definitions
+        )
+        self.synced_at = time.monotonic()
+        return {
+            "workflows": len(listed),
+            "workflows_updated": len(workflows),
+            "workflows_removed": len(removed_workflows),
+            "task_definitions": len(listed_task_definitions),
+            "task_definitions_updated": len(changed_task_definitions),
+            "task_definitions_removed": len(removed_task_definitions),
+            "workflows_failed": failed,
+        }
+
+    def start_sync(self, full: bool = False) -> asyncio.Task:
+        """Starts a sync in the background, or returns the one already running
+
+        A full sync requested while an incremental one is running is queued to start once that one finishes.
+        """
+        running = self._sync if self._sync is not None and not self._sync.done() else None
+        if running is not None and (self._sync_full or not full):
+            return running
+        self._sync = asyncio.ensure_future(self._run_sync_after(running, full))
+        self._sync_full = full
+        self._sync.add_done_callback(_log_sync_failure)
+        return self._sync
+
+    async def _run_sync_after(self, previous: Optional[asyncio.Task], full: bool) -> Dict[str, Any]:
+        if previous is not None:
+            # waits without raising, the previous sync's failure is logged by its own callback
+            await asyncio.wait([previous])
+        return await self._run_sync(full)
+
+    async def sync(self, full: bool = False) -> Dict[str, Any]:
+        return await self.start_sync(full)
+
+    async def ensure_synced(self):
+        """Syncs when the index is older than the sync interval, serving the previous index if Conductor fails"""
+        if self.synced_at is not None and time.monotonic() - self.synced_at < self.sync_seconds:
+            return
+        try:
+            await self.sync()
+        except Exception:
+            if not await asyncio.to_thread(self._has_definitions):
+                raise
+
+    def _has_definitions(self) -> bool:
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT 1 FROM workflows LIMIT 1").fetchone() is not None
+
+    def _query(self, sql: str, parameters: Tuple = ()) -> List[Dict[str, Any]]:
+        with closing(self._connect()) as connection:
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, parameters)]
+
+    def workflows_using_task(self, task_name: str) -> List[Dict[str, Any]]:
+        return self._query(
+            "SELECT workflow_name, workflow_version, task_reference_name, task_type FROM workflow_tasks "
+            "WHERE task_name = ? ORDER BY workflow_name, workflow_version",
+            (task_name,),
+        )
+
+    def http_tasks(self, uri_fragment: str) -> List[Dict[str, Any]]:
+        return self._query(
+            "SELECT workflow_name, workflow_version, task_reference_name, http_uri FROM workflow_tasks "
+            "WHERE http_uri LIKE ? ORDER BY workflow_name, workflow_version",
+            (f"%{uri_fragment}%",),
+        )
+
+    def sub_workflow_edges(self) -> List[Dict[str, Any]]:
+        return self._query(
+            "SELECT DISTINCT workflow_name, workflow_version, task_reference_name, sub_workflow_name, "
+            "sub_workflow_version FROM workflow_tasks WHERE sub_workflow_name IS NOT NULL "
+            "ORDER BY workflow_name, workflow_version"
+        )
+
+    def search(self, text: str, limit: int) -> List[Dict[str, Any]]:
+        if self.fts:
+            terms = " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+            return self._query(
+                "SELECT kind, name, version, text AS description FROM descriptions WHERE descriptions MATCH ? "
+                "ORDER BY rank LIMIT ?",
+                (terms, limit),
+            )
+        return self._query(
+            "SELECT kind, name, version, text AS description FROM descriptions "
+            "WHERE name LIKE ? OR text LIKE ? LIMIT ?",
+            (f"%{text}%", f"%{text}%", limit),
+        )
+
+
+def _log_sync_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logging.warning(f"Metadata index sync failed: {task.exception()}")
+
+
+_index: Optional[MetadataIndex] = None
+# the indexes of the named clusters, the default cluster uses _index
+_cluster_indexes: Dict[str, MetadataIndex] = {}
+
+
+def get_index() -> MetadataIndex:
+    """Returns the metadata index of the current cluster, creating it on first use"""
+    global _index
+    cluster = clusters.active()
+    if cluster is not None:
+        if cluster not in _cluster_indexes:
+            _cluster_indexes[cluster] = MetadataIndex(
+                default_path(), settings.get_float(CONDUCTOR_METADATA_SYNC_SECONDS, DEFAULT_SYNC_SECONDS)
+            )
+        return _cluster_indexes[cluster]
+    if _index is None:
+        _index = MetadataIndex(
+            default_path(), settings.get_float(CONDUCTOR_METADATA_SYNC_SECONDS, DEFAULT_SYNC_SECONDS)
+        )
+    return _index
@@ -0,0 +1,157 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import asyncio
+import logging
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+from conductor_mcp.network import clusters, http_proxy
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import CONDUCTOR_QUEUE_SAMPLE_CAPACITY, CONDUCTOR_QUEUE_SAMPLE_SECONDS
+from conductor_mcp.utils.stats import linear_slope
+
+DEFAULT_SAMPLE_SECONDS = 30.0
+DEFAULT_CAPACITY = 240
+# depth recorded for a task type that was absent from a sample
+MISSING = -1
+
+
+class QueueHistory:
+    """Fixed-size ring buffer of queue depth samples, one array per task type sharing one array of sample times"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.times = array("d", [0.0] * capacity)
+        self.depths: Dict[str, array] = {}
+        self.next_slot = 0
+        self.size = 0
+
+    def record(self, at: float, depths: Dict[str, int]):
+        slot = self.next_slot
+        self.times[slot] = at
+        for task_type, series in self.depths.items():
+            series[slot] = depths.get(task_type, MISSING)
+        for task_type, depth in depths.items():
+            if task_type not in self.depths:
+                series = self.depths[task_type] = array("q", [MISSING] * self.capacity)
+                series[slot] = depth
+        self.next_slot = (slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def window(self, seconds: float) -> Tuple[List[int], float]:
+        """The slots of the samples taken in the last seconds, oldest first, and the time of the newest sample"""
+        if self.size == 0:
+            return [], 0.0
+        oldest = (self.next_slot - self.size) % self.capacity
+        slots = [(oldest + offset) % self.capacity for offset in range(self.size)]
+        latest = self.times[slots[-1]]
+        return [slot for slot in slots if self.times[slot] >= latest - seconds], latest
+
+    def trends(self, seconds: float) -> List[Dict[str, Any]]:
+        """Depth, net rate, growth slope and time to drain of every task type over the window"""
+        slots, latest = self.window(seconds)
+        trends = []
+        for task_type, series in self.depths.items():
+            points = [(self.times[slot], series[slot]) for slot in slots if series[slot] != MISSING]
+            if not points:
+                continue
+            times = [at - latest for at, _ in points]
+            depths = [depth for _, depth in points]
+            slope = linear_slope(times, depths)
+            current = depths[-1]
+            trends.append(
+                {
+                    "taskType": task_type,
+                    "depth": current,
+                    "min": min(depths),
+                    "max": max(depths),
+                    "samples": len(points),
+                    "change": current - depths[0],
+                    "growth_per_minute": round(slope * 60, 3),
+                    # only meaningful while the queue is shrinking
+                    "seconds_to_drain": round(current / -slope) if slope < 0 and current > 0 else None,
+                }
+            )
+        return trends
+
+
+class QueueSampler:
+    """Records tasks/queue/all of one cluster into a QueueHistory on a background timer"""
+
+    def __init__(self, interval: float, capacity: int, cluster: Optional[str] = None):
+        self.interval = interval
+        self.history = QueueHistory(capacity)
+        self.cluster = cluster
+        self._sampler: Optional[asyncio.Task] = None
+
+    async def sample(self):
+        # the timer task inherits the cluster of whoever started it, so the sampler selects its own
+        with clusters.use_cluster(self.cluster):
+            depths = await http_proxy.http_get_json("tasks/queue/all")
+        self.history.record(time.time(), {task_type: int(depth) for task_type, depth in depths.items()})
+
+    async def _sample_loop(self, delay: float):
+        await asyncio.sleep(delay)
+        while True:
+            try:
+                await self.sample()
+            except Exception as e:
+                logging.warning(f"Sampling task queues failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    @property
+    def running(self) -> bool:
+        return self._sampler is not None and not self._sampler.done()
+
+    def start(self, delay: float = 0):
+        """Starts sampling on a timer, taking the first sample after delay seconds"""
+        if not self.running:
+            self._sampler = asyncio.ensure_future(self._sample_loop(delay))
+
+    async def stop(self):
+        if self._sampler is not None:
+            self._sampler.cancel()
+            try:
+                await self._sampler
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            self._sampler = None
+
+
+_sampler: Optional[QueueSampler] = None
+# the samplers of the named clusters, the default cluster uses _sampler
+_cluster_samplers: Dict[str, QueueSampler] = {}
+
+
+def build_sampler(cluster: Optional[str] = None) -> QueueSampler:
+    return QueueSampler(
+        settings.get_float(CONDUCTOR_QUEUE_SAMPLE_SECONDS, DEFAULT_SAMPLE_SECONDS),
+        settings.get_int(CONDUCTOR_QUEUE_SAMPLE_CAPACITY, DEFAULT_CAPACITY),
+        cluster,
+    )
+
+
+def get_sampler() -> QueueSampler:
+    """Returns the queue sampler of the current cluster, creating it on first use"""
+    global _sampler
+    cluster = clusters.active()
+    if cluster is not None:
+        if cluster not in _cluster_samplers:
+            _cluster_samplers[cluster] = build_sampler(cluster)
+        return _cluster_samplers[cluster]
+    if _sampler is None:
+        _sampler = build_sampler()
+    return _sampler
+
+
+async def stop():
+    for sampler in [_sampler, *_cluster_samplers.values()]:
+        if sampler is not None:
+            await sampler.stop()
@@ -0,0 +1,136 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+Client side limits on the requests sent to Conductor.
+
+Every request waits for a slot in a global concurrency limit and, when configured, for a token from the bucket of its
+endpoint class. Time spent waiting is recorded per class so a limiter that is too tight shows up in the stats.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import CONDUCTOR_MAX_CONCURRENT_REQUESTS, CONDUCTOR_RATE_LIMITS
+
+ENDPOINT_CLASSES = ("search", "metadata", "execution", "writes")
+DEFAULT_MAX_CONCURRENT_REQUESTS = 32
+
+
+def classify(method: str, resource_path: str) -> str:
+    """Buckets a request into one of the ENDPOINT_CLASSES"""
+    if method.upper() != "GET":
+        return "writes"
+    path = resource_path.split("?", 1)[0]
+    if path.endswith("/search") or "/search/" in path:
+        return "search"
+    if path.startswith("metadata/"):
+        return "metadata"
+    return "execution"
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class WaitStats:
+    def __init__(self):
+        self.requests = 0
+        self.waited = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, seconds: float):
+        self.requests += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        if seconds > 0.001:
+            self.waited += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "waited": self.waited,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+
+class RequestLimiter:
+    def __init__(self, max_concurrent: int, rate_limits: Dict[str, Dict[str, float]]):
+        self.max_concurrent = max_concurrent
+        self.buckets = {
+            endpoint_class: TokenBucket(limit["rate"], limit.get("burst"))
+            for endpoint_class, limit in rate_limits.items()
+            if limit.get("rate")
+        }
+        self.wait_stats = {endpoint_class: WaitStats() for endpoint_class in ENDPOINT_CLASSES}
+        self.in_flight = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+        return self._semaphore
+
+    @asynccontextmanager
+    async def acquire(self, endpoint_class: str):
+        """Waits for the endpoint class' rate limit and a global concurrency slot"""
+        started = time.monotonic()
+        bucket = self.buckets.get(endpoint_class)
+        if bucket is not None:
+            await bucket.acquire()
+        async with self._get_semaphore():
+            self.wait_stats[endpoint_class].record(time.monotonic() - started)
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.in_flight,
+            "rate_limits": {name: {"rate": b.rate, "burst": b.capacity} for name, b in self.buckets.items()},
+            "queue_wait": {name: stats.as_dict() for name, stats in self.wait_stats.items()},
+        }
+
+
+_limiter: Optional[RequestLimiter] = None
+
+
+def get_limiter() -> RequestLimiter:
+    """Returns the process wide limiter, configured from the environment on first use"""
+    global _limiter
+    if _limiter is None:
+        _limiter = RequestLimiter(
+            max_concurrent=settings.get_int(CONDUCTOR_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+            rate_limits=settings.get_json(CONDUCTOR_RATE_LIMITS, {}),
+        )
+    return _limiter
@@ -0,0 +1,173 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+Retries with backoff and a per-host circuit breaker for requests sent to Conductor.
+
+Only requests that are safe to replay are retried: idempotent verbs, or writes carrying an idempotency key. Every
+request, retried or not, feeds the circuit breaker of its host so that an unhealthy server is failed fast instead of
+being hammered by agents retrying on their own.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional
+import httpx
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import (
+    CONDUCTOR_RETRY_MAX_ATTEMPTS,
+    CONDUCTOR_RETRY_BASE_DELAY_SECONDS,
+    CONDUCTOR_RETRY_MAX_DELAY_SECONDS,
+    CONDUCTOR_CIRCUIT_FAILURE_THRESHOLD,
+    CONDUCTOR_CIRCUIT_RESET_SECONDS,
+)
+
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY_SECONDS = 0.2
+DEFAULT_MAX_DELAY_SECONDS = 10.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_SECONDS = 30.0
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the target host's circuit is open"""
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures, then lets a single trial request through once the reset timeout passes"""
+
+    def __init__(self, host: str, failure_threshold: int, reset_seconds: float):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.reset_seconds else "open"
+
+    def before_request(self):
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        retry_in = max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+        raise CircuitOpenError(f"Conductor at {self.host} is unavailable, failing fast for another {retry_in:.0f}s")
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            if self.opened_at is None or self._trial_in_flight:
+                logging.warning(f"Opening circuit for Conductor at {self.host} after {self.failures} failures")
+            self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release_trial(self):
+        """Lets the next request be the trial again, when the trial ended without an answer from the host"""
+        self._trial_in_flight = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def breaker_for(url: str) -> CircuitBreaker:
+    parsed = httpx.URL(url)
+    host = f"{parsed.host}:{parsed.port}" if parsed.port else parsed.host
+    if host not in _breakers:
+        _breakers[host] = CircuitBreaker(
+            host,
+            failure_threshold=settings.get_int(CONDUCTOR_CIRCUIT_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+            reset_seconds=settings.get_float(CONDUCTOR_CIRCUIT_RESET_SECONDS, DEFAULT_RESET_SECONDS),
+        )
+    return _breakers[host]
+
+
+def is_replayable(method: str, headers: Dict[str, str]) -> bool:
+    """Whether a request can be sent again without risking a duplicate side effect"""
+    return method.upper() in IDEMPOTENT_METHODS or any(key.lower() == "x-idempotency-key" for key in headers)
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+async def send(url: str, replayable: bool, send_once: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+    """Sends a request through the host's circuit breaker, retrying transient failures when it is safe to
+
+    :param url: The full url of the request, used to pick the circuit breaker
+    :param replayable: Whether the request may be retried
+    :param send_once: Sends the request a single time
+    :return: The last response received
+    """
+    breaker = breaker_for(url)
+    max_attempts = settings.get_int(CONDUCTOR_RETRY_MAX_ATTEMPTS, DEFAULT_MAX_ATTEMPTS) if replayable else 1
+    base_delay = settings.get_float(CONDUCTOR_RETRY_BASE_DELAY_SECONDS, DEFAULT_BASE_DELAY_SECONDS)
+    max_delay = settings.get_float(CONDUCTOR_RETRY_MAX_DELAY_SECONDS, DEFAULT_MAX_DELAY_SECONDS)
+
+    attempt = 0
+    while True:
+        attempt += 1
+        breaker.before_request()
+        try:
+            response = await send_once()
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            if attempt >= max_attempts:
+                raise
+            delay = _backoff(attempt, base_delay, max_delay)
+            logging.info(f"Request to {url} failed with {e!r}, retrying in {delay:.2f}s")
+        except BaseException:
+            # a cancelled trial says nothing about the host, but must not leave the circuit waiting on it forever
+            breaker.release_trial()
+            raise
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if attempt >= max_attempts:
+                return response
+            retry_after = _retry_after_seconds(response)
+            if retry_after is not None and retry_after > max_delay:
+                return response
+            delay = retry_after if retry_after is not None else _backoff(attempt, base_delay, max_delay)
+            logging.info(f"Request to {url} returned {response.status_code}, retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
@@ -0,0 +1,167 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+In-memory cache for metadata GET responses.
+
+Entries live for a per-path TTL and the cache is bounded by the total size of the cached bodies. Once an entry goes
+stale it is revalidated with If-None-Match/If-Modified-Since when Conductor returned an ETag or Last-Modified header.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+import httpx
+from conductor_mcp.network import clusters
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import CONDUCTOR_CACHE_TTLS, CONDUCTOR_CACHE_MAX_BYTES
+
+# seconds, keyed by resource path prefix. The longest matching prefix wins and a TTL of 0 disables caching.
+DEFAULT_TTLS = {
+    "metadata/workflow": 60,
+    "metadata/taskdefs": 60,
+}
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    text: str
+    size: int
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Headers used to conditionally revalidate a stale entry"""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _family(resource_path: str) -> str:
+    """The resource a path belongs to, i.e. metadata/workflow for metadata/workflow/my_flow?version=2"""
+    return "/".join(resource_path.split("?", 1)[0].split("/")[:2])
+
+
+class ResponseCache:
+    def __init__(self, ttls: Dict[str, float], max_bytes: int):
+        self.ttls = ttls
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, resource_path: str) -> float:
+        matches = [prefix for prefix in self.ttls if resource_path.startswith(prefix)]
+        return self.ttls[max(matches, key=len)] if matches else 0
+
+    def lookup(self, resource_path: str) -> Optional[CacheEntry]:
+        """Returns the cached entry for the path (fresh or stale) and records a hit or miss"""
+        entry = self._entries.get(resource_path)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(resource_path)
+        if entry.is_fresh():
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def revalidated(self, resource_path: str, entry: CacheEntry):
+        """Extends a stale entry after Conductor answered a conditional request with 304 Not Modified"""
+        self.revalidations += 1
+        entry.expires_at = time.monotonic() + self.ttl_for(resource_path)
+
+    def store(self, resource_path: str, response: httpx.Response):
+        ttl = self.ttl_for(resource_path)
+        if ttl <= 0 or response.status_code != 200:
+            return
+        text = response.text
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        self._remove(resource_path)
+        self._entries[resource_path] = CacheEntry(
+            text=text,
+            size=size,
+            expires_at=time.monotonic() + ttl,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, resource_path: str):
+        """Drops every entry belonging to the same resource as a path that was just written to"""
+        family = _family(resource_path)
+        for key in [key for key in self._entries if _family(key) == family]:
+            self._remove(key)
+            self.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, resource_path: str):
+        entry = self._entries.pop(resource_path, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_cache: Optional[ResponseCache] = None
+# the caches of the named clusters, the default cluster uses _cache
+_cluster_caches: Dict[str, ResponseCache] = {}
+
+
+def build_cache() -> ResponseCache:
+    return ResponseCache(
+        ttls={**DEFAULT_TTLS, **settings.get_json(CONDUCTOR_CACHE_TTLS, {})},
+        max_bytes=settings.get_int(CONDUCTOR_CACHE_MAX_BYTES, DEFAULT_MAX_BYTES),
+    )
+
+
+def get_cache() -> ResponseCache:
+    """Returns the cache of the current cluster, configured from the environment on first use"""
+    global _cache
+    cluster = clusters.active()
+    if cluster is not None:
+        if cluster not in _cluster_caches:
+            _cluster_caches[cluster] = build_cache()
+        return _cluster_caches[cluster]
+    if _cache is None:
+        _cache = build_cache()
+    return _cache
@@ -0,0 +1,105 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+Paged access to Conductor's workflow/search endpoint.
+
+Pages are fetched lazily, so a caller that stops iterating early never downloads the rest of the result set. Callers
+that stop because of a result or size cap hand the client an opaque cursor to continue from.
+"""
+
+import base64
+import json
+from dataclasses import dataclass, asdict, replace
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from conductor_mcp.network import http_proxy
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import CONDUCTOR_SEARCH_MAX_RESULTS, CONDUCTOR_SEARCH_MAX_BYTES
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_RESULTS = 1000
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+
+@dataclass
+class SearchRequest:
+    query: str = ""
+    free_text: str = "*"
+    sort: Optional[str] = None
+    start: int = 0
+
+    def to_cursor(self) -> str:
+        return base64.urlsafe_b64encode(json.dumps(asdict(self)).encode("utf-8")).decode("ascii")
+
+    @classmethod
+    def from_cursor(cls, cursor: str) -> "SearchRequest":
+        try:
+            return cls(**json.loads(base64.urlsafe_b64decode(cursor.encode("ascii"))))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid search cursor: {cursor}") from e
+
+
+async def iter_search_pages(
+    request: SearchRequest, limit: int, page_size: int = DEFAULT_PAGE_SIZE
+) -> AsyncIterator[Tuple[int, int, List[Dict[str, Any]]]]:
+    """Lazily fetches pages of workflow search results
+
+    :param request: The search to run
+    :param limit: The maximum number of results to fetch across all pages
+    :param page_size: The number of results requested per page
+    :return: An async iterator of (start offset, total hits, results) per page
+    """
+    start = request.start
+    fetched = 0
+    while fetched < limit:
+        size = min(page_size, limit - fetched)
+        params = {"start": start, "size": size, "freeText": request.free_text, "query": request.query}
+        if request.sort:
+            params["sort"] = request.sort
+        # an oversized page is parsed from its blob, rather than replaced by the blob summary http_get returns
+        page = await http_proxy.http_get_json(f"workflow/search?{urlencode(params)}")
+        results = page.get("results") or []
+        total_hits = page.get("totalHits", 0)
+        yield start, total_hits, results
+        start += len(results)
+        fetched += len(results)
+        if len(results) < size or start >= total_hits:
+            return
+
+
+async def search(request: SearchRequest, max_results: int, page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+    """Collects search results up to the server side result and byte caps
+
+    :param request: The search to run
+    :param max_results: The number of results the caller asked for, clamped to CONDUCTOR_SEARCH_MAX_RESULTS
+    :param page_size: The number of results requested per page
+    :return: A dict with totalHits, results and a nextCursor that is None once every hit has been returned
+    """
+    max_results = min(max_results, settings.get_int(CONDUCTOR_SEARCH_MAX_RESULTS, DEFAULT_MAX_RESULTS))
+    max_bytes = settings.get_int(CONDUCTOR_SEARCH_MAX_BYTES, DEFAULT_MAX_BYTES)
+    results = []
+    used_bytes = 0
+    total_hits = 0
+    position = request.start
+    async for _, total_hits, page in iter_search_pages(request, max_results, page_size):
+        for result in page:
+            size = len(json.dumps(result))
+            # always return at least one result so a single oversized execution cannot stall paging
+            if results and used_bytes + size > max_bytes:
+                break
+            results.append(result)
+            used_bytes += size
+            position += 1
+        else:
+            continue
+        break
+
+    next_cursor = replace(request, start=position).to_cursor() if position < total_hits else None
+    return {"totalHits": total_hits, "results": results, "nextCursor": next_cursor}
@@ -7,37 +7,197 @@
 #  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 #  specific language governing permissions and limitations under the License.
 
-from datetime import datetime, timedelta
-import httpx
+import asyncio
+import base64
+import binascii
+import json
 import logging
 import os
-import json
-from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL, CONDUCTOR_AUTH_KEY, CONDUCTOR_AUTH_SECRET
+import time
+from datetime import timedelta
+from typing import Dict, Optional
+from conductor_mcp.network import clusters, http_client
+from conductor_mcp.utils import metrics, tracing
 
 
-_last_token_retrieval = datetime(1, 1, 1)
+# used when the token does not carry a readable exp claim
 TOKEN_LIFE_DURATION = timedelta(hours=2)
+# refresh this long before expiry (capped at a fifth of the token's lifetime for short lived tokens)
+REFRESH_MARGIN = timedelta(minutes=5)
+# delay between background attempts after a failed refresh
+REFRESH_RETRY_DELAY = timedelta(seconds=15)
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """Reads the exp claim from a JWT without verifying it
+
+    :param token: The JWT returned by Conductor
+    :return: The expiry as a unix timestamp, or None when the token has no readable exp claim
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
+class TokenProvider:
+    """Caches a Conductor JWT and refreshes it ahead of expiry.
+
+    Concurrent callers share a single in-flight refresh, and a failed refresh leaves the cached token untouched.
+    """
+
+    def __init__(self, cluster: Optional[str] = None):
+        self.cluster = cluster
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self.refresh_count = 0
+
+    def _is_valid(self, now: float) -> bool:
+        return self._token is not None and now < self._expires_at
+
+    async def get_token(self) -> str:
+        """Returns a valid token, only waiting on Conductor when no valid token is cached"""
+        now = time.time()
+        if self._is_valid(now):
+            if now >= self._refresh_at:
+                self._refresh_in_background()
+            return self._token
+        return await self._refresh()
+
+    async def force_refresh(self, stale_token: Optional[str] = None) -> str:
+        """Replaces a token that Conductor rejected
+
+        :param stale_token: The token that was rejected. If another caller already replaced it, the newer token is
+            returned without another call to Conductor.
+        :return: A freshly retrieved token
+        """
+        if stale_token is not None and self._token is not None and self._token != stale_token:
+            return self._token
+        self._expires_at = 0.0
+        return await self._refresh()
+
+    def _start_refresh(self) -> asyncio.Task:
+        task = self._inflight
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._inflight = asyncio.ensure_future(self._fetch())
+            task.add_done_callback(_log_refresh_failure)
+        return task
+
+    async def _refresh(self) -> str:
+        return await asyncio.shield(self._start_refresh())
+
+    def _refresh_in_background(self):
+        self._start_refresh()
+
+    async def _fetch(self) -> str:
+        logging.info(f"Refreshing token for cluster {self.cluster or clusters.DEFAULT_CLUSTER}")
+        # the refresh may run in a task started by a caller of another cluster, so it selects its own
+        with clusters.use_cluster(self.cluster) as cluster:
+            client = http_client.get_client()
+        token_url = os.path.join(cluster.server_url, "token")
+        headers = {"Accept": "application/json", "Content-Type": "application/json"}
+        with tracing.span("token refresh", kind="client", **{"conductor.cluster": cluster.name}) as span:
+            tracing.inject(headers)
+            try:
+                response = await client.post(
+                    token_url,
+                    headers=headers,
+                    content=json.dumps({"keyId": cluster.auth_key, "keySecret": cluster.auth_secret}),
+                )
+                tracing.set_attributes(span, **{"http.response.status_code": response.status_code})
+                response.raise_for_status()
+                token = response.json()["token"]
+            except Exception:
+                metrics.TOKEN_REFRESHES.inc(outcome="error")
+                raise
+        metrics.TOKEN_REFRESHES.inc(outcome="ok")
 
-_token = "UNASSIGNED"
+        now = time.time()
+        expires_at = _jwt_expiry(token) or now + TOKEN_LIFE_DURATION.total_seconds()
+        margin = min(REFRESH_MARGIN.total_seconds(), (expires_at - now) / 5)
+        self._token = token
+        self._expires_at = expires_at
+        self._refresh_at = expires_at - margin
+        self.refresh_count += 1
+        return token
+
+    async def _refresh_loop(self):
+        while True:
+            delay = self._refresh_at - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self._refresh()
+            except Exception:
+                await asyncio.sleep(REFRESH_RETRY_DELAY.total_seconds())
+
+    def start(self):
+        """Starts refreshing the token on a timer so requests never wait on the token endpoint"""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.ensure_future(self._refresh_loop())
+
+    async def stop(self):
+        """Stops the background refresh timer"""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+
+
+def _log_refresh_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logging.warning(f"Token refresh failed: {task.exception()}")
+
+
+_provider = TokenProvider()
+# the providers of the named clusters, the default cluster uses _provider
+_cluster_providers: Dict[str, TokenProvider] = {}
+
+
+def get_provider(cluster: Optional[str] = None) -> TokenProvider:
+    """Returns the token provider of a cluster
+
+    :param cluster: The named cluster, the default cluster when None
+    :return: The provider, created on first use
+    """
+    if cluster is None:
+        return _provider
+    if cluster not in _cluster_providers:
+        _cluster_providers[cluster] = TokenProvider(cluster)
+    return _cluster_providers[cluster]
 
 
 async def get_token():
     """Retrieves and refreshes a JWT token required for making HTTP requests to Conductor
 
-    :return: JWT token based on auth key and secret pulled from the environment
+    :return: JWT token for the current cluster, based on its auth key and secret
+    """
+    return await get_provider(clusters.active()).get_token()
+
+
+async def force_refresh(stale_token: Optional[str] = None):
+    """Forces a new token to be retrieved, used when Conductor rejects the current one with a 401
+
+    :param stale_token: The token that was rejected
+    :return: A freshly retrieved JWT token
     """
-    current_time = datetime.now()
-    global _last_token_retrieval
-    time_since_last_retrieval = current_time - _last_token_retrieval
-    if time_since_last_retrieval > TOKEN_LIFE_DURATION:
-        logging.info("Refreshing token")
-        _last_token_retrieval = datetime.now()
-        token_url = os.path.join(os.environ[CONDUCTOR_SERVER_URL], "token")
-        response = httpx.post(
-            token_url,
-            headers={"Accept": "application/json", "Content-Type": "application/json"},
-            data=json.dumps({"keyId": os.environ[CONDUCTOR_AUTH_KEY], "keySecret": os.environ[CONDUCTOR_AUTH_SECRET]}),
-        )
-        global _token
-        _token = response.json()["token"]
-    return _token
+    return await get_provider(clusters.active()).force_refresh(stale_token)
+
+
+def start_background_refresh():
+    _provider.start()
+    for name in clusters.names()[1:]:
+        get_provider(name).start()
+
+
+async def stop_background_refresh():
+    for provider in [_provider, *_cluster_providers.values()]:
+        await provider.stop()
@@ -29,9 +29,9 @@ def troubleshoot_workflow(workflow_id: str) -> str:
         workflow_id: The workflow execution ID to troubleshoot
     """
     return f"""I need help troubleshooting workflow {workflow_id}. Please:
-1. Get the current status of the workflow using get_workflow_by_id
+1. Get the current status of the workflow using get_workflow_by_id with failed_tasks_only=True and summarize_payloads=True
 2. Identify any failed tasks and their error messages
-3. Check the task logs for detailed errors using get_task_logs
+3. Check the task logs of all failed tasks at once using get_task_logs_by_ids
 4. Analyze the workflow definition to understand the expected flow
 5. Suggest possible solutions based on the error messages
 6. Recommend next steps to resolve the issue
@@ -48,18 +48,19 @@ def analyze_failures(workflow_name: Optional[str] = None, hours: int = 24) -> st
         hours: Number of hours to look back (default: 24)
     """
     filter_text = f' for workflow type "{workflow_name}"' if workflow_name else ""
+    cluster_args = f"hours={hours}" + (f', workflow_name="{workflow_name}"' if workflow_name else "")
     return f"""Analyze all failed workflows in the last {hours} hours{filter_text}.
 
 Please:
-1. Use query_workflow_executions to find failed workflows with query: status="FAILED"
-2. For each failed workflow, examine the failed tasks and error messages
-3. Identify common error patterns and group failures by root cause
-4. Determine the most frequently failing tasks
+1. Use cluster_failures with {cluster_args} to group the failures by normalized error message
+2. For the largest clusters, fetch their sample ids together using get_workflows_by_ids with failed_tasks_only=True, and examine the failed tasks and error messages
+3. Map each cluster to a root cause, merging clusters that share one
+4. Determine the most frequently failing tasks from the clusters' failed_tasks counts
 5. Analyze potential root causes (configuration issues, external dependencies, timeouts, etc.)
 6. Provide recommendations to prevent future failures
 7. Prioritize fixes based on failure frequency and impact
 
-Start by querying for failed workflows."""
+Start by clustering the failed workflows."""
 
 
 @prompt_mcp.prompt()
@@ -107,7 +108,7 @@ Steps:
 4. Show pending tasks that are yet to execute
 5. Check for any warnings or potential issues (slow tasks, retries, etc.)
 6. If the workflow is stuck, investigate possible causes
-7. Estimate time to completion based on task durations (if possible)
+7. Estimate time to completion using get_task_duration_stats for the workflow's type, comparing the remaining tasks against their historical p50/p95 durations
 
 Provide a clear summary of the workflow's health and progress."""
 
@@ -128,8 +129,8 @@ Please:
    - Unnecessary sequential dependencies
    - Tasks with excessive timeouts
    - Opportunities for batching similar operations
-3. Check recent executions for performance patterns using query_workflow_executions
-4. Identify bottleneck tasks that take the longest
+3. Check recent executions for performance patterns using get_task_duration_stats
+4. Identify bottleneck tasks from the duration, queue wait, retry and failure rate columns
 5. Suggest specific changes to improve workflow efficiency
 6. Provide before/after estimates if applicable
 
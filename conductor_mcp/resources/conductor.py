@@ -14,12 +14,20 @@ Resources provide read-only access to Conductor data, allowing LLMs to query
 workflow definitions, task definitions, and workflow execution states.
 """
 
+import asyncio
+import json
 from fastmcp import FastMCP
+from conductor_mcp.network import blobs, coalescing, rate_limiter, response_cache, search
+from conductor_mcp.resources import subscriptions
+from conductor_mcp.network.search import SearchRequest, DEFAULT_PAGE_SIZE
 from conductor_mcp.network.http_proxy import http_get
+from conductor_mcp.utils import metrics
 
 
 resource_mcp = FastMCP("Conductor Resources")
 
+BLOB_PAGE_BYTES = blobs.MAX_PAGE_BYTES
+
 
 @resource_mcp.resource("conductor://workflows/definitions")
 async def get_workflow_definitions() -> str:
@@ -49,9 +57,10 @@ async def get_running_workflows() -> str:
 
     Returns workflow executions that are currently in RUNNING status,
     including workflow IDs, names, start times, and current progress.
+    Only the first page is returned; pass nextCursor to query_workflow_executions for the rest.
     """
-    path = "workflow/search?query=status%3D%22RUNNING%22"
-    return await http_get(path)
+    request = SearchRequest(query='status="RUNNING"')
+    return json.dumps(await search.search(request, DEFAULT_PAGE_SIZE))
 
 
 @resource_mcp.resource("conductor://workflows/failed")
@@ -60,9 +69,10 @@ async def get_failed_workflows() -> str:
 
     Returns workflow executions that have failed, including workflow IDs,
     names, failure reasons, and failed task information.
+    Only the first page is returned; pass nextCursor to query_workflow_executions for the rest.
     """
-    path = "workflow/search?query=status%3D%22FAILED%22"
-    return await http_get(path)
+    request = SearchRequest(query='status="FAILED"')
+    return json.dumps(await search.search(request, DEFAULT_PAGE_SIZE))
 
 
 @resource_mcp.resource("conductor://workflows/paused")
@@ -71,9 +81,10 @@ async def get_paused_workflows() -> str:
 
     Returns workflow executions that are currently in PAUSED status,
     including workflow IDs, names, and pause timestamps.
+    Only the first page is returned; pass nextCursor to query_workflow_executions for the rest.
     """
-    path = "workflow/search?query=status%3D%22PAUSED%22"
-    return await http_get(path)
+    request = SearchRequest(query='status="PAUSED"')
+    return json.dumps(await search.search(request, DEFAULT_PAGE_SIZE))
 
 
 @resource_mcp.resource("conductor://tasks/queue")
@@ -85,3 +96,62 @@ async def get_task_queue_status() -> str:
     """
     path = "tasks/queue/all"
     return await http_get(path)
+
+
+@resource_mcp.resource("conductor://changes/{kind}/{name}/{since}")
+async def get_changes(kind: str, name: str, since: str) -> str:
+    """Changes to a running/failed/paused workflows or task queue resource since a version.
+
+    Use conductor://changes/workflows/running/0 for the current snapshot and its version, then pass the returned
+    version back to receive only the entries that were added or changed ("upserted", keyed by workflowId or queue
+    name) and the keys that were removed. Clients that subscribed to the resource are notified when it changes.
+    When the requested version is too old, the whole snapshot is returned with "reset": true. Workflow snapshots hold
+    at most the newest CONDUCTOR_SUBSCRIPTION_MAX_WORKFLOWS executions and carry "truncated": true when there are more.
+    """
+    return json.dumps(await subscriptions.get_hub().delta(f"{kind}/{name}", int(since)))
+
+
+@resource_mcp.resource("conductor://server/subscriptions")
+async def get_subscription_stats() -> str:
+    """Resource subscriptions, the current version of each polled resource and the number of polls and notifications."""
+    return json.dumps(subscriptions.get_hub().stats())
+
+
+@resource_mcp.resource("conductor://blobs/{blob_id}")
+async def get_blob(blob_id: str) -> str:
+    """The first page of a response that was too large to return directly.
+
+    Read further pages with conductor://blobs/{blob_id}/{offset}/{length}, or extract parts of it with the
+    read_blob tool and a JSONPath expression.
+    """
+    return json.dumps(await asyncio.to_thread(blobs.get_store().read, blob_id, 0, BLOB_PAGE_BYTES))
+
+
+@resource_mcp.resource("conductor://blobs/{blob_id}/{offset}/{length}")
+async def get_blob_range(blob_id: str, offset: str, length: str) -> str:
+    """A byte range of a response that was too large to return directly, with the offset of the next page."""
+    return json.dumps(await asyncio.to_thread(blobs.get_store().read, blob_id, int(offset), int(length)))
+
+
+@resource_mcp.resource("conductor://server/cache")
+async def get_cache_stats() -> str:
+    """Hit, miss and size counters for the server's metadata response cache, and the spilled response blobs."""
+    return json.dumps({**response_cache.get_cache().stats(), "blobs": blobs.get_store().stats()})
+
+
+@resource_mcp.resource("conductor://server/limits")
+async def get_limiter_stats() -> str:
+    """Concurrency and rate limit settings for requests to Conductor, with the time requests spent queued for them.
+
+    "coalescing" counts the GET requests that were served by an identical request already in flight.
+    """
+    return json.dumps({**rate_limiter.get_limiter().stats(), "coalescing": coalescing.get_coalescer().stats()})
+
+
+@resource_mcp.resource("conductor://server/metrics", mime_type="text/plain")
+async def get_server_metrics() -> str:
+    """Tool/resource latency, upstream Conductor latency and response sizes, and token refresh counts.
+
+    Rendered in the Prometheus/OpenMetrics text format.
+    """
+    return metrics.render()
@@ -0,0 +1,238 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+MCP resource subscriptions for the workflow and task queue snapshot resources.
+
+A single background poller fetches each subscribed snapshot once per interval, however many clients subscribed to it,
+diffs it against the previous snapshot and sends resources/updated notifications only when something changed. The
+changes are kept as numbered deltas that clients can read back through conductor://changes/{kind}/{name}/{since}.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from pydantic import AnyUrl
+from conductor_mcp.network import http_proxy, search
+from conductor_mcp.network.search import SearchRequest
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import CONDUCTOR_SUBSCRIPTION_MAX_WORKFLOWS, CONDUCTOR_SUBSCRIPTION_POLL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_SECONDS = 10.0
+DEFAULT_MAX_WORKFLOWS = 1000
+DELTA_HISTORY = 50
+WORKFLOW_FIELDS = ("workflowType", "version", "status", "startTime", "updateTime", "reasonForIncompletion")
+
+
+async def _workflow_snapshot(status: str) -> Tuple[Dict[str, Any], bool]:
+    # newest first, so that a snapshot capped at CONDUCTOR_SUBSCRIPTION_MAX_WORKFLOWS only changes when executions do
+    request = SearchRequest(query=f'status="{status}"', sort="startTime:DESC")
+    page = await search.search(request, settings.get_int(CONDUCTOR_SUBSCRIPTION_MAX_WORKFLOWS, DEFAULT_MAX_WORKFLOWS))
+    snapshot = {
+        result["workflowId"]: {key: result[key] for key in WORKFLOW_FIELDS if result.get(key) is not None}
+        for result in page["results"]
+    }
+    return snapshot, page["nextCursor"] is not None
+
+
+async def _queue_snapshot() -> Tuple[Dict[str, Any], bool]:
+    return await http_proxy.http_get_json("tasks/queue/all"), False
+
+
+# snapshot sources by resource path, each keyed by workflowId or task queue name. Each returns the snapshot and
+# whether it was truncated, i.e. only holds the newest matching executions.
+SOURCES: Dict[str, Callable[[], Awaitable[Tuple[Dict[str, Any], bool]]]] = {
+    "workflows/running": lambda: _workflow_snapshot("RUNNING"),
+    "workflows/failed": lambda: _workflow_snapshot("FAILED"),
+    "workflows/paused": lambda: _workflow_snapshot("PAUSED"),
+    "tasks/queue": _queue_snapshot,
+}
+
+
+def source_for(uri: str) -> str:
+    """Maps a resource uri, with or without its mount prefix, to its snapshot source"""
+    path = uri.split("://", 1)[-1]
+    for candidate in (path, path.split("/", 1)[-1]):
+        if candidate in SOURCES:
+            return candidate
+    raise ValueError(f"Resource {uri} does not support subscriptions")
+
+
+class SubscriptionHub:
+    """Tracks subscribed sessions per resource uri and polls their snapshots on one shared timer"""
+
+    def __init__(self, poll_seconds: float):
+        self.poll_seconds = poll_seconds
+        self.subscribers: Dict[str, Set[Any]] = {}
+        self.snapshots: Dict[str, Dict[str, Any]] = {}
+        self.versions: Dict[str, int] = {}
+        self.truncated: Dict[str, bool] = {}
+        self.history: Dict[str, Deque[Tuple[int, Dict[str, Any], List[str]]]] = {}
+        self.polled_at: Dict[str, float] = {}
+        self.polls = 0
+        self.notifications = 0
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, uri: str, session: Any):
+        source_for(uri)
+        self.subscribers.setdefault(uri, set()).add(session)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._poll_loop())
+
+    def unsubscribe(self, uri: str, session: Any):
+        sessions = self.subscribers.get(uri, set())
+        sessions.discard(session)
+        if not sessions:
+            self.subscribers.pop(uri, None)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            self._task = None
+
+    async def _poll_loop(self):
+        while self.subscribers:
+            await self.poll_once()
+            await asyncio.sleep(self.poll_seconds)
+
+    async def poll_once(self):
+        """Refreshes every subscribed source once and notifies the subscribers of the ones that changed"""
+        changed = set()
+        for source in {source_for(uri) for uri in self.subscribers}:
+            try:
+                if await self.refresh(source):
+                    changed.add(source)
+            except Exception as e:
+                logger.warning(f"Polling {source} for subscribers failed: {e}")
+
+        for uri, sessions in list(self.subscribers.items()):
+            if source_for(uri) not in changed:
+                continue
+            for session in list(sessions):
+                try:
+                    await session.send_resource_updated(AnyUrl(uri))
+                    self.notifications += 1
+                except Exception:
+                    # the client went away without unsubscribing
+                    self.unsubscribe(uri, session)
+
+    async def refresh(self, source: str) -> bool:
+        """Fetches a new snapshot of a source, recording a delta when it changed
+
+        :return: True when the snapshot changed since the previous poll
+        """
+        requested = time.monotonic()
+        async with self._locks.setdefault(source, asyncio.Lock()):
+            # another caller polled while this one waited, its snapshot is fresh enough
+            if self.polled_at.get(source, 0) >= requested:
+                return False
+            current, self.truncated[source] = await SOURCES[source]()
+            self.polls += 1
+            self.polled_at[source] = time.monotonic()
+            previous = self.snapshots.get(source)
+            self.snapshots[source] = current
+            if previous is None:
+                self.versions[source] = 1
+                self.history[source] = deque(maxlen=DELTA_HISTORY)
+                return False
+
+            upserted = {key: value for key, value in current.items() if previous.get(key) != value}
+            removed = [key for key in previous if key not in current]
+            if not upserted and not removed:
+                return False
+            self.versions[source] += 1
+            self.history[source].append((self.versions[source], upserted, removed))
+            return True
+
+    async def delta(self, source: str, since: int) -> Dict[str, Any]:
+        """The changes to a source after the given version, or the whole snapshot when they are no longer known"""
+        if source not in SOURCES:
+            raise ValueError(f"Unknown subscription source {source}")
+        if time.monotonic() - self.polled_at.get(source, float("-inf")) >= self.poll_seconds:
+            await self.refresh(source)
+
+        version = self.versions[source]
+        history = self.history[source]
+        oldest = history[0][0] if history else version + 1
+        header = {"source": source, "version": version, "truncated": self.truncated[source]}
+        if since == version:
+            return {**header, "upserted": {}, "removed": []}
+        if since > version or since < oldest - 1:
+            return {**header, "reset": True, "snapshot": self.snapshots[source]}
+
+        upserted: Dict[str, Any] = {}
+        removed: Set[str] = set()
+        for delta_version, delta_upserted, delta_removed in history:
+            if delta_version <= since:
+                continue
+            for key, value in delta_upserted.items():
+                removed.discard(key)
+                upserted[key] = value
+            for key in delta_removed:
+                upserted.pop(key, None)
+                removed.add(key)
+        return {**header, "upserted": upserted, "removed": sorted(removed)}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "poll_seconds": self.poll_seconds,
+            "subscriptions": {uri: len(sessions) for uri, sessions in self.subscribers.items()},
+            "versions": dict(self.versions),
+            "polls": self.polls,
+            "notifications": self.notifications,
+        }
+
+
+_hub: Optional[SubscriptionHub] = None
+
+
+def get_hub() -> SubscriptionHub:
+    """Returns the process wide subscription hub, creating it on first use"""
+    global _hub
+    if _hub is None:
+        _hub = SubscriptionHub(settings.get_float(CONDUCTOR_SUBSCRIPTION_POLL_SECONDS, DEFAULT_POLL_SECONDS))
+    return _hub
+
+
+async def stop():
+    if _hub is not None:
+        await _hub.stop()
+
+
+def register(server):
+    """Adds the subscribe/unsubscribe handlers to a FastMCP server and advertises them in its capabilities"""
+    low_level = server._mcp_server
+
+    @low_level.subscribe_resource()
+    async def subscribe(uri: AnyUrl):
+        get_hub().subscribe(str(uri), low_level.request_context.session)
+
+    @low_level.unsubscribe_resource()
+    async def unsubscribe(uri: AnyUrl):
+        get_hub().unsubscribe(str(uri), low_level.request_context.session)
+
+    # the low level server always reports subscribe=False, even with the handlers registered
+    get_capabilities = low_level.get_capabilities
+
+    def get_capabilities_with_subscribe(*args, **kwargs):
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    low_level.get_capabilities = get_capabilities_with_subscribe
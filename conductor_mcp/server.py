@@ -6,28 +6,149 @@
 #  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
 #  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 #  specific language governing permissions and limitations under the License.
+import importlib
 import json
+import logging
 import os
+import time
+from contextlib import asynccontextmanager
 
-from fastmcp import FastMCP
-from pygments.lexer import default
+import click
 
 from conductor_mcp import local_development
-from conductor_mcp.tools.task import task_mcp
-from conductor_mcp.tools.workflow import workflow_mcp
-from conductor_mcp.tools.event import event_mcp
-from conductor_mcp.resources.conductor import resource_mcp
-from conductor_mcp.prompts.conductor import prompt_mcp
-import click
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import (
+    CONDUCTOR_SERVER_URL,
+    CONDUCTOR_AUTH_KEY,
+    CONDUCTOR_AUTH_SECRET,
+    CONDUCTOR_METRICS_FILE,
+    CONDUCTOR_LOG_LEVEL,
+    CONDUCTOR_QUEUE_SAMPLER,
+    CONDUCTOR_METADATA_SYNC_ON_START,
+)
+
+# (mount prefix, module, attribute) of every sub-server, imported only when the server is first built
+SUB_SERVERS = (
+    ("workflow", "conductor_mcp.tools.workflow", "workflow_mcp"),
+    ("task", "conductor_mcp.tools.task", "task_mcp"),
+    ("event", "conductor_mcp.tools.event", "event_mcp"),
+    ("analytics", "conductor_mcp.tools.analytics", "analytics_mcp"),
+    ("metadata", "conductor_mcp.tools.metadata", "metadata_mcp"),
+    ("blob", "conductor_mcp.tools.blob", "blob_mcp"),
+    ("resource", "conductor_mcp.resources.conductor", "resource_mcp"),
+    ("prompt", "conductor_mcp.prompts.conductor", "prompt_mcp"),
+)
+
+_mcp = None
+
+
+@asynccontextmanager
+async def lifespan(server):
+    from conductor_mcp.network import blobs, http_client, metadata_index, queue_sampler, token_manager
+    from conductor_mcp.resources import subscriptions
+    from conductor_mcp.utils import encoding, metrics, tracing
+
+    tracing.configure()
+    # fails startup on a bad CONDUCTOR_RESPONSE_ENCODING rather than every tool call
+    encoding.configured_encoding()
+    # one pooled client per server process, shared by every tool call
+    await http_client.open_client()
+    token_manager.start_background_refresh()
+    if settings.get_bool(CONDUCTOR_QUEUE_SAMPLER, False):
+        queue_sampler.get_sampler().start()
+    if settings.get_bool(CONDUCTOR_METADATA_SYNC_ON_START, False):
+        # not awaited, the server answers requests while the index syncs
+        metadata_index.get_index().start_sync()
+    try:
+        yield
+    finally:
+        await subscriptions.stop()
+        await queue_sampler.stop()
+        await token_manager.stop_background_refresh()
+        await http_client.close_client()
+        blobs.close()
+        tracing.shutdown()
+        metrics_file = settings.get_str(CONDUCTOR_METRICS_FILE)
+        if metrics_file is not None:
+            with open(metrics_file, "w") as file:
+                file.write(metrics.render())
+
+
+async def metrics_endpoint(request):
+    # only reachable with the http/sse transports
+    from starlette.responses import PlainTextResponse
+    from conductor_mcp.utils import metrics
+
+    return PlainTextResponse(metrics.render(), media_type="application/openmetrics-text; version=1.0.0; charset=utf-8")
+
+
+def create_server(import_timings: dict = None):
+    """Builds the FastMCP server and mounts every sub-server
+
+    :param import_timings: Optional dict that is filled with the seconds spent importing each module
+    :return: The root FastMCP server
+    """
+
+    def timed_import(module: str):
+        started = time.perf_counter()
+        imported = importlib.import_module(module)
+        if import_timings is not None:
+            import_timings[module] = time.perf_counter() - started
+        return imported
+
+    FastMCP = timed_import("fastmcp").FastMCP
+    metrics = timed_import("conductor_mcp.utils.metrics")
+    server = FastMCP("oss-conductor", lifespan=lifespan)
+    for prefix, module, attribute in SUB_SERVERS:
+        server.mount(prefix, getattr(timed_import(module), attribute))
+    timed_import("conductor_mcp.resources.subscriptions").register(server)
+    # outermost, so that the span of a call covers the time spent in every other middleware
+    server.add_middleware(timed_import("conductor_mcp.utils.tracing").TracingMiddleware())
+    server.add_middleware(metrics.MetricsMiddleware())
+    server.add_middleware(timed_import("conductor_mcp.network.clusters").ClusterMiddleware())
+    server.add_middleware(timed_import("conductor_mcp.utils.encoding").EncodingMiddleware())
+    server.custom_route("/metrics", methods=["GET"])(metrics_endpoint)
+    return server
 
-from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL, CONDUCTOR_AUTH_KEY, CONDUCTOR_AUTH_SECRET
 
-mcp = FastMCP("oss-conductor")
-mcp.mount("workflow", workflow_mcp)
-mcp.mount("task", task_mcp)
-mcp.mount("event", event_mcp)
-mcp.mount("resource", resource_mcp)
-mcp.mount("prompt", prompt_mcp)
+def get_server():
+    """Returns the process wide server, building it on first use"""
+    global _mcp
+    if _mcp is None:
+        _mcp = create_server()
+    return _mcp
+
+
+def __getattr__(name: str):
+    # `mcp` is built lazily so that --help and usage errors never pay for importing fastmcp and the tools
+    if name == "mcp":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def profile_startup() -> dict:
+    """Measures import time per module, server construction and the time to the first tool listing"""
+    import asyncio
+
+    started = time.perf_counter()
+    import_timings = {}
+    server = create_server(import_timings)
+    created = time.perf_counter()
+
+    async def list_everything():
+        return await server.get_tools(), await server.get_resources(), await server.get_prompts()
+
+    tools, resources, prompts = asyncio.run(list_everything())
+    listed = time.perf_counter()
+    return {
+        "imports_ms": {module: round(seconds * 1000, 1) for module, seconds in import_timings.items()},
+        "create_server_ms": round((created - started) * 1000, 1),
+        "first_listing_ms": round((listed - created) * 1000, 1),
+        "total_ms": round((listed - started) * 1000, 1),
+        "tools": len(tools),
+        "resources": len(resources),
+        "prompts": len(prompts),
+    }
 
 
 @click.command()
@@ -48,9 +169,44 @@ mcp.mount("prompt", prompt_mcp)
     "CONDUCTOR_AUTH_KEY": "<YOUR_AUTH_KEY>",
     "CONDUCTOR_AUTH_SECRET": "<YOUR_AUTH_SECRET>"
 }
+Any other optional CONDUCTOR_* tuning values (e.g. CONDUCTOR_HTTP_MAX_CONNECTIONS) may be included as well, including
+named clusters in CONDUCTOR_CLUSTERS: {"eu": {"CONDUCTOR_SERVER_URL": "...", "CONDUCTOR_AUTH_KEY": "...", ...}}
 """,
 )
-def run(local_dev, config):
+@click.option(
+    "--transport",
+    "-t",
+    type=click.Choice(["stdio", "http", "sse"]),
+    default="stdio",
+    show_default=True,
+    help="stdio serves a single client over stdin/stdout. http (streamable HTTP) and sse let one long lived server "
+    "process serve many MCP clients at once, sharing its token, caches and connection pool.",
+)
+@click.option("--host", default="127.0.0.1", show_default=True, help="Interface to bind to for http/sse.")
+@click.option("--port", "-p", default=8000, show_default=True, help="Port to listen on for http/sse.")
+@click.option(
+    "--max_sessions",
+    default=100,
+    show_default=True,
+    help="Maximum concurrent client connections for http/sse, further connections are answered with 503.",
+)
+@click.option(
+    "--shutdown_timeout",
+    default=30,
+    show_default=True,
+    help="Seconds to let in-flight requests finish on shutdown for http/sse.",
+)
+@click.option(
+    "--profile_startup",
+    "--profile-startup",
+    "profile",
+    is_flag=True,
+    help="Print a JSON report of import times and the time to the first tool listing, then exit.",
+)
+def run(local_dev, config, transport, host, port, max_sessions, shutdown_timeout, profile):
+    if profile:
+        click.echo(json.dumps(profile_startup(), indent=2))
+        return
     if local_dev and config is not None:
         raise click.UsageError("--local_dev and --config are mutually exclusive, please use just one.")
     elif local_dev:
@@ -62,8 +218,25 @@ def run(local_dev, config):
             os.environ[CONDUCTOR_SERVER_URL] = data[CONDUCTOR_SERVER_URL]
             os.environ[CONDUCTOR_AUTH_KEY] = data[CONDUCTOR_AUTH_KEY]
             os.environ[CONDUCTOR_AUTH_SECRET] = data[CONDUCTOR_AUTH_SECRET]
+            for key, value in data.items():
+                if key.startswith("CONDUCTOR_"):
+                    os.environ[key] = value if isinstance(value, str) else json.dumps(value)
+    logging.basicConfig(
+        format="%(levelname)s [%(asctime)s] %(name)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        level=settings.get_str(CONDUCTOR_LOG_LEVEL, "INFO").upper(),
+    )
     # Initialize and run the server
-    mcp.run(transport="stdio")
+    mcp = get_server()
+    if transport == "stdio":
+        mcp.run(transport="stdio")
+    else:
+        mcp.run(
+            transport=transport,
+            host=host,
+            port=port,
+            uvicorn_config={"limit_concurrency": max_sessions, "timeout_graceful_shutdown": shutdown_timeout},
+        )
 
 
 if __name__ == "__main__":
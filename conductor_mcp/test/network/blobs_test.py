@@ -0,0 +1,137 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+import os
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from conductor_mcp.network import blobs, http_proxy, token_manager
+from conductor_mcp.tools import blob
+from conductor_mcp.utils.constants import CONDUCTOR_MAX_RESPONSE_BYTES, CONDUCTOR_SERVER_URL
+
+TEST_URL = "https://some_test_url/api"
+EXECUTION = {"workflowId": "wf1", "status": "RUNNING", "tasks": [{"status": "COMPLETED", "seq": i} for i in range(200)]}
+
+
+async def mock_token_retriever():
+    return "test_tolkien"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    test_store = blobs.BlobStore(max_count=2, max_bytes=1024 * 1024)
+    monkeypatch.setattr(blobs, "_store", test_store)
+    yield test_store
+    test_store.close()
+
+
+@pytest.mark.asyncio
+async def test_large_responses_spill_to_a_blob(httpx_mock: HTTPXMock, monkeypatch, store):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setenv(CONDUCTOR_MAX_RESPONSE_BYTES, "1000")
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+    body = json.dumps(EXECUTION)
+    httpx_mock.add_response(url=TEST_URL + "/workflow/wf1", text=body)
+    httpx_mock.add_response(url=TEST_URL + "/workflow/small", text='{"status": "COMPLETED"}')
+
+    summary = json.loads(await http_proxy.http_get("workflow/wf1"))
+    small = await http_proxy.http_get("workflow/small")
+
+    assert small == '{"status": "COMPLETED"}'
+    assert summary["truncated"] is True
+    assert summary["bytes"] == len(body)
+    assert summary["blob_uri"] == f"conductor://blobs/{summary['blob_id']}"
+    assert body.startswith(summary["preview"])
+
+    first = json.loads(await blob.read_blob.fn(summary["blob_id"], length=1000))
+    rest = json.loads(await blob.read_blob.fn(summary["blob_id"], offset=first["next_offset"], length=len(body)))
+    assert first["text"] + rest["text"] == body
+    assert rest["next_offset"] is None
+
+    statuses = json.loads(await blob.read_blob.fn(summary["blob_id"], json_path="$.tasks[0:3].status"))
+    assert statuses["matches"] == ["COMPLETED"] * 3
+
+
+def test_least_recently_read_blobs_are_evicted(store):
+    ids = []
+    for index in range(3):
+        writer = store.writer()
+        writer.write(b'{"n": %d}' % index)
+        ids.append(writer.close("application/json").id)
+        if index == 1:
+            store.read(ids[0], 0, 10)
+
+    assert store.stats() == {"blobs": 2, "bytes": 16, "evictions": 1}
+    assert store.extract(ids[0], "$.n") == [0]
+    with pytest.raises(KeyError):
+        store.read(ids[1], 0, 10)
+    assert not os.path.exists(os.path.join(store.directory(), ids[1]))
+
+
+def test_json_path_is_refused_on_blobs_too_large_to_parse(store):
+    store.max_parse_bytes = 8
+    writer = store.writer()
+    writer.write(b'{"status": "RUNNING"}')
+    blob = writer.close("application/json")
+
+    with pytest.raises(ValueError, match="Read it in pages"):
+        store.extract(blob.id, "$.status")
+    assert store.read(blob.id, 0, 8)["text"] == '{"status'
+
+
+@pytest.mark.asyncio
+async def test_large_json_responses_are_parsed_from_their_blob(httpx_mock: HTTPXMock, monkeypatch, store):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setenv(CONDUCTOR_MAX_RESPONSE_BYTES, "1000")
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+    httpx_mock.add_response(url=TEST_URL + "/workflow/wf1", text=json.dumps(EXECUTION))
+
+    assert await http_proxy.http_get_json("workflow/wf1") == EXECUTION
+    assert store.stats()["blobs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_json_responses_too_large_to_parse_raise_with_the_blob_summary(httpx_mock: HTTPXMock, monkeypatch, store):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setenv(CONDUCTOR_MAX_RESPONSE_BYTES, "1000")
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+    store.max_parse_bytes = 2000
+    httpx_mock.add_response(url=TEST_URL + "/workflow/wf1", text=json.dumps(EXECUTION))
+
+    with pytest.raises(ValueError, match="Read it in pages") as raised:
+        await http_proxy.http_get_json("workflow/wf1")
+    assert "conductor://blobs/" in str(raised.value)
+
+
+def test_pages_are_bounded(store):
+    writer = store.writer()
+    writer.write(b"x" * (blobs.MAX_PAGE_BYTES * 2))
+    blob = writer.close("text/plain")
+
+    assert len(store.read(blob.id, 0, 10**12)["text"]) == blobs.MAX_PAGE_BYTES
+    assert len(store.read(blob.id, 0, -1)["text"]) == 1
+    with pytest.raises(ValueError, match="offset"):
+        store.read(blob.id, -1, 10)
+
+
+class FailingStream(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield b"x" * 20
+        raise httpx.ReadError("connection reset")
+
+
+@pytest.mark.asyncio
+async def test_partial_blobs_are_deleted_when_the_stream_fails(store):
+    response = httpx.Response(200, stream=FailingStream())
+
+    with pytest.raises(httpx.ReadError):
+        await blobs.read_capped(response, 10)
+    assert store.stats()["blobs"] == 0
+    assert os.listdir(store.directory()) == []
@@ -0,0 +1,115 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+import pytest
+from unittest.mock import AsyncMock
+from fastmcp import Client
+from pytest_httpx import HTTPXMock
+from conductor_mcp import server
+from conductor_mcp.network import clusters, http_client, http_proxy, response_cache, token_manager
+from conductor_mcp.utils.constants import (
+    CONDUCTOR_AUTH_KEY,
+    CONDUCTOR_AUTH_SECRET,
+    CONDUCTOR_CLUSTERS,
+    CONDUCTOR_SERVER_URL,
+)
+
+DEFAULT_URL = "https://us.conductor.test/api"
+EU_URL = "https://eu.conductor.test/api"
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, DEFAULT_URL)
+    monkeypatch.setenv(CONDUCTOR_AUTH_KEY, "us-key")
+    monkeypatch.setenv(CONDUCTOR_AUTH_SECRET, "us-secret")
+    eu = {CONDUCTOR_SERVER_URL: EU_URL, CONDUCTOR_AUTH_KEY: "eu-key", CONDUCTOR_AUTH_SECRET: "eu-secret"}
+    monkeypatch.setenv(CONDUCTOR_CLUSTERS, json.dumps({"eu": eu}))
+    monkeypatch.setattr(token_manager, "_provider", token_manager.TokenProvider())
+    monkeypatch.setattr(token_manager, "_cluster_providers", {})
+    monkeypatch.setattr(response_cache, "_cluster_caches", {})
+
+
+def test_use_cluster_selects_and_restores(configured):
+    assert clusters.names() == ["default", "eu"]
+    with clusters.use_cluster("eu") as cluster:
+        assert cluster.server_url == EU_URL
+        assert clusters.current().auth_key == "eu-key"
+        with clusters.use_cluster("default"):
+            assert clusters.active() is None
+        assert clusters.active() == "eu"
+    assert clusters.current().server_url == DEFAULT_URL
+
+    with pytest.raises(clusters.UnknownClusterError, match="default, eu"):
+        with clusters.use_cluster("apac"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_each_cluster_has_its_own_token_and_client(httpx_mock: HTTPXMock, configured):
+    httpx_mock.add_response(url=DEFAULT_URL + "/token", json={"token": "us-token"})
+    httpx_mock.add_response(url=EU_URL + "/token", json={"token": "eu-token"})
+    httpx_mock.add_response(url=DEFAULT_URL + "/tasks/queue/all", json={"charge": 1})
+    httpx_mock.add_response(url=EU_URL + "/tasks/queue/all", json={"charge": 2})
+
+    assert await http_proxy.http_get_json("tasks/queue/all") == {"charge": 1}
+    with clusters.use_cluster("eu"):
+        assert await http_proxy.http_get_json("tasks/queue/all") == {"charge": 2}
+        eu_client = http_client.get_client()
+    assert http_client.get_client() is not eu_client
+
+    token_requests = [
+        json.loads(request.content) for request in httpx_mock.get_requests() if request.url.path.endswith("token")
+    ]
+    assert [body["keyId"] for body in token_requests] == ["us-key", "eu-key"]
+    headers = [
+        request.headers["X-Authorization"] for request in httpx_mock.get_requests(url=EU_URL + "/tasks/queue/all")
+    ]
+    assert headers == ["eu-token"]
+    await http_client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_keeps_results_of_healthy_clusters(configured):
+    async def server_url():
+        if clusters.active() == "eu":
+            raise RuntimeError("eu is down")
+        return clusters.current().server_url
+
+    results, errors = await clusters.fan_out(server_url)
+    assert results == {"default": DEFAULT_URL}
+    assert errors == {"eu": "eu is down"}
+
+    # duplicates are queried once
+    results, errors = await clusters.fan_out(lambda: _current_name(), ["eu", "default", "eu"])
+    assert results == {"eu": "eu", "default": "default"}
+
+    with pytest.raises(clusters.UnknownClusterError):
+        await clusters.fan_out(server_url, ["apac"])
+
+
+async def _current_name():
+    return clusters.current().name
+
+
+@pytest.mark.asyncio
+async def test_every_tool_takes_an_optional_cluster(configured, monkeypatch):
+    mock_get = AsyncMock(side_effect=lambda path: json.dumps({"cluster": clusters.current().name}))
+    monkeypatch.setattr(http_proxy, "http_get", mock_get)
+
+    async with Client(server.mcp) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+        default = await client.call_tool("workflow_get_all_workflows", {})
+        eu = await client.call_tool("workflow_get_all_workflows", {"cluster": "eu"})
+
+    assert "cluster" in tools["task_get_task_by_id"].inputSchema["properties"]
+    assert "cluster" not in tools["task_get_task_queue_details_all_clusters"].inputSchema["properties"]
+    assert json.loads(default.content[0].text) == {"cluster": "default"}
+    assert json.loads(eu.content[0].text) == {"cluster": "eu"}
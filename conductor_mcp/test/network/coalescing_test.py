@@ -0,0 +1,81 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import asyncio
+import pytest
+from pytest_httpx import HTTPXMock
+from conductor_mcp.network import coalescing, http_proxy, token_manager
+from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL
+
+TEST_URL = "https://some_test_url/api"
+
+
+async def mock_token_retriever():
+    return "test_tolkien"
+
+
+def test_normalize_url():
+    assert coalescing.normalize_url("HTTPS://Host/api/workflow/x?b=2&a=1") == "https://host/api/workflow/x?a=1&b=2"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+    monkeypatch.setattr(coalescing, "_coalescer", coalescing.SingleFlight())
+    httpx_mock.add_response(url=TEST_URL + "/tasks/queue/all?a=1&b=2", text='{"encode": 3}', is_reusable=True)
+
+    results = await asyncio.gather(
+        *[http_proxy.http_get("tasks/queue/all?a=1&b=2") for _ in range(4)],
+        http_proxy.http_get("tasks/queue/all?b=2&a=1"),
+    )
+
+    assert results == ['{"encode": 3}'] * 5
+    assert len(httpx_mock.get_requests()) == 1
+    assert coalescing.get_coalescer().stats() == {"calls": 5, "coalesced": 4, "ratio": 0.8, "in_flight": 0}
+
+    # once the first request completed, the next read goes upstream again
+    await http_proxy.http_get("tasks/queue/all?a=1&b=2")
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_principals_are_not_coalesced(monkeypatch):
+    flight = coalescing.SingleFlight()
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.sleep(0.01)
+        return object()
+
+    first = asyncio.ensure_future(flight.do(("url", "key-a"), call))
+    await started.wait()
+    second = await flight.do(("url", "key-b"), call)
+
+    assert await first is not second
+    assert flight.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_request():
+    flight = coalescing.SingleFlight()
+    release = asyncio.Event()
+
+    async def call():
+        await release.wait()
+        return "done"
+
+    leader = asyncio.ensure_future(flight.do("key", call))
+    follower = asyncio.ensure_future(flight.do("key", call))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == "done"
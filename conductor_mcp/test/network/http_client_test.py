@@ -0,0 +1,36 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import pytest
+from conductor_mcp.network import http_client
+from conductor_mcp.utils.constants import CONDUCTOR_HTTP_MAX_CONNECTIONS, CONDUCTOR_HTTP_TIMEOUT_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_until_closed():
+    first = http_client.get_client()
+    assert http_client.get_client() is first
+
+    await http_client.close_client()
+
+    assert first.is_closed
+    assert http_client.get_client() is not first
+    await http_client.close_client()
+
+
+@pytest.mark.asyncio
+async def test_open_client_uses_configured_limits(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_HTTP_MAX_CONNECTIONS, "7")
+    monkeypatch.setenv(CONDUCTOR_HTTP_TIMEOUT_SECONDS, "2.5")
+
+    client = await http_client.open_client()
+
+    assert client.timeout.read == 2.5
+    assert client._transport._pool._max_connections == 7
+    await http_client.close_client()
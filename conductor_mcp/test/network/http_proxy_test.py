@@ -89,3 +89,23 @@ async def test_http_delete(httpx_mock: HTTPXMock, monkeypatch):
 
     request = httpx_mock.get_request()
     assert request.method == "DELETE"
+
+
+@pytest.mark.asyncio
+async def test_unauthorized_request_refreshes_token_and_retries(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+
+    async def mock_force_refresh(stale_token):
+        assert stale_token == "test_tolkien"
+        return "fresh_tolkien"
+
+    monkeypatch.setattr(token_manager, "force_refresh", mock_force_refresh)
+    httpx_mock.add_response(url=TEST_URL + f"/workflow/123", status_code=401)
+    httpx_mock.add_response(url=TEST_URL + f"/workflow/123", text="found")
+
+    result = await http_proxy.http_get("workflow/123")
+
+    assert result == "found"
+    requests = httpx_mock.get_requests()
+    assert [r.headers["X-Authorization"] for r in requests] == ["test_tolkien", "fresh_tolkien"]
@@ -0,0 +1,166 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from conductor_mcp.network import http_proxy, metadata_index
+from conductor_mcp.tools import metadata
+
+ORDERS = {
+    "name": "orders",
+    "version": 1,
+    "updateTime": 100,
+    "description": "Processes customer orders",
+    "tasks": [
+        {"name": "charge", "taskReferenceName": "charge_ref", "type": "SIMPLE"},
+        {
+            "name": "route",
+            "taskReferenceName": "route_ref",
+            "type": "SWITCH",
+            "decisionCases": {
+                "ship": [
+                    {
+                        "name": "shipping",
+                        "taskReferenceName": "shipping_ref",
+                        "type": "SUB_WORKFLOW",
+                        "subWorkflowParam": {"name": "shipping", "version": 2},
+                    }
+                ]
+            },
+            "defaultCase": [
+                {
+                    "name": "notify",
+                    "taskReferenceName": "notify_ref",
+                    "type": "HTTP",
+                    "inputParameters": {"http_request": {"uri": "https://hooks.example.com/notify", "method": "POST"}},
+                }
+            ],
+        },
+    ],
+}
+SHIPPING = {
+    "name": "shipping",
+    "version": 2,
+    "updateTime": 50,
+    "description": "Books a courier",
+    "tasks": [
+        {
+            "name": "label",
+            "taskReferenceName": "label_ref",
+            "type": "SUB_WORKFLOW",
+            "subWorkflowParam": {"name": "labels", "version": 1},
+        }
+    ],
+}
+
+
+@pytest.fixture
+def conductor(monkeypatch, tmp_path):
+    responses = {
+        metadata_index.WORKFLOW_LIST_PATH: [
+            {"name": "orders", "version": 1, "updateTime": 100},
+            {"name": "shipping", "version": 2, "updateTime": 50},
+        ],
+        metadata_index.TASK_DEFINITIONS_PATH: [{"name": "charge", "updateTime": 10, "description": "Charges a card"}],
+        "metadata/workflow/orders?version=1": ORDERS,
+        "metadata/workflow/shipping?version=2": SHIPPING,
+    }
+
+    async def get(path):
+        if isinstance(responses[path], Exception):
+            raise responses[path]
+        return responses[path]
+
+    mock_get = AsyncMock(side_effect=get)
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_get)
+    index = metadata_index.MetadataIndex(str(tmp_path / "index.sqlite3"), sync_seconds=3600)
+    monkeypatch.setattr(metadata_index, "_index", index)
+    return responses, mock_get
+
+
+@pytest.mark.asyncio
+async def test_sync_is_incremental(conductor, tmp_path):
+    responses, mock_get = conductor
+    index = metadata_index.get_index()
+
+    first = await index.sync()
+    responses[metadata_index.WORKFLOW_LIST_PATH] = [{"name": "orders", "version": 1, "updateTime": 200}]
+    responses["metadata/workflow/orders?version=1"] = dict(ORDERS, updateTime=200, tasks=[])
+    mock_get.reset_mock()
+    # a new index over the same file only fetches what changed since the previous process synced
+    second = await metadata_index.MetadataIndex(index.path, sync_seconds=3600).sync()
+
+    assert first["workflows_updated"] == 2
+    assert second == {
+        "workflows": 1,
+        "workflows_updated": 1,
+        "workflows_removed": 1,
+        "task_definitions": 1,
+        "task_definitions_updated": 0,
+        "task_definitions_removed": 0,
+        "workflows_failed": {},
+    }
+    assert mock_get.await_count == 3
+    assert index.workflows_using_task("charge") == []
+
+
+@pytest.mark.asyncio
+async def test_unreadable_definitions_are_skipped_and_retried(conductor):
+    responses, mock_get = conductor
+    responses["metadata/workflow/shipping?version=2"] = http_proxy.ConductorRequestError(
+        httpx.Response(403, text="forbidden")
+    )
+    index = metadata_index.get_index()
+
+    first = await index.sync()
+    responses["metadata/workflow/shipping?version=2"] = SHIPPING
+    second = await index.sync()
+
+    assert first["workflows_updated"] == 1
+    assert first["workflows_failed"] == {"shipping:2": "403: forbidden"}
+    assert index.workflows_using_task("notify")[0]["workflow_name"] == "orders"
+    # only the definition that failed is fetched again
+    assert second["workflows_updated"] == 1
+    assert second["workflows_failed"] == {}
+    assert [call.args[0] for call in mock_get.await_args_list][-1] == "metadata/workflow/shipping?version=2"
+
+
+@pytest.mark.asyncio
+async def test_query_tools(conductor):
+    using = json.loads(await metadata.find_workflows_using_task.fn(task_name="notify"))
+    http_tasks = json.loads(await metadata.find_http_tasks.fn(uri_fragment="hooks.example.com"))
+    graph = json.loads(await metadata.get_sub_workflow_graph.fn(workflow_name="shipping"))
+    matches = json.loads(await metadata.search_definitions.fn(text="courier"))
+
+    assert using == [
+        {"workflow_name": "orders", "workflow_version": 1, "task_reference_name": "notify_ref", "task_type": "HTTP"}
+    ]
+    assert http_tasks[0]["http_uri"] == "https://hooks.example.com/notify"
+    assert [edge["sub_workflow_name"] for edge in graph["calls"]] == ["labels"]
+    assert [edge["workflow_name"] for edge in graph["called_by"]] == ["orders"]
+    assert [(match["kind"], match["name"]) for match in matches] == [("workflow", "shipping")]
+    # the index was synced once and then served every query locally
+    assert conductor[1].await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_full_sync_requested_during_an_incremental_one_still_runs(conductor):
+    responses, mock_get = conductor
+    index = metadata_index.get_index()
+    await index.sync()
+
+    incremental = index.start_sync()
+    full = index.start_sync(full=True)
+
+    assert full is not incremental
+    assert index.start_sync() is full
+    assert (await incremental)["workflows_updated"] == 0
+    assert (await full)["workflows_updated"] == 2
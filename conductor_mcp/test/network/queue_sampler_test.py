@@ -0,0 +1,93 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+import pytest
+from unittest.mock import AsyncMock
+from conductor_mcp.network import clusters, http_proxy, queue_sampler
+from conductor_mcp.tools import task
+from conductor_mcp.utils.constants import CONDUCTOR_CLUSTERS, CONDUCTOR_SERVER_URL
+
+
+def test_ring_buffer_keeps_the_newest_samples():
+    history = queue_sampler.QueueHistory(capacity=3)
+    for second in range(5):
+        history.record(float(second), {"encode": second})
+    history.record(5.0, {"encode": 5, "resize": 1})
+
+    slots, latest = history.window(60)
+
+    assert latest == 5.0
+    assert [history.times[slot] for slot in slots] == [3.0, 4.0, 5.0]
+    assert [history.depths["resize"][slot] for slot in slots] == [queue_sampler.MISSING, queue_sampler.MISSING, 1]
+    assert [history.times[slot] for slot in history.window(1)[0]] == [4.0, 5.0]
+
+
+def test_trends():
+    history = queue_sampler.QueueHistory(capacity=10)
+    for minute in range(4):
+        history.record(minute * 60.0, {"growing": 10 + 5 * minute, "draining": 100 - 20 * minute, "flat": 3})
+
+    trends = {trend["taskType"]: trend for trend in history.trends(3600)}
+
+    assert trends["growing"]["growth_per_minute"] == 5
+    assert trends["growing"]["seconds_to_drain"] is None
+    assert trends["draining"]["depth"] == 40
+    assert trends["draining"]["change"] == -60
+    assert trends["draining"]["seconds_to_drain"] == 120
+    assert trends["flat"]["growth_per_minute"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_task_queue_trends_starts_sampling(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, "https://us.conductor.test/api")
+    sampler = queue_sampler.QueueSampler(interval=3600, capacity=10)
+    sampler.history.record(0.0, {"encode": 1, "resize": 4})
+    monkeypatch.setattr(queue_sampler, "_sampler", sampler)
+    monkeypatch.setattr(http_proxy, "http_get_json", AsyncMock(return_value={"encode": 7, "resize": 4}))
+    monkeypatch.setattr(queue_sampler.time, "time", lambda: 60.0)
+
+    result = json.loads(await task.get_task_queue_trends.fn(top_n=1))
+    await sampler.stop()
+
+    assert result["samples"] == 2
+    assert result["queue_count"] == 2
+    assert [trend["taskType"] for trend in result["top_growing"]] == ["encode"]
+    assert [trend["taskType"] for trend in result["deepest"]] == ["encode"]
+
+
+@pytest.mark.asyncio
+async def test_each_cluster_is_sampled_separately(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, "https://us.conductor.test/api")
+    monkeypatch.setenv(CONDUCTOR_CLUSTERS, json.dumps({"eu": {CONDUCTOR_SERVER_URL: "https://eu.conductor.test/api"}}))
+    monkeypatch.setattr(queue_sampler, "_sampler", None)
+    monkeypatch.setattr(queue_sampler, "_cluster_samplers", {})
+    depths = {"default": {"encode": 1}, "eu": {"encode": 9}}
+    polled = []
+
+    async def mock_get_json(path):
+        polled.append(clusters.current().name)
+        return depths[clusters.current().name]
+
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_get_json)
+
+    with clusters.use_cluster("eu"):
+        eu = json.loads(await task.get_task_queue_trends.fn())
+    default = json.loads(await task.get_task_queue_trends.fn())
+    # each sampler polls its own cluster, whatever cluster the task running it has selected
+    await queue_sampler._cluster_samplers["eu"].sample()
+    with clusters.use_cluster("eu"):
+        await queue_sampler._sampler.sample()
+    await queue_sampler.stop()
+
+    assert eu["backlog"] == 9
+    assert default["backlog"] == 1
+    assert polled == ["eu", "default", "eu", "default"]
+    assert queue_sampler._sampler.history.size == 2
+    assert queue_sampler._cluster_samplers["eu"].history.size == 2
@@ -0,0 +1,56 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import asyncio
+import pytest
+from conductor_mcp.network import rate_limiter
+
+
+@pytest.mark.parametrize(
+    "method,path,expected",
+    [
+        ("GET", "workflow/search?query=status%3DFAILED", "search"),
+        ("GET", "metadata/taskdefs/my_task?metadata=false", "metadata"),
+        ("GET", "tasks/123/log", "execution"),
+        ("POST", "metadata/workflow?overwrite=false", "writes"),
+        ("DELETE", "workflow/123", "writes"),
+    ],
+)
+def test_classify(method, path, expected):
+    assert rate_limiter.classify(method, path) == expected
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped():
+    limiter = rate_limiter.RequestLimiter(max_concurrent=2, rate_limits={})
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter.acquire("execution"):
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[request() for _ in range(6)])
+
+    assert peak == 2
+    assert limiter.stats()["queue_wait"]["execution"]["requests"] == 6
+    assert limiter.stats()["queue_wait"]["execution"]["waited"] >= 4
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests():
+    limiter = rate_limiter.RequestLimiter(max_concurrent=10, rate_limits={"search": {"rate": 100, "burst": 1}})
+
+    for _ in range(3):
+        async with limiter.acquire("search"):
+            pass
+
+    assert limiter.stats()["queue_wait"]["search"]["total_wait_seconds"] >= 0.015
+    assert limiter.stats()["queue_wait"]["metadata"]["requests"] == 0
@@ -0,0 +1,120 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from pytest_httpx import HTTPXMock
+from conductor_mcp.network import http_proxy, resilience, token_manager
+from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL, CONDUCTOR_CIRCUIT_FAILURE_THRESHOLD
+
+TEST_URL = "https://some_test_url/api"
+
+
+async def mock_token_retriever():
+    return "test_tolkien"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+    monkeypatch.setattr(resilience, "_breakers", {})
+    recorded = []
+
+    async def mock_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(resilience.asyncio, "sleep", mock_sleep)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_idempotent_request_is_retried(httpx_mock: HTTPXMock, sleeps):
+    httpx_mock.add_response(url=TEST_URL + "/workflow/123", status_code=503)
+    httpx_mock.add_exception(httpx.ConnectError("reset"), url=TEST_URL + "/workflow/123")
+    httpx_mock.add_response(url=TEST_URL + "/workflow/123", text="found")
+
+    assert await http_proxy.http_get("workflow/123") == "found"
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honored(httpx_mock: HTTPXMock, sleeps):
+    httpx_mock.add_response(url=TEST_URL + "/workflow/123", status_code=429, headers={"Retry-After": "2"})
+    httpx_mock.add_response(url=TEST_URL + "/workflow/123", text="found")
+
+    assert await http_proxy.http_get("workflow/123") == "found"
+    assert sleeps == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_write_without_idempotency_key_is_not_retried(httpx_mock: HTTPXMock, sleeps):
+    httpx_mock.add_response(url=TEST_URL + "/workflow/start_me?priority=0", status_code=503, text="busy")
+
+    assert await http_proxy.http_post("workflow/start_me?priority=0") == "busy"
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_write_with_idempotency_key_is_retried(httpx_mock: HTTPXMock, sleeps):
+    httpx_mock.add_response(url=TEST_URL + "/workflow/start_me?priority=0", status_code=502)
+    httpx_mock.add_response(url=TEST_URL + "/workflow/start_me?priority=0", text="wf1")
+
+    result = await http_proxy.http_post("workflow/start_me?priority=0", additional_headers={"X-Idempotency-key": "k"})
+
+    assert result == "wf1"
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_fails_fast(httpx_mock: HTTPXMock, sleeps, monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_CIRCUIT_FAILURE_THRESHOLD, "3")
+    httpx_mock.add_response(url=TEST_URL + "/workflow/123", status_code=503, is_reusable=True)
+
+    await http_proxy.http_get("workflow/123")
+    with pytest.raises(resilience.CircuitOpenError):
+        await http_proxy.http_get("workflow/123")
+
+    assert len(httpx_mock.get_requests()) == 3
+    assert resilience.breaker_for(TEST_URL).state == "open"
+
+
+def test_half_open_circuit_lets_one_trial_through():
+    breaker = resilience.CircuitBreaker("host", failure_threshold=1, reset_seconds=0)
+    breaker.record_failure()
+
+    breaker.before_request()
+    with pytest.raises(resilience.CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_does_not_wedge_the_circuit(monkeypatch):
+    breaker = resilience.CircuitBreaker("host", failure_threshold=1, reset_seconds=0)
+    breaker.record_failure()
+    monkeypatch.setattr(resilience, "_breakers", {"host": breaker})
+    started = asyncio.Event()
+
+    async def hang() -> httpx.Response:
+        started.set()
+        await asyncio.Event().wait()
+
+    trial = asyncio.ensure_future(resilience.send("https://host/api/workflow/1", True, hang))
+    await started.wait()
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    response = await resilience.send("https://host/api/workflow/1", True, AsyncMock(return_value=httpx.Response(200)))
+    assert response.status_code == 200
+    assert breaker.state == "closed"
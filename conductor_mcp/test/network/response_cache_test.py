@@ -0,0 +1,91 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from conductor_mcp.network import http_proxy, response_cache, token_manager
+from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL
+
+TEST_URL = "https://some_test_url/api"
+WORKFLOWS_PATH = "metadata/workflow?short=true&metadata=true"
+
+
+async def mock_token_retriever():
+    return "test_tolkien"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+    test_cache = response_cache.ResponseCache(ttls={"metadata/workflow": 60}, max_bytes=1024)
+    monkeypatch.setattr(response_cache, "_cache", test_cache)
+    return test_cache
+
+
+@pytest.mark.asyncio
+async def test_metadata_get_is_served_from_cache(httpx_mock: HTTPXMock, cache):
+    httpx_mock.add_response(url=TEST_URL + "/" + WORKFLOWS_PATH, text="[]")
+
+    assert await http_proxy.http_get(WORKFLOWS_PATH) == "[]"
+    assert await http_proxy.http_get(WORKFLOWS_PATH) == "[]"
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_uncached_paths_always_go_upstream(httpx_mock: HTTPXMock, cache):
+    httpx_mock.add_response(url=TEST_URL + "/tasks/queue/all", text="{}", is_reusable=True)
+
+    await http_proxy.http_get("tasks/queue/all")
+    await http_proxy.http_get("tasks/queue/all")
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert cache.stats()["misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_with_etag(httpx_mock: HTTPXMock, cache):
+    httpx_mock.add_response(url=TEST_URL + "/" + WORKFLOWS_PATH, text="[1]", headers={"ETag": '"v1"'})
+    httpx_mock.add_response(url=TEST_URL + "/" + WORKFLOWS_PATH, status_code=304)
+    await http_proxy.http_get(WORKFLOWS_PATH)
+    cache._entries[WORKFLOWS_PATH].expires_at = 0
+
+    assert await http_proxy.http_get(WORKFLOWS_PATH) == "[1]"
+
+    assert httpx_mock.get_requests()[1].headers["If-None-Match"] == '"v1"'
+    assert cache.stats()["revalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_resource(httpx_mock: HTTPXMock, cache):
+    httpx_mock.add_response(url=TEST_URL + "/" + WORKFLOWS_PATH, text="[]")
+    httpx_mock.add_response(url=TEST_URL + "/metadata/workflow?overwrite=false", text="")
+    httpx_mock.add_response(url=TEST_URL + "/" + WORKFLOWS_PATH, text='[{"name": "new"}]')
+
+    await http_proxy.http_get(WORKFLOWS_PATH)
+    await http_proxy.http_post("metadata/workflow?overwrite=false", data={"name": "new"})
+
+    assert await http_proxy.http_get(WORKFLOWS_PATH) == '[{"name": "new"}]'
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_least_recently_used_entries_are_evicted_by_size():
+    cache = response_cache.ResponseCache(ttls={"metadata": 60}, max_bytes=10)
+    cache.store("metadata/a", httpx.Response(200, text="aaaa"))
+    cache.store("metadata/b", httpx.Response(200, text="bbbb"))
+    cache.lookup("metadata/a")
+    cache.store("metadata/c", httpx.Response(200, text="cccc"))
+
+    assert cache.lookup("metadata/b") is None
+    assert cache.lookup("metadata/a").text == "aaaa"
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,69 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import pytest
+from urllib.parse import parse_qs, urlsplit
+from conductor_mcp.network import http_proxy, search
+from conductor_mcp.network.search import SearchRequest
+from conductor_mcp.utils.constants import CONDUCTOR_SEARCH_MAX_BYTES
+
+TOTAL_HITS = 250
+
+
+def mock_search_endpoint(requested_paths):
+    async def mock_http_get_json(path):
+        requested_paths.append(path)
+        params = parse_qs(urlsplit(path).query)
+        start, size = int(params["start"][0]), int(params["size"][0])
+        results = [{"workflowId": f"wf{i}"} for i in range(start, min(start + size, TOTAL_HITS))]
+        return {"totalHits": TOTAL_HITS, "results": results}
+
+    return mock_http_get_json
+
+
+@pytest.mark.asyncio
+async def test_search_fetches_only_the_pages_it_needs(monkeypatch):
+    requested_paths = []
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_search_endpoint(requested_paths))
+
+    result = await search.search(SearchRequest(query='status="FAILED"', sort="startTime:DESC"), 150)
+
+    assert len(result["results"]) == 150
+    assert len(requested_paths) == 2
+    assert "sort=startTime%3ADESC" in requested_paths[0]
+    assert SearchRequest.from_cursor(result["nextCursor"]) == SearchRequest(
+        'status="FAILED"', "*", "startTime:DESC", 150
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_returns_no_cursor_after_last_hit(monkeypatch):
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_search_endpoint([]))
+
+    result = await search.search(SearchRequest(start=200), 1000)
+
+    assert [r["workflowId"] for r in result["results"]][0] == "wf200"
+    assert len(result["results"]) == 50
+    assert result["nextCursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_search_stops_at_byte_cap(monkeypatch):
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_search_endpoint([]))
+    monkeypatch.setenv(CONDUCTOR_SEARCH_MAX_BYTES, "100")
+
+    result = await search.search(SearchRequest(), 100)
+
+    assert 0 < len(result["results"]) < 10
+    assert SearchRequest.from_cursor(result["nextCursor"]).start == len(result["results"])
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(ValueError):
+        SearchRequest.from_cursor("not-a-cursor")
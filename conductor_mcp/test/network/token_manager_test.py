@@ -7,8 +7,13 @@
 #  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 #  specific language governing permissions and limitations under the License.
 
+import asyncio
+import base64
+import json
+import time
 from datetime import timedelta
 
+import httpx
 import pytest
 import datetime
 from freezegun import freeze_time
@@ -53,3 +58,74 @@ async def test_refresh_token(httpx_mock: HTTPXMock, monkeypatch):
         await token_manager.get_token()
 
         assert len(httpx_mock.get_requests()) == first_calls + 1
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_refresh(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setenv(CONDUCTOR_AUTH_KEY, "testAuthKey")
+    monkeypatch.setenv(CONDUCTOR_AUTH_SECRET, "testAuthSecretShhhh")
+    httpx_mock.add_response(url=TEST_URL + f"/token", json={"token": TEST_TOKEN})
+    provider = token_manager.TokenProvider()
+
+    tokens = await asyncio.gather(*[provider.get_token() for _ in range(10)])
+
+    assert tokens == [TEST_TOKEN] * 10
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_expiry_is_read_from_jwt(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setenv(CONDUCTOR_AUTH_KEY, "testAuthKey")
+    monkeypatch.setenv(CONDUCTOR_AUTH_SECRET, "testAuthSecretShhhh")
+    with freeze_time(datetime.datetime.now()) as frozen_datetime:
+        short_lived = _jwt(time.time() + 600)
+        httpx_mock.add_response(url=TEST_URL + f"/token", json={"token": short_lived})
+        provider = token_manager.TokenProvider()
+
+        assert await provider.get_token() == short_lived
+
+        # past the refresh point but still valid: the cached token is returned while a refresh runs in the background
+        renewed = _jwt(time.time() + 1200)
+        httpx_mock.add_response(url=TEST_URL + f"/token", json={"token": renewed})
+        frozen_datetime.tick(timedelta(seconds=590))
+        assert await provider.get_token() == short_lived
+        await asyncio.sleep(0)
+        await provider._inflight
+
+        assert await provider.get_token() == renewed
+        assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_retried(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setenv(CONDUCTOR_AUTH_KEY, "testAuthKey")
+    monkeypatch.setenv(CONDUCTOR_AUTH_SECRET, "testAuthSecretShhhh")
+    httpx_mock.add_response(url=TEST_URL + f"/token", status_code=503)
+    httpx_mock.add_response(url=TEST_URL + f"/token", json={"token": TEST_TOKEN})
+    provider = token_manager.TokenProvider()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider.get_token()
+
+    assert await provider.get_token() == TEST_TOKEN
+
+
+@pytest.mark.asyncio
+async def test_force_refresh_skips_already_replaced_token(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setenv(CONDUCTOR_AUTH_KEY, "testAuthKey")
+    monkeypatch.setenv(CONDUCTOR_AUTH_SECRET, "testAuthSecretShhhh")
+    httpx_mock.add_response(url=TEST_URL + f"/token", json={"token": TEST_TOKEN})
+    provider = token_manager.TokenProvider()
+    await provider.get_token()
+
+    assert await provider.force_refresh("some_older_token") == TEST_TOKEN
+    assert len(httpx_mock.get_requests()) == 1
@@ -0,0 +1,128 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock
+from fastmcp import Client
+from conductor_mcp import server
+from conductor_mcp.network import search, token_manager
+from conductor_mcp.resources import subscriptions
+from conductor_mcp.utils.constants import CONDUCTOR_SUBSCRIPTION_MAX_WORKFLOWS
+
+QUEUE_URI = "conductor://resource/tasks/queue"
+
+
+@pytest.fixture
+def queues(monkeypatch):
+    snapshot = {"encode": 1, "upload": 5}
+    fetch = AsyncMock(side_effect=lambda: (dict(snapshot), False))
+    monkeypatch.setitem(subscriptions.SOURCES, "tasks/queue", fetch)
+    monkeypatch.setattr(subscriptions, "_hub", subscriptions.SubscriptionHub(poll_seconds=3600))
+    return snapshot, fetch
+
+
+def test_source_for():
+    assert subscriptions.source_for(QUEUE_URI) == "tasks/queue"
+    assert subscriptions.source_for("conductor://workflows/running") == "workflows/running"
+    with pytest.raises(ValueError):
+        subscriptions.source_for("conductor://resource/tasks/definitions")
+
+
+@pytest.mark.asyncio
+async def test_deltas_since_a_version(queues):
+    snapshot, fetch = queues
+    hub = subscriptions.get_hub()
+
+    first = await hub.delta("tasks/queue", 0)
+    assert first == {
+        "source": "tasks/queue",
+        "version": 1,
+        "truncated": False,
+        "reset": True,
+        "snapshot": {"encode": 1, "upload": 5},
+    }
+
+    snapshot["encode"] = 3
+    await hub.refresh("tasks/queue")
+    del snapshot["upload"]
+    snapshot["resize"] = 2
+    await hub.refresh("tasks/queue")
+
+    delta = await hub.delta("tasks/queue", 1)
+    assert delta == {
+        "source": "tasks/queue",
+        "version": 3,
+        "truncated": False,
+        "upserted": {"encode": 3, "resize": 2},
+        "removed": ["upload"],
+    }
+    assert (await hub.delta("tasks/queue", 3))["upserted"] == {}
+    # reading deltas does not poll again within the interval
+    assert fetch.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_poll_and_are_notified(queues, monkeypatch):
+    snapshot, fetch = queues
+    monkeypatch.setattr(token_manager, "start_background_refresh", lambda: None)
+    updates = [[], []]
+
+    def handler_for(index):
+        async def on_message(message):
+            if getattr(message, "root", None) is not None and message.root.method == "notifications/resources/updated":
+                updates[index].append(str(message.root.params.uri))
+
+        return on_message
+
+    async with Client(server.mcp, message_handler=handler_for(0)) as first, Client(
+        server.mcp, message_handler=handler_for(1)
+    ) as second:
+        assert first.initialize_result.capabilities.resources.subscribe is True
+        await first.session.subscribe_resource(QUEUE_URI)
+        await second.session.subscribe_resource(QUEUE_URI)
+        hub = subscriptions.get_hub()
+        await asyncio.sleep(0)
+
+        snapshot["encode"] = 7
+        await hub.poll_once()
+        await asyncio.sleep(0.1)
+
+        changes = json.loads((await first.read_resource("conductor://resource/changes/tasks/queue/1"))[0].text)
+        await first.session.unsubscribe_resource(QUEUE_URI)
+        await second.session.unsubscribe_resource(QUEUE_URI)
+        await hub.stop()
+
+    assert updates == [[QUEUE_URI], [QUEUE_URI]]
+    assert fetch.await_count == 2
+    assert changes["upserted"] == {"encode": 7}
+    assert hub.subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_workflow_snapshots_are_sorted_capped_and_marked_truncated(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SUBSCRIPTION_MAX_WORKFLOWS, "2")
+    mock_search = AsyncMock(
+        return_value={
+            "totalHits": 3,
+            "results": [{"workflowId": "w3", "status": "RUNNING"}, {"workflowId": "w2", "status": "RUNNING"}],
+            "nextCursor": "more",
+        }
+    )
+    monkeypatch.setattr(search, "search", mock_search)
+    monkeypatch.setattr(subscriptions, "_hub", subscriptions.SubscriptionHub(poll_seconds=3600))
+
+    delta = await subscriptions.get_hub().delta("workflows/running", 0)
+
+    request, max_results = mock_search.await_args.args
+    assert request.sort == "startTime:DESC"
+    assert max_results == 2
+    assert delta["truncated"] is True
+    assert list(delta["snapshot"]) == ["w3", "w2"]
@@ -0,0 +1,77 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+import subprocess
+import sys
+import pytest
+from unittest.mock import MagicMock
+from click.testing import CliRunner
+from conductor_mcp import server
+
+
+def test_run_defaults_to_stdio(monkeypatch):
+    mock_run = MagicMock()
+    monkeypatch.setattr(server.mcp, "run", mock_run)
+
+    result = CliRunner().invoke(server.run, [])
+
+    assert result.exit_code == 0
+    mock_run.assert_called_once_with(transport="stdio")
+
+
+def test_run_http_transport(monkeypatch):
+    mock_run = MagicMock()
+    monkeypatch.setattr(server.mcp, "run", mock_run)
+
+    result = CliRunner().invoke(server.run, ["--transport", "http", "--port", "9000", "--max_sessions", "5"])
+
+    assert result.exit_code == 0
+    mock_run.assert_called_once_with(
+        transport="http",
+        host="127.0.0.1",
+        port=9000,
+        uvicorn_config={"limit_concurrency": 5, "timeout_graceful_shutdown": 30},
+    )
+
+
+@pytest.mark.parametrize("flag", ["--profile_startup", "--profile-startup"])
+def test_profile_startup_accepts_both_spellings(flag, monkeypatch):
+    monkeypatch.setattr(server, "profile_startup", lambda: {"total_ms": 1})
+
+    result = CliRunner().invoke(server.run, [flag])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {"total_ms": 1}
+
+
+# budgets for the work this package adds on top of importing fastmcp, generous enough for slow CI machines
+OWN_IMPORTS_BUDGET_MS = 1000
+FIRST_LISTING_BUDGET_MS = 500
+TOTAL_STARTUP_BUDGET_MS = 10000
+
+
+def test_import_does_not_build_server():
+    script = "import sys, conductor_mcp.server; print('fastmcp' in sys.modules, 'conductor_mcp.tools' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False False"
+
+
+def test_startup_budget():
+    result = subprocess.run(
+        [sys.executable, "-m", "conductor_mcp.server", "--profile_startup"], capture_output=True, text=True, check=True
+    )
+    report = json.loads(result.stdout)
+
+    own_imports_ms = sum(ms for module, ms in report["imports_ms"].items() if module.startswith("conductor_mcp"))
+    assert own_imports_ms < OWN_IMPORTS_BUDGET_MS, report
+    assert report["first_listing_ms"] < FIRST_LISTING_BUDGET_MS, report
+    assert report["total_ms"] < TOTAL_STARTUP_BUDGET_MS, report
+    assert report["tools"] > 0
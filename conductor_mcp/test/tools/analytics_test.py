@@ -0,0 +1,175 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from conductor_mcp.network import http_proxy, search
+from conductor_mcp.tools import analytics
+from conductor_mcp.utils.stats import distribution
+
+# workflow search summaries carry ISO-8601 timestamps
+FIRST = "2025-05-01T22:20:59.000Z"
+LAST = "2025-05-01T22:21:59.500Z"
+
+
+def _task(reference, scheduled, started, ended, status="COMPLETED", retry_count=0):
+    return {
+        "referenceTaskName": reference,
+        "taskType": "SIMPLE",
+        "scheduledTime": 1000 + scheduled,
+        "startTime": 1000 + started,
+        "endTime": 1000 + ended,
+        "status": status,
+        "retryCount": retry_count,
+    }
+
+
+def test_distribution():
+    assert distribution([5, 1, 3, 2, 4]) == {"p50": 3, "p95": 5, "max": 5}
+    assert distribution([]) == {"p50": 0, "p95": 0, "max": 0}
+
+
+@pytest.mark.asyncio
+async def test_get_task_duration_stats(monkeypatch):
+    async def fake_pages(request, limit, page_size=search.DEFAULT_PAGE_SIZE):
+        assert request.query == 'workflowType="orders"'
+        yield 0, 2, [{"workflowId": "w1"}, {"workflowId": "w2"}]
+
+    executions = {
+        "workflow/w1?includeTasks=true&summarize=true": {
+            "status": "COMPLETED",
+            "startTime": 1000,
+            "endTime": 2000,
+            "tasks": [_task("fetch", 0, 10, 110), _task("loop__1", 110, 110, 130), _task("loop__2", 130, 140, 150)],
+        },
+        "workflow/w2?includeTasks=true&summarize=true": {
+            "status": "FAILED",
+            "startTime": 1000,
+            "endTime": 4000,
+            "tasks": [_task("fetch", 0, 50, 350, status="FAILED", retry_count=1)],
+        },
+    }
+    monkeypatch.setattr(search, "iter_search_pages", fake_pages)
+    monkeypatch.setattr(http_proxy, "http_get_json", AsyncMock(side_effect=lambda path: executions[path]))
+
+    result = json.loads(await analytics.get_task_duration_stats.fn(workflow_name="orders"))
+
+    assert result["executions"] == 2
+    assert result["statuses"] == {"COMPLETED": 1, "FAILED": 1}
+    assert result["workflow_duration_ms"] == {"p50": 1000, "p95": 3000, "max": 3000}
+    rows = {row[0]: dict(zip(result["columns"], row)) for row in result["rows"]}
+    assert result["rows"][0][0] == "fetch"
+    assert rows["fetch"]["runs"] == 2
+    assert rows["fetch"]["duration_max_ms"] == 300
+    assert rows["fetch"]["queue_wait_max_ms"] == 50
+    assert rows["fetch"]["retries"] == 1
+    assert rows["fetch"]["failure_rate"] == 0.5
+    assert rows["loop"]["runs"] == 2
+    assert rows["loop"]["duration_p95_ms"] == 20
+
+
+def test_normalize_error():
+    assert analytics.normalize_error(
+        "Task 3f2c1a9e-1b2c-4d5e-8f90-123456789abc timed out after 30 seconds at 2025-01-02T10:11:12.345Z"
+    ) == analytics.normalize_error(
+        "Task 00000000-aaaa-bbbb-cccc-dddddddddddd timed out after 45 seconds at 2025-03-04T01:02:03Z"
+    )
+    assert analytics.normalize_error("HTTP 503   from  host  deadbeef00112233") == "HTTP <n> from host <id>"
+
+
+def test_failure_clusters_are_bounded():
+    clusters = analytics.FailureClusters(max_clusters=2)
+    for index in range(5):
+        clusters.add(f"error kind {'abc'[index % 3]}", f"w{index}", "orders", ["fetch"], 100 + index)
+
+    top = clusters.top(10)
+    assert clusters.failures == 5
+    assert len(clusters.clusters) == 3
+    assert top[0]["signature"] == "error kind a"
+    assert top[0]["count"] == 2
+    assert top[0]["first_seen"] == 100
+    assert top[0]["last_seen"] == 103
+    assert top[0]["sample_ids"] == ["w0", "w3"]
+    assert {cluster["signature"] for cluster in top} == {"error kind a", "error kind b", analytics.OTHER_CLUSTER}
+
+
+def test_epoch_millis_accepts_numbers_and_iso_strings():
+    assert analytics.epoch_millis(1746138059000) == 1746138059000
+    assert analytics.epoch_millis("1746138059000") == 1746138059000
+    assert analytics.epoch_millis("2025-05-01T22:20:59.000Z") == 1746138059000
+    assert analytics.epoch_millis("2025-05-01T22:20:59") == 1746138059000
+    assert analytics.epoch_millis(None) == 0
+    assert analytics.epoch_millis("not a time") == 0
+
+
+@pytest.mark.asyncio
+async def test_cluster_failures(monkeypatch):
+    async def fake_pages(request, limit, page_size=search.DEFAULT_PAGE_SIZE):
+        assert request.query.startswith('status="FAILED" AND startTime>')
+        assert request.query.endswith('AND workflowType="orders"')
+        yield 0, 3, [
+            {"workflowId": "w1", "workflowType": "orders", "reasonForIncompletion": "Timeout 30s", "updateTime": FIRST},
+            {"workflowId": "w2", "workflowType": "orders", "reasonForIncompletion": "Timeout 45s", "updateTime": LAST},
+            {"workflowId": "w3", "workflowType": "orders", "reasonForIncompletion": "Bad input", "startTime": FIRST},
+        ]
+
+    monkeypatch.setattr(search, "iter_search_pages", fake_pages)
+
+    result = json.loads(await analytics.cluster_failures.fn(workflow_name="orders"))
+
+    assert result["total_failed"] == 3
+    assert result["scanned"] == 3
+    assert result["clusters"][0]["signature"] == "Timeout <n>s"
+    assert result["clusters"][0]["count"] == 2
+    assert result["clusters"][0]["first_seen"] == 1746138059000
+    assert result["clusters"][0]["last_seen"] == 1746138119500
+    assert result["clusters"][0]["workflow_types"] == {"orders": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_task_duration_stats_reports_failed_fetches(monkeypatch):
+    async def fake_pages(request, limit, page_size=search.DEFAULT_PAGE_SIZE):
+        yield 0, 5, [{"workflowId": f"w{index}"} for index in range(5)]
+
+    async def failing_get(path):
+        raise http_proxy.ConductorRequestError(httpx.Response(401, text="Unauthorized"))
+
+    monkeypatch.setattr(search, "iter_search_pages", fake_pages)
+    monkeypatch.setattr(http_proxy, "http_get_json", failing_get)
+
+    result = json.loads(await analytics.get_task_duration_stats.fn(workflow_name="orders"))
+
+    assert result["executions"] == 0
+    assert result["fetch_errors"]["count"] == 5
+    assert result["fetch_errors"]["samples"] == {f"w{index}": "401: Unauthorized" for index in range(3)}
+
+
+@pytest.mark.asyncio
+async def test_cluster_failures_counts_executions_and_unfetched_task_errors(monkeypatch):
+    async def fake_pages(request, limit, page_size=search.DEFAULT_PAGE_SIZE):
+        yield 0, 2, [
+            {"workflowId": "w1", "workflowType": "orders", "reasonForIncompletion": "Task failed"},
+            {"workflowId": "w2", "workflowType": "orders", "reasonForIncompletion": "Task failed"},
+        ]
+
+    async def fake_get(path):
+        if path.startswith("workflow/w2"):
+            raise http_proxy.ConductorRequestError(httpx.Response(500, text="Internal error"))
+        return {"tasks": [_task("fetch", 0, 0, 1, status="FAILED"), _task("charge", 0, 0, 1, status="FAILED")]}
+
+    monkeypatch.setattr(search, "iter_search_pages", fake_pages)
+    monkeypatch.setattr(http_proxy, "http_get_json", fake_get)
+
+    result = json.loads(await analytics.cluster_failures.fn(include_task_errors=True))
+
+    assert result["scanned"] == 2
+    assert result["clustered_errors"] == 3
+    assert result["fetch_errors"] == {"count": 1, "samples": {"w2": "500: Internal error"}}
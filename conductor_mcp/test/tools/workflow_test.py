@@ -7,10 +7,12 @@
 #  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 #  specific language governing permissions and limitations under the License.
 
+import json
+import httpx
 import pytest
 from unittest.mock import AsyncMock
 from conductor_mcp.tools import workflow
-from conductor_mcp.network import http_proxy
+from conductor_mcp.network import clusters, http_proxy, search
 
 
 # workflow_name: str, correlation_id: str = None, priority=0 , idempotency_strategy: Literal['RETURN_EXISTING', 'FAIL', 'FAIL_ON_RUNNING'] = 'RETURN_EXISTING', idempotency_key:str = None, data={}) -> str:
@@ -39,3 +41,218 @@ async def test_start_workflow_by_name(args, expected, monkeypatch):
     await workflow.start_workflow_by_name.fn(**args)
 
     mock_function.assert_called_with(expected[0], {}, additional_headers=expected[1])
+
+
+@pytest.mark.asyncio
+async def test_batch_workflow_operation_uses_bulk_endpoint(monkeypatch):
+    bulk_response = httpx.Response(200, json={"bulkSuccessfulResults": ["a", "b"], "bulkErrorResults": {"c": "nope"}})
+    mock_function = AsyncMock(return_value=bulk_response)
+    monkeypatch.setattr(http_proxy, "http_request", mock_function)
+
+    result = json.loads(
+        await workflow.batch_workflow_operation.fn(operation="retry", workflow_ids=["a", "b", "c", "a"])
+    )
+
+    mock_function.assert_called_once_with("POST", "workflow/bulk/retry", data=["a", "b", "c"])
+    assert result["requested"] == 3
+    assert result["succeeded_ids"] == ["a", "b"]
+    assert result["errors"] == {"c": "nope"}
+
+
+@pytest.mark.asyncio
+async def test_batch_workflow_operation_falls_back_to_single_requests(monkeypatch):
+    async def mock_request(method, path, data=None):
+        if "bulk" in path:
+            return httpx.Response(404)
+        if path == "workflow/b?reason=cleanup":
+            return httpx.Response(409, text="already terminated")
+        return httpx.Response(200)
+
+    monkeypatch.setattr(http_proxy, "http_request", mock_request)
+
+    result = json.loads(
+        await workflow.batch_workflow_operation.fn(operation="terminate", workflow_ids=["a", "b"], reason="cleanup")
+    )
+
+    assert result["succeeded_ids"] == ["a"]
+    assert result["errors"] == {"b": "409: already terminated"}
+
+
+@pytest.mark.asyncio
+async def test_batch_workflow_operation_selects_workflows_by_query(monkeypatch):
+    search_page = {"totalHits": 2, "results": [{"workflowId": "a"}, {"workflowId": "b"}]}
+    monkeypatch.setattr(http_proxy, "http_get_json", AsyncMock(return_value=search_page))
+    bulk_response = httpx.Response(200, json={"bulkSuccessfulResults": ["a", "b"], "bulkErrorResults": {}})
+    mock_request = AsyncMock(return_value=bulk_response)
+    monkeypatch.setattr(http_proxy, "http_request", mock_request)
+
+    result = json.loads(await workflow.batch_workflow_operation.fn(operation="pause", query='status="RUNNING"'))
+
+    mock_request.assert_called_once_with("PUT", "workflow/bulk/pause", data=["a", "b"])
+    assert result["succeeded"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_workflow_by_id_projection_skips_tasks(monkeypatch):
+    execution = {"workflowId": "wf1", "status": "COMPLETED", "output": {"result": 1}, "input": {"a": 1}}
+    mock_function = AsyncMock(return_value=execution)
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_function)
+
+    result = json.loads(await workflow.get_workflow_by_id.fn("wf1", fields=["status", "output"]))
+
+    mock_function.assert_called_with("workflow/wf1?includeTasks=false&summarize=false")
+    assert result == {"status": "COMPLETED", "output": {"result": 1}}
+
+
+@pytest.mark.asyncio
+async def test_get_workflows_by_ids_reports_per_item_errors(monkeypatch):
+    async def mock_get_json(path):
+        if path.startswith("workflow/missing"):
+            raise http_proxy.ConductorRequestError(httpx.Response(404, text="not found"))
+        return {"workflowId": path.split("/")[1].split("?")[0], "status": "FAILED", "tasks": []}
+
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_get_json)
+
+    result = json.loads(await workflow.get_workflows_by_ids.fn(["wf1", "missing", "wf2"], fields=["status"]))
+
+    assert result == [
+        {"id": "wf1", "result": {"status": "FAILED"}},
+        {"id": "missing", "error": "404: not found"},
+        {"id": "wf2", "result": {"status": "FAILED"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_start_workflow_and_wait_uses_execute_api(monkeypatch):
+    execution = {"workflowId": "w1", "status": "COMPLETED", "output": {"answer": 42}, "tasks": [{"inputData": "big"}]}
+    mock_request = AsyncMock(return_value=httpx.Response(200, json=execution))
+    monkeypatch.setattr(http_proxy, "http_request", mock_request)
+
+    result = json.loads(await workflow.start_workflow_and_wait.fn(workflow_name="orders", version=2, data={"a": 1}))
+
+    path = mock_request.call_args.args[1]
+    assert path.startswith("workflow/execute/orders/2?requestId=")
+    assert path.endswith("&waitForSeconds=10")
+    assert mock_request.call_args.kwargs["data"]["input"] == {"a": 1}
+    assert result == {"workflowId": "w1", "status": "COMPLETED", "output": {"answer": 42}}
+
+
+@pytest.mark.asyncio
+async def test_start_workflow_and_wait_falls_back_to_polling(monkeypatch):
+    mock_request = AsyncMock(side_effect=[httpx.Response(404), httpx.Response(200, text="w1")])
+    mock_get = AsyncMock(
+        side_effect=[
+            {"workflowId": "w1", "status": "RUNNING"},
+            {"workflowId": "w1", "status": "FAILED", "reasonForIncompletion": "boom"},
+        ]
+    )
+    monkeypatch.setattr(http_proxy, "http_request", mock_request)
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_get)
+    monkeypatch.setattr(workflow, "POLL_INITIAL_INTERVAL", 0)
+
+    result = json.loads(await workflow.start_workflow_and_wait.fn(workflow_name="orders", version=1))
+
+    assert mock_request.call_args_list[1].args[:2] == ("POST", "workflow")
+    mock_get.assert_called_with("workflow/w1?includeTasks=false&summarize=false")
+    assert mock_get.call_count == 2
+    assert result == {"workflowId": "w1", "status": "FAILED", "output": None, "reasonForIncompletion": "boom"}
+
+
+@pytest.mark.parametrize(
+    "condition,polls,fetches",
+    [("any", 2, 6), ("first_failure", 2, 6), ("all", 3, 7)],
+)
+@pytest.mark.asyncio
+async def test_watch_workflows(condition, polls, fetches, monkeypatch):
+    rounds = {
+        "w1": ["RUNNING", "COMPLETED"],
+        "w2": ["RUNNING", "FAILED"],
+        "w3": ["RUNNING", "RUNNING", "COMPLETED"],
+    }
+
+    async def fake_get(path):
+        workflow_id = path.split("?")[0].split("/")[1]
+        assert path.endswith("?includeTasks=false&summarize=true")
+        return {"status": rounds[workflow_id].pop(0), "reasonForIncompletion": "boom" if workflow_id == "w2" else ""}
+
+    mock_get = AsyncMock(side_effect=fake_get)
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_get)
+    monkeypatch.setattr(workflow, "POLL_INITIAL_INTERVAL", 0)
+    ctx = AsyncMock()
+
+    result = json.loads(await workflow.watch_workflows.fn(["w1", "w2", "w3", "w1"], ctx, condition=condition))
+
+    assert result["condition_met"] is True
+    assert ctx.report_progress.await_count == polls - 1
+    assert result["statuses"]["w2"] == "FAILED"
+    assert result["reasons"] == {"w2": "boom"}
+    # finished executions are not polled again
+    assert mock_get.await_count == fetches
+
+
+@pytest.mark.asyncio
+async def test_watch_workflows_times_out(monkeypatch):
+    monkeypatch.setattr(http_proxy, "http_get_json", AsyncMock(return_value={"status": "RUNNING"}))
+
+    result = json.loads(await workflow.watch_workflows.fn(["w1"], AsyncMock(), timeout_seconds=0))
+
+    assert result["condition_met"] is False
+    assert result["statuses"] == {"w1": "RUNNING"}
+
+
+@pytest.mark.asyncio
+async def test_watch_workflows_reports_errors_and_stops_when_nothing_can_be_read(monkeypatch):
+    unauthorized = http_proxy.ConductorRequestError(httpx.Response(401, text="Token expired"))
+    mock_get = AsyncMock(side_effect=[{"status": "RUNNING"}, unauthorized, unauthorized, unauthorized])
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_get)
+    monkeypatch.setattr(workflow, "POLL_INITIAL_INTERVAL", 0)
+
+    result = json.loads(await workflow.watch_workflows.fn(["w1", "w2"], AsyncMock(), timeout_seconds=60))
+
+    assert result["condition_met"] is False
+    assert result["statuses"] == {"w1": "RUNNING", "w2": "UNKNOWN"}
+    assert result["errors"] == {"w1": "401: Token expired", "w2": "401: Token expired"}
+    assert mock_get.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_query_workflow_executions_all_clusters_merges_and_tags(monkeypatch):
+    monkeypatch.setenv("CONDUCTOR_SERVER_URL", "https://us.conductor.test/api")
+    monkeypatch.setenv("CONDUCTOR_CLUSTERS", json.dumps({"eu": {"CONDUCTOR_SERVER_URL": "https://eu.test/api"}}))
+    pages = {
+        "default": {"totalHits": 3, "results": [{"workflowId": "us-1", "startTime": 10}], "nextCursor": "next"},
+        "eu": {"totalHits": 1, "results": [{"workflowId": "eu-1", "startTime": 20}, {"workflowId": "eu-2"}]},
+    }
+
+    async def mock_search(request, max_results):
+        page = pages[clusters.current().name]
+        return {"nextCursor": None, **page}
+
+    monkeypatch.setattr(search, "search", mock_search)
+
+    result = json.loads(
+        await workflow.query_workflow_executions_all_clusters.fn("status=FAILED", sort="startTime:DESC")
+    )
+
+    assert [(execution["cluster"], execution["workflowId"]) for execution in result["results"]] == [
+        ("eu", "eu-1"),
+        ("default", "us-1"),
+        ("eu", "eu-2"),
+    ]
+    assert result["totalHits"] == 4
+    assert result["clusters"]["default"] == {"totalHits": 3, "nextCursor": "next"}
+    assert result["errors"] == {}
+
+
+@pytest.mark.asyncio
+async def test_query_workflow_executions_result_contract(monkeypatch):
+    executions = [{"workflowId": "a", "status": "FAILED"}, {"workflowId": "b", "status": "FAILED"}]
+    mock_get_json = AsyncMock(return_value={"totalHits": 3, "results": executions})
+    monkeypatch.setattr(http_proxy, "http_get_json", mock_get_json)
+
+    result = json.loads(await workflow.query_workflow_executions.fn('status="FAILED"', size=2))
+
+    assert list(result) == ["totalHits", "results", "nextCursor"]
+    assert result["totalHits"] == 3
+    assert result["results"] == executions
+    assert search.SearchRequest.from_cursor(result["nextCursor"]) == search.SearchRequest('status="FAILED"', start=2)
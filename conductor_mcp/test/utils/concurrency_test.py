@@ -0,0 +1,49 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import asyncio
+import pytest
+from conductor_mcp.utils.concurrency import fetch_each, gather_bounded
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_concurrency_and_keeps_order():
+    in_flight = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (5 - item))
+        in_flight -= 1
+        return item * 2
+
+    assert await gather_bounded(range(5), work, 2) == [0, 2, 4, 6, 8]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_each_dedupes_and_returns_partial_results():
+    fetched = []
+
+    async def fetch(item_id):
+        fetched.append(item_id)
+        if item_id == "bad":
+            raise ValueError("404: not found")
+        return {"taskId": item_id}
+
+    results = await fetch_each(["a", "bad", "a", "b"], fetch, 4)
+
+    assert sorted(fetched) == ["a", "b", "bad"]
+    assert results == [
+        {"id": "a", "result": {"taskId": "a"}},
+        {"id": "bad", "error": "404: not found"},
+        {"id": "b", "result": {"taskId": "b"}},
+    ]
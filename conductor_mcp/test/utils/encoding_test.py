@@ -0,0 +1,77 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastmcp import Client
+from conductor_mcp import server
+from conductor_mcp.network import http_proxy, token_manager
+from conductor_mcp.utils import encoding, metrics
+from conductor_mcp.utils.constants import CONDUCTOR_RESPONSE_ENCODING
+
+SEARCH_RESPONSE = json.dumps(
+    {
+        "totalHits": 2,
+        "results": [
+            {"workflowId": "a", "status": "RUNNING", "input": {}, "reasonForIncompletion": None},
+            {"workflowId": "b", "status": "FAILED", "tags": [], "reasonForIncompletion": "boom"},
+        ],
+    },
+    indent=2,
+)
+
+
+def test_compact_strips_nulls_and_empties():
+    encoded = json.loads(encoding.encode(SEARCH_RESPONSE, "compact"))
+
+    assert encoded["results"] == [
+        {"workflowId": "a", "status": "RUNNING"},
+        {"workflowId": "b", "status": "FAILED", "reasonForIncompletion": "boom"},
+    ]
+
+
+def test_table_encodes_lists_of_objects_as_columns_and_rows():
+    encoded = json.loads(encoding.encode(SEARCH_RESPONSE, "table"))
+
+    assert encoded == {
+        "totalHits": 2,
+        "results": {
+            "columns": ["workflowId", "status", "reasonForIncompletion"],
+            "rows": [["a", "RUNNING", None], ["b", "FAILED", "boom"]],
+        },
+    }
+    assert encoding.tabulate([{"a": 1}]) == [{"a": 1}]
+    assert encoding.encode("not json", "table") == "not json"
+
+
+@pytest.mark.asyncio
+async def test_tool_responses_are_encoded(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_RESPONSE_ENCODING, "compact")
+    monkeypatch.setattr(token_manager, "start_background_refresh", lambda: None)
+    monkeypatch.setattr(http_proxy, "http_get", AsyncMock(return_value=SEARCH_RESPONSE))
+    name = "workflow_get_all_workflows"
+    raw_before = metrics.TOOL_RESPONSE_BYTES.value(name=name, stage="raw")
+
+    async with Client(server.mcp) as client:
+        result = await client.call_tool(name, {})
+
+    assert result.content[0].text == encoding.encode(SEARCH_RESPONSE, "compact")
+    assert metrics.TOOL_RESPONSE_BYTES.value(name=name, stage="raw") == raw_before + len(SEARCH_RESPONSE)
+    assert metrics.TOOL_RESPONSE_BYTES.value(name=name, stage="compact") < len(SEARCH_RESPONSE)
+
+
+@pytest.mark.asyncio
+async def test_unknown_encoding_is_rejected_before_the_tool_runs(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_RESPONSE_ENCODING, "yaml")
+    call_next = AsyncMock()
+
+    with pytest.raises(ValueError, match="raw, compact, table"):
+        await encoding.EncodingMiddleware().on_call_tool(MagicMock(), call_next)
+    call_next.assert_not_awaited()
@@ -0,0 +1,93 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import pytest
+from unittest.mock import AsyncMock
+from fastmcp import Client
+from pytest_httpx import HTTPXMock
+from conductor_mcp import server
+from conductor_mcp.network import blobs, http_proxy, token_manager
+from conductor_mcp.utils import metrics
+from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL
+
+TEST_URL = "https://some_test_url/api"
+
+
+async def mock_token_retriever():
+    return "test_tolkien"
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("workflow/5f1c9e2a-0b1d-4f7e-9a43-1c2d3e4f5a6b?includeTasks=true", "workflow/{id}"),
+        ("workflow/abc/pause", "workflow/{id}/pause"),
+        ("workflow/bulk/retry", "workflow/bulk/retry"),
+        ("metadata/taskdefs/my_task?metadata=false", "metadata/taskdefs/{id}"),
+        ("tasks/queue/all", "tasks/queue/all"),
+    ],
+)
+def test_endpoint_template(path, expected):
+    assert metrics.endpoint_template(path) == expected
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = metrics.Histogram("test_latency", "test", ("name",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, name="a")
+    histogram.observe(0.5, name="a")
+    histogram.observe(5, name="a")
+
+    rendered = "\n".join(histogram.render())
+
+    assert 'test_latency_bucket{name="a",le="0.1"} 1' in rendered
+    assert 'test_latency_bucket{name="a",le="1.0"} 2' in rendered
+    assert 'test_latency_bucket{name="a",le="+Inf"} 3' in rendered
+    assert 'test_latency_count{name="a"} 3' in rendered
+
+
+@pytest.mark.asyncio
+async def test_upstream_requests_are_recorded(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+    httpx_mock.add_response(url=TEST_URL + "/tasks/abc/log", text="[]")
+    before = metrics.UPSTREAM_LATENCY.count(method="GET", endpoint="tasks/{id}/log", status="200")
+
+    await http_proxy.http_get("tasks/abc/log")
+
+    assert metrics.UPSTREAM_LATENCY.count(method="GET", endpoint="tasks/{id}/log", status="200") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_recorded(monkeypatch):
+    monkeypatch.setattr(token_manager, "start_background_refresh", lambda: None)
+    monkeypatch.setattr(http_proxy, "http_get", AsyncMock(return_value="[]"))
+    before = metrics.TOOL_CALLS.value(kind="tool", name="workflow_get_all_workflows", outcome="ok")
+
+    async with Client(server.mcp) as client:
+        await client.call_tool("workflow_get_all_workflows", {})
+        rendered = (await client.read_resource("conductor://resource/server/metrics"))[0].text
+
+    assert metrics.TOOL_CALLS.value(kind="tool", name="workflow_get_all_workflows", outcome="ok") == before + 1
+    assert "conductor_mcp_invocation_duration_seconds_bucket" in rendered
+
+
+@pytest.mark.asyncio
+async def test_templated_resources_are_labelled_by_template(monkeypatch):
+    monkeypatch.setattr(token_manager, "start_background_refresh", lambda: None)
+    monkeypatch.setattr(blobs, "_store", blobs.BlobStore(max_count=4, max_bytes=1024))
+    template = "conductor://resource/blobs/{blob_id}/{offset}/{length}"
+    before = metrics.TOOL_CALLS.value(kind="resource", name=template, outcome="error")
+
+    async with Client(server.mcp) as client:
+        for offset in range(3):
+            with pytest.raises(Exception):
+                await client.read_resource(f"conductor://resource/blobs/missing/{offset}/10")
+
+    assert metrics.TOOL_CALLS.value(kind="resource", name=template, outcome="error") == before + 3
+    assert "conductor://resource/blobs/missing/0/10" not in metrics.render()
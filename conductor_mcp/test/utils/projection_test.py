@@ -0,0 +1,79 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import pytest
+from conductor_mcp.utils import projection
+
+EXECUTION = {
+    "workflowId": "wf1",
+    "status": "FAILED",
+    "input": {"small": 1},
+    "tasks": [
+        {"taskReferenceName": "a", "status": "COMPLETED", "outputData": {"blob": "x" * 1000}},
+        {"taskReferenceName": "b", "status": "FAILED", "reasonForIncompletion": "boom", "outputData": {}},
+    ],
+}
+
+
+def test_project_keeps_dotted_fields_through_lists():
+    projected = projection.project(EXECUTION, ["status", "tasks.taskReferenceName", "tasks.status"])
+
+    assert projected == {
+        "status": "FAILED",
+        "tasks": [{"taskReferenceName": "a", "status": "COMPLETED"}, {"taskReferenceName": "b", "status": "FAILED"}],
+    }
+
+
+def test_filter_tasks_by_status():
+    execution = projection.filter_tasks(dict(EXECUTION), projection.FAILED_TASK_STATUSES)
+
+    assert [task["taskReferenceName"] for task in execution["tasks"]] == ["b"]
+
+
+def test_summarize_payloads_replaces_only_large_payloads():
+    execution = projection.summarize_payloads({**EXECUTION, "tasks": [dict(task) for task in EXECUTION["tasks"]]})
+
+    assert execution["input"] == {"small": 1}
+    assert execution["tasks"][0]["outputData"]["_size"] > 1000
+    assert len(execution["tasks"][0]["outputData"]["_sha256"]) == 16
+
+
+def test_needs_tasks():
+    assert projection.needs_tasks(None)
+    assert projection.needs_tasks(["status", "tasks.status"])
+    assert not projection.needs_tasks(["status", "output"])
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("$.status", ["FAILED"]),
+        ("$.tasks[*].taskReferenceName", ["a", "b", "c"]),
+        ("$.tasks[-1].status", ["FAILED"]),
+        ("$.tasks[0:2]['status']", ["COMPLETED", "COMPLETED"]),
+        ("$.output.*", [1, 2]),
+        ("$.missing.status", []),
+    ],
+)
+def test_json_path(expression, expected):
+    document = {
+        "status": "FAILED",
+        "output": {"x": 1, "y": 2},
+        "tasks": [
+            {"taskReferenceName": "a", "status": "COMPLETED"},
+            {"taskReferenceName": "b", "status": "COMPLETED"},
+            {"taskReferenceName": "c", "status": "FAILED"},
+        ],
+    }
+    assert projection.json_path(document, expression) == expected
+
+
+def test_json_path_rejects_unsupported_syntax():
+    with pytest.raises(ValueError):
+        projection.json_path({}, "$..status")
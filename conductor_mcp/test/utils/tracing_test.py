@@ -0,0 +1,80 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import json
+import pytest
+from pytest_httpx import HTTPXMock
+from conductor_mcp.network import http_proxy, token_manager
+from conductor_mcp.utils import tracing
+from conductor_mcp.utils.constants import CONDUCTOR_SERVER_URL, CONDUCTOR_TRACE_FILE, CONDUCTOR_TRACING
+
+TEST_URL = "https://some_test_url/api"
+RUNNING = '{"status": "RUNNING"}'
+
+
+async def mock_token_retriever():
+    return "test_tolkien"
+
+
+def test_tracing_is_off_by_default(monkeypatch):
+    monkeypatch.delenv(CONDUCTOR_TRACING, raising=False)
+    headers = {}
+
+    assert tracing.configure() is False
+    with tracing.span("tool anything", **{"mcp.name": "anything"}) as span:
+        tracing.set_attributes(span, status=200)
+        tracing.inject(headers)
+
+    assert span is None
+    assert headers == {}
+
+
+def test_unknown_tracing_mode_is_rejected(monkeypatch):
+    monkeypatch.setenv(CONDUCTOR_TRACING, "jaeger")
+
+    with pytest.raises(ValueError, match="off, otlp, file"):
+        tracing.configure()
+
+
+def test_tracing_stays_off_without_opentelemetry(monkeypatch, tmp_path):
+    if tracing.trace is not None:
+        pytest.skip("opentelemetry is installed")
+    monkeypatch.setenv(CONDUCTOR_TRACING, "file")
+    monkeypatch.setenv(CONDUCTOR_TRACE_FILE, str(tmp_path / "traces.jsonl"))
+
+    assert tracing.configure() is False
+    assert not tracing.enabled()
+
+
+@pytest.mark.asyncio
+async def test_requests_are_traced_to_a_file(httpx_mock: HTTPXMock, monkeypatch, tmp_path):
+    pytest.importorskip("opentelemetry.sdk")
+    trace_file = tmp_path / "traces.jsonl"
+    monkeypatch.setenv(CONDUCTOR_SERVER_URL, TEST_URL)
+    monkeypatch.setenv(CONDUCTOR_TRACING, "file")
+    monkeypatch.setenv(CONDUCTOR_TRACE_FILE, str(trace_file))
+    monkeypatch.setattr(token_manager, "get_token", mock_token_retriever)
+    httpx_mock.add_response(url=TEST_URL + "/workflow/abc?includeTasks=false", text=RUNNING)
+
+    assert tracing.configure() is True
+    opened = tracing._trace_file
+    try:
+        with tracing.span("tool workflow_get_workflow_by_id", kind="server") as parent:
+            await http_proxy.http_get_json("workflow/abc?includeTasks=false")
+        trace_id = format(parent.get_span_context().trace_id, "032x")
+    finally:
+        tracing.shutdown()
+
+    assert opened.closed
+    spans = {span["name"]: span for span in map(json.loads, trace_file.read_text().splitlines())}
+    request_span = spans["GET workflow/{id}"]
+    assert request_span["parent_id"] == spans["tool workflow_get_workflow_by_id"]["context"]["span_id"]
+    assert request_span["attributes"]["http.response.status_code"] == 200
+    assert request_span["attributes"]["http.response.body.size"] == len(RUNNING)
+    assert trace_id in httpx_mock.get_requests()[0].headers["traceparent"]
@@ -0,0 +1,355 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+MCP tools that aggregate many workflow executions on the server, returning compact statistics instead of raw
+executions.
+"""
+
+import json
+import re
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from fastmcp import FastMCP
+from conductor_mcp.network import http_proxy, search
+from conductor_mcp.network.search import SearchRequest
+from conductor_mcp.utils.concurrency import batch_concurrency, gather_bounded
+from conductor_mcp.utils.projection import FAILED_TASK_STATUSES
+from conductor_mcp.utils.stats import distribution
+
+analytics_mcp = FastMCP("Analytics Service")
+
+MAX_EXECUTIONS = 500
+# DO_WHILE iterations are reported as ref__1, ref__2, ...
+ITERATION_SUFFIX = re.compile(r"__\d+$")
+
+MAX_FAILURES = 10000
+MAX_CLUSTERS = 500
+MAX_SAMPLE_IDS = 3
+MAX_CLUSTER_WORKFLOW_TYPES = 10
+MAX_SIGNATURE_LENGTH = 300
+OTHER_CLUSTER = "<other errors>"
+# Applied in order, so that ids and timestamps are replaced before their digits are
+NORMALIZATION_PATTERNS = [
+    (re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"), "<id>"),
+    (re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?"), "<ts>"),
+    (re.compile(r"\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{12,}\b"), "<id>"),
+    (re.compile(r"\d+(\.\d+)?"), "<n>"),
+    (re.compile(r"\s+"), " "),
+]
+
+TASK_STATS_COLUMNS = [
+    "taskReferenceName",
+    "taskType",
+    "runs",
+    "duration_p50_ms",
+    "duration_p95_ms",
+    "duration_max_ms",
+    "queue_wait_p50_ms",
+    "queue_wait_p95_ms",
+    "queue_wait_max_ms",
+    "retries",
+    "failure_rate",
+]
+
+
+@dataclass
+class TaskSamples:
+    task_type: str
+    runs: int = 0
+    failures: int = 0
+    retries: int = 0
+    durations: List[float] = field(default_factory=list)
+    queue_waits: List[float] = field(default_factory=list)
+
+
+def _accumulate(samples: Dict[str, TaskSamples], execution: Dict[str, Any]):
+    """Folds the tasks of one execution into the per-reference samples, keeping only the numbers"""
+    for task in execution.get("tasks") or []:
+        reference = ITERATION_SUFFIX.sub("", task.get("referenceTaskName") or task.get("taskReferenceName") or "?")
+        entry = samples.get(reference)
+        if entry is None:
+            entry = samples[reference] = TaskSamples(task_type=task.get("taskType", ""))
+        entry.runs += 1
+        entry.retries += 1 if task.get("retryCount", 0) > 0 else 0
+        entry.failures += 1 if task.get("status") in FAILED_TASK_STATUSES else 0
+        scheduled, started, ended = task.get("scheduledTime", 0), task.get("startTime", 0), task.get("endTime", 0)
+        if started and ended and ended >= started:
+            entry.durations.append(ended - started)
+        if scheduled and started and started >= scheduled:
+            entry.queue_waits.append(started - scheduled)
+
+
+async def _fetch_executions(workflow_ids: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Fetches executions with tasks but with summarized payloads
+
+    :return: The executions keyed by workflow id, and the error message of every one that could not be fetched
+    """
+    concurrency = batch_concurrency()
+    results = await gather_bounded(
+        workflow_ids,
+        lambda workflow_id: http_proxy.http_get_json(f"workflow/{workflow_id}?includeTasks=true&summarize=true"),
+        concurrency,
+    )
+    executions, errors = {}, {}
+    for workflow_id, result in zip(workflow_ids, results):
+        if isinstance(result, Exception):
+            errors[workflow_id] = str(result) or type(result).__name__
+        else:
+            executions[workflow_id] = result
+    return executions, errors
+
+
+def fetch_errors(errors: Dict[str, str]) -> Dict[str, Any]:
+    """Summarizes the executions that could not be fetched as a count and a few samples"""
+    return {"count": len(errors), "samples": dict(list(errors.items())[:MAX_SAMPLE_IDS])}
+
+
+async def recent_executions(
+    workflow_name: str, last_n: int, status: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """Fetches the most recent executions of a workflow, with tasks but with summarized payloads
+
+    :return: The executions, and the error message of every one that could not be fetched
+    """
+    query = f'workflowType="{workflow_name}"' + (f' AND status="{status}"' if status else "")
+    ids = []
+    async for _, _, page in search.iter_search_pages(SearchRequest(query=query, sort="startTime:DESC"), last_n):
+        ids.extend(result["workflowId"] for result in page)
+
+    executions, errors = await _fetch_executions(ids)
+    return list(executions.values()), errors
+
+
+@analytics_mcp.tool()
+async def get_task_duration_stats(workflow_name: str, last_n: int = 50, status: Optional[str] = None) -> str:
+    """Computes per-task duration, queue wait, retry and failure statistics over the recent executions of a workflow.
+
+    Use this to find bottleneck tasks or estimate completion times instead of reading raw executions. Returns
+    workflow level duration percentiles and a table with one row per taskReferenceName (DO_WHILE iterations are
+    merged), sorted by p95 duration. All durations are in milliseconds. Executions that could not be fetched are left
+    out of the statistics and counted in "fetch_errors", with a few sample errors.
+
+    Args:
+        workflow_name: The name of the workflow definition to analyze
+        last_n: How many of the most recent executions to analyze (default: 50, max: 500)
+        status: Optional execution status to restrict the analysis to, e.g. COMPLETED
+    """
+    executions, errors = await recent_executions(workflow_name, min(last_n, MAX_EXECUTIONS), status)
+
+    samples: Dict[str, TaskSamples] = {}
+    workflow_durations = []
+    statuses: Dict[str, int] = defaultdict(int)
+    for execution in executions:
+        statuses[execution.get("status", "UNKNOWN")] += 1
+        started, ended = execution.get("startTime", 0), execution.get("endTime", 0)
+        if started and ended and ended >= started:
+            workflow_durations.append(ended - started)
+        _accumulate(samples, execution)
+
+    rows = []
+    for reference, entry in samples.items():
+        duration = distribution(entry.durations)
+        queue_wait = distribution(entry.queue_waits)
+        rows.append(
+            [
+                reference,
+                entry.task_type,
+                entry.runs,
+                duration["p50"],
+                duration["p95"],
+                duration["max"],
+                queue_wait["p50"],
+                queue_wait["p95"],
+                queue_wait["max"],
+                entry.retries,
+                round(entry.failures / entry.runs, 4),
+            ]
+        )
+    rows.sort(key=lambda row: row[4], reverse=True)
+
+    return json.dumps(
+        {
+            "workflow": workflow_name,
+            "executions": len(executions),
+            "statuses": statuses,
+            "workflow_duration_ms": distribution(workflow_durations),
+            "columns": TASK_STATS_COLUMNS,
+            "rows": rows,
+            "fetch_errors": fetch_errors(errors),
+        }
+    )
+
+
+def epoch_millis(value: Any) -> int:
+    """Reads a timestamp as unix millis, search summaries carry ISO-8601 strings where executions carry numbers"""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    if value.isdigit():
+        return int(value)
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return 0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+def normalize_error(message: str) -> str:
+    """Reduces an error message to a signature by stripping ids, timestamps and numbers"""
+    for pattern, replacement in NORMALIZATION_PATTERNS:
+        message = pattern.sub(replacement, message)
+    return message.strip()[:MAX_SIGNATURE_LENGTH]
+
+
+@dataclass
+class FailureCluster:
+    signature: str
+    count: int = 0
+    first_seen: int = 0
+    last_seen: int = 0
+    workflow_types: Dict[str, int] = field(default_factory=dict)
+    failed_tasks: Dict[str, int] = field(default_factory=dict)
+    sample_ids: List[str] = field(default_factory=list)
+
+    def add(self, workflow_id: str, workflow_type: str, failed_tasks: List[str], seen_at: int):
+        self.count += 1
+        self.first_seen = min(self.first_seen, seen_at) if self.first_seen else seen_at
+        self.last_seen = max(self.last_seen, seen_at)
+        if workflow_type in self.workflow_types or len(self.workflow_types) < MAX_CLUSTER_WORKFLOW_TYPES:
+            self.workflow_types[workflow_type] = self.workflow_types.get(workflow_type, 0) + 1
+        for task in failed_tasks:
+            if task in self.failed_tasks or len(self.failed_tasks) < MAX_CLUSTER_WORKFLOW_TYPES:
+                self.failed_tasks[task] = self.failed_tasks.get(task, 0) + 1
+        if len(self.sample_ids) < MAX_SAMPLE_IDS:
+            self.sample_ids.append(workflow_id)
+
+
+class FailureClusters:
+    """Incrementally groups failures by normalized error, holding at most MAX_CLUSTERS clusters in memory"""
+
+    def __init__(self, max_clusters: int = MAX_CLUSTERS):
+        self.max_clusters = max_clusters
+        self.clusters: Dict[str, FailureCluster] = {}
+        self.failures = 0
+
+    def add(self, message: str, workflow_id: str, workflow_type: str, failed_tasks: List[str], seen_at: int):
+        self.failures += 1
+        signature = normalize_error(message or "") or "<no reason given>"
+        cluster = self.clusters.get(signature)
+        if cluster is None:
+            if len(self.clusters) >= self.max_clusters:
+                signature = OTHER_CLUSTER
+                cluster = self.clusters.get(signature)
+            if cluster is None:
+                cluster = self.clusters[signature] = FailureCluster(signature=signature)
+        cluster.add(workflow_id, workflow_type, failed_tasks, seen_at)
+
+    def top(self, top_n: int) -> List[Dict[str, Any]]:
+        ranked = sorted(self.clusters.values(), key=lambda cluster: cluster.count, reverse=True)[:top_n]
+        return [
+            {
+                "signature": cluster.signature,
+                "count": cluster.count,
+                "first_seen": cluster.first_seen,
+                "last_seen": cluster.last_seen,
+                "workflow_types": cluster.workflow_types,
+                "failed_tasks": cluster.failed_tasks,
+                "sample_ids": cluster.sample_ids,
+            }
+            for cluster in ranked
+        ]
+
+
+async def _failed_task_errors(
+    workflow_ids: List[str],
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+    """Fetches the failed tasks of a page of executions, keeping only their reference names and reasons
+
+    :return: The failed tasks keyed by workflow id, and the error message of every execution that could not be fetched
+    """
+    executions, fetch_failures = await _fetch_executions(workflow_ids)
+    errors = {}
+    for workflow_id, execution in executions.items():
+        errors[workflow_id] = [
+            {"task": task.get("referenceTaskName", ""), "reason": task.get("reasonForIncompletion") or ""}
+            for task in execution.get("tasks") or []
+            if task.get("status") in FAILED_TASK_STATUSES
+        ]
+    return errors, fetch_failures
+
+
+@analytics_mcp.tool()
+async def cluster_failures(
+    hours: float = 24,
+    workflow_name: Optional[str] = None,
+    include_task_errors: bool = False,
+    max_failures: int = 2000,
+    top_n: int = 20,
+) -> str:
+    """Groups recent workflow failures into clusters of similar errors for triage.
+
+    Failed executions are streamed page by page; their reasonForIncompletion (and optionally the error of each failed
+    task) is normalized by stripping ids, timestamps and numbers, and identical signatures are counted together. Each
+    cluster reports its count, first/last seen epoch millis, affected workflow types and failed tasks, and a few
+    sample workflow ids to inspect with get_workflows_by_ids. "scanned" counts failed executions and "clustered_errors"
+    the errors grouped, which is larger when task errors are included. Executions whose task errors could not be
+    fetched are clustered by their reasonForIncompletion and counted in "fetch_errors".
+
+    Args:
+        hours: How many hours to look back from now (default: 24)
+        workflow_name: Optional workflow name to restrict the analysis to
+        include_task_errors: Also fetch each failed execution and cluster the errors of its failed tasks. More precise,
+            but costs one extra request per failed workflow
+        max_failures: The maximum number of failed executions to scan (default: 2000, max: 10000)
+        top_n: The number of largest clusters to return (default: 20)
+    """
+    since = int((time.time() - hours * 3600) * 1000)
+    query = f'status="FAILED" AND startTime>{since}'
+    if workflow_name:
+        query += f' AND workflowType="{workflow_name}"'
+
+    clusters = FailureClusters()
+    total_hits = scanned = 0
+    fetch_failures: Dict[str, str] = {}
+    request = SearchRequest(query=query, sort="startTime:DESC")
+    async for _, total_hits, page in search.iter_search_pages(request, min(max_failures, MAX_FAILURES)):
+        task_errors = {}
+        if include_task_errors:
+            task_errors, failed = await _failed_task_errors([result["workflowId"] for result in page])
+            fetch_failures.update(failed)
+        scanned += len(page)
+        for result in page:
+            workflow_id = result["workflowId"]
+            workflow_type = result.get("workflowType", "")
+            seen_at = epoch_millis(result.get("updateTime")) or epoch_millis(result.get("startTime"))
+            failed_tasks = [task for task in (result.get("failedReferenceTaskNames") or "").split(",") if task]
+            errors = task_errors.get(workflow_id)
+            if errors:
+                for error in errors:
+                    clusters.add(error["reason"], workflow_id, workflow_type, [error["task"]], seen_at)
+            else:
+                clusters.add(result.get("reasonForIncompletion"), workflow_id, workflow_type, failed_tasks, seen_at)
+
+    return json.dumps(
+        {
+            "since": since,
+            "total_failed": total_hits,
+            "scanned": scanned,
+            "clustered_errors": clusters.failures,
+            "clusters": clusters.top(top_n),
+            "fetch_errors": fetch_errors(fetch_failures),
+        }
+    )
@@ -0,0 +1,40 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import asyncio
+import json
+from typing import Optional
+from fastmcp import FastMCP
+from conductor_mcp.network import blobs
+
+blob_mcp = FastMCP("Blob Service")
+
+DEFAULT_PAGE_BYTES = blobs.MAX_PAGE_BYTES
+
+
+@blob_mcp.tool()
+async def read_blob(
+    blob_id: str, offset: int = 0, length: int = DEFAULT_PAGE_BYTES, json_path: Optional[str] = None
+) -> str:
+    """Reads a response that was too large to return directly, identified by the blob_id of its summary.
+
+    Either pass a JSONPath expression to extract just the parts needed, e.g. "$.status", "$.tasks[*].status" or
+    "$.tasks[0:10]", or read the raw text page by page, passing the returned next_offset as the next offset.
+
+    Args:
+        blob_id: The blob_id from the summary returned in place of the large response
+        offset: The byte offset to start reading from (default: 0)
+        length: The number of bytes to read, at most 65536 (default: 65536)
+        json_path: Optional JSONPath expression, supporting $, .name, ['name'], [index], [start:end] and * wildcards
+    """
+    store = blobs.get_store()
+    if json_path is not None:
+        matches = await asyncio.to_thread(store.extract, blob_id, json_path)
+        return json.dumps({"blob_id": blob_id, "json_path": json_path, "matches": matches})
+    return json.dumps(await asyncio.to_thread(store.read, blob_id, offset, length))
@@ -0,0 +1,117 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+MCP tools that answer questions across all workflow and task definitions from the local metadata index.
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import Any, Dict, List, Optional
+from fastmcp import FastMCP
+from conductor_mcp.network import metadata_index
+
+metadata_mcp = FastMCP("Metadata Index Service")
+
+
+@metadata_mcp.tool()
+async def find_workflows_using_task(task_name: str) -> str:
+    """Finds every workflow definition (all versions) that uses a task, including tasks nested in switch, fork and
+    do while tasks.
+
+    Answered from a local index of the definitions, so prefer this over fetching every workflow definition.
+
+    Args:
+        task_name: The name of the task definition, e.g. "send_email"
+    """
+    index = metadata_index.get_index()
+    await index.ensure_synced()
+    return json.dumps(await asyncio.to_thread(index.workflows_using_task, task_name))
+
+
+@metadata_mcp.tool()
+async def find_http_tasks(uri_fragment: str) -> str:
+    """Finds every HTTP task whose uri contains the given text, e.g. a host name such as "api.example.com".
+
+    Args:
+        uri_fragment: Text to look for in the uri of HTTP tasks
+    """
+    index = metadata_index.get_index()
+    await index.ensure_synced()
+    return json.dumps(await asyncio.to_thread(index.http_tasks, uri_fragment))
+
+
+@metadata_mcp.tool()
+async def get_sub_workflow_graph(workflow_name: Optional[str] = None) -> str:
+    """Gets which workflows start which other workflows through SUB_WORKFLOW tasks.
+
+    With a workflow_name, returns the workflows it calls (directly or indirectly) and the workflows that call it.
+    Without one, returns every sub-workflow edge. Each edge names the parent workflow and version, the task reference
+    name and the sub-workflow name and version.
+
+    Args:
+        workflow_name: Optional name of the workflow to center the graph on
+    """
+    index = metadata_index.get_index()
+    await index.ensure_synced()
+    edges = await asyncio.to_thread(index.sub_workflow_edges)
+    if workflow_name is None:
+        return json.dumps({"edges": edges})
+    return json.dumps(
+        {
+            "calls": _reachable(edges, workflow_name, "workflow_name", "sub_workflow_name"),
+            "called_by": _reachable(edges, workflow_name, "sub_workflow_name", "workflow_name"),
+        }
+    )
+
+
+def _reachable(edges: List[Dict[str, Any]], start: str, source: str, target: str) -> List[Dict[str, Any]]:
+    """The edges reachable from a workflow, following them from source to target"""
+    reachable = []
+    seen = {start}
+    pending = deque([start])
+    while pending:
+        name = pending.popleft()
+        for edge in edges:
+            if edge[source] != name:
+                continue
+            reachable.append(edge)
+            if edge[target] not in seen:
+                seen.add(edge[target])
+                pending.append(edge[target])
+    return reachable
+
+
+@metadata_mcp.tool()
+async def search_definitions(text: str, limit: int = 20) -> str:
+    """Full-text search over the names and descriptions of all workflow and task definitions.
+
+    Args:
+        text: The words to search for
+        limit: The maximum number of matches to return (default: 20)
+    """
+    if not text.strip():
+        raise ValueError("text must not be empty")
+    index = metadata_index.get_index()
+    await index.ensure_synced()
+    return json.dumps(await asyncio.to_thread(index.search, text, limit))
+
+
+@metadata_mcp.tool()
+async def sync_metadata_index(full: bool = False) -> str:
+    """Syncs the local index of workflow and task definitions with Conductor now.
+
+    The index syncs itself periodically, call this after changing definitions to see the changes immediately.
+    Definitions that could not be read are listed under workflows_failed and retried on the next sync.
+
+    Args:
+        full: If True, re-fetch every definition instead of only the ones whose version or updateTime changed
+    """
+    return json.dumps(await metadata_index.get_index().sync(full))
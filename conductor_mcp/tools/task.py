@@ -7,9 +7,13 @@
 #  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 #  specific language governing permissions and limitations under the License.
 
+import json
 from typing import Dict, Any, List, Literal, Optional
 from fastmcp import FastMCP, Context
-from conductor_mcp.network.http_proxy import http_get, http_post
+from conductor_mcp.network import queue_sampler
+from conductor_mcp.network.clusters import fan_out
+from conductor_mcp.network.http_proxy import http_get, http_get_json, http_post
+from conductor_mcp.utils.concurrency import batch_concurrency, fetch_each
 
 
 task_mcp = FastMCP("Task Service")
@@ -26,6 +30,20 @@ async def get_task_by_id(task_id: str, ctx: Context) -> str:
     return await http_get(path)
 
 
+@task_mcp.tool()
+async def get_tasks_by_ids(task_ids: List[str]) -> str:
+    """Gets many conductor workflow tasks in a single call, fetching them concurrently.
+
+    Use this instead of calling get_task_by_id once per task. Returns a JSON list with one {"id": ..., "result": {...}}
+    entry per unique id, in the order given, or {"id": ..., "error": "..."} for tasks that could not be fetched.
+
+    Args:
+        task_ids: The uuids representing the task ids
+    """
+    concurrency = batch_concurrency()
+    return json.dumps(await fetch_each(task_ids, lambda task_id: http_get_json(f"tasks/{task_id}"), concurrency))
+
+
 @task_mcp.tool()
 async def get_task_queue_details() -> str:
     """Gets the current status details for all conductor workflow task queues"""
@@ -33,6 +51,63 @@ async def get_task_queue_details() -> str:
     return await http_get(path)
 
 
+@task_mcp.tool()
+async def get_task_queue_details_all_clusters(clusters: Optional[List[str]] = None) -> str:
+    """Gets the task queue depths of every configured Conductor cluster, queried concurrently.
+
+    Returns {"queues": [{"cluster", "queue", "depth"}, ...], "totals": {cluster: depth}, "errors": {...}} with the
+    deepest queues first.
+
+    Args:
+        clusters: Optional names of the clusters to query, every configured cluster when omitted
+    """
+    depths, errors = await fan_out(lambda: http_get_json("tasks/queue/all"), clusters)
+    queues = [
+        {"cluster": name, "queue": queue, "depth": depth}
+        for name, cluster_depths in depths.items()
+        for queue, depth in cluster_depths.items()
+    ]
+    queues.sort(key=lambda row: row["depth"], reverse=True)
+    totals = {name: sum(cluster_depths.values()) for name, cluster_depths in depths.items()}
+    return json.dumps({"queues": queues, "totals": totals, "errors": errors})
+
+
+@task_mcp.tool()
+async def get_task_queue_trends(window_minutes: float = 15, top_n: int = 10) -> str:
+    """Gets how the task queues changed over a recent window: growth per minute, time to drain and the fastest growing.
+
+    Use this instead of calling get_task_queue_details repeatedly to tell a growing backlog from a stable one. Queue
+    depths are sampled in the background (every 30 seconds by default); if sampling was not already running, the
+    first call starts it and only the current depths are known, so call again after a few minutes.
+
+    Args:
+        window_minutes: How many minutes of samples to analyze (default: 15)
+        top_n: The number of fastest growing and of deepest queues to list (default: 10)
+    """
+    sampler = queue_sampler.get_sampler()
+    if not sampler.running:
+        await sampler.sample()
+        sampler.start(delay=sampler.interval)
+
+    trends = sampler.history.trends(window_minutes * 60)
+    growing = sorted(
+        (trend for trend in trends if trend["growth_per_minute"] > 0),
+        key=lambda trend: trend["growth_per_minute"],
+        reverse=True,
+    )
+    return json.dumps(
+        {
+            "samples": sampler.history.size,
+            "sample_seconds": sampler.interval,
+            "window_minutes": window_minutes,
+            "top_growing": growing[:top_n],
+            "backlog": sum(trend["depth"] for trend in trends),
+            "queue_count": len(trends),
+            "deepest": sorted(trends, key=lambda trend: trend["depth"], reverse=True)[:top_n],
+        }
+    )
+
+
 @task_mcp.tool()
 async def get_all_task_definitions() -> str:
     """Gets all task definitions"""
@@ -66,6 +141,20 @@ async def get_task_logs(task_id: str) -> str:
     return await http_get(path)
 
 
+@task_mcp.tool()
+async def get_task_logs_by_ids(task_ids: List[str]) -> str:
+    """Gets the execution logs of many tasks in a single call, fetching them concurrently.
+
+    Use this instead of calling get_task_logs once per task. Returns a JSON list with one {"id": ..., "result": [...]}
+    entry per unique id, in the order given, or {"id": ..., "error": "..."} for tasks whose logs could not be fetched.
+
+    Args:
+        task_ids: The uuids representing the task execution ids
+    """
+    concurrency = batch_concurrency()
+    return json.dumps(await fetch_each(task_ids, lambda task_id: http_get_json(f"tasks/{task_id}/log"), concurrency))
+
+
 @task_mcp.tool()
 async def update_task_status(
     task_id: str,
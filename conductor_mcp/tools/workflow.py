@@ -6,12 +6,42 @@
 #  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
 #  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 #  specific language governing permissions and limitations under the License.
-from typing import Literal, Dict, Any, Optional
-from fastmcp import FastMCP
-from conductor_mcp.network import http_proxy
+import asyncio
+import json
+import time
+import uuid
+from typing import Literal, Dict, Any, Optional, List, Callable, Tuple
+import httpx
+from fastmcp import Context, FastMCP
+from conductor_mcp.network import http_proxy, search
+from conductor_mcp.network.clusters import fan_out
+from conductor_mcp.network.search import SearchRequest
+from conductor_mcp.utils import projection
+from conductor_mcp.utils.concurrency import batch_concurrency, fetch_each, gather_bounded
 
 workflow_mcp = FastMCP("Workflow Service")
 
+# Conductor rejects bulk requests with more than 1000 workflow ids
+BULK_CHUNK_SIZE = 1000
+TERMINAL_WORKFLOW_STATUSES = ("COMPLETED", "FAILED", "TERMINATED", "TIMED_OUT")
+# watched ids that do not exist can never finish, so they are treated as finished
+WATCH_FINISHED_STATUSES = TERMINAL_WORKFLOW_STATUSES + ("NOT_FOUND",)
+TERMINAL_TASK_STATUSES = (
+    "COMPLETED",
+    "COMPLETED_WITH_ERRORS",
+    "FAILED",
+    "FAILED_WITH_TERMINAL_ERROR",
+    "TIMED_OUT",
+    "CANCELED",
+    "SKIPPED",
+)
+# the execute API holds the request open for at most this long, longer waits continue by polling
+SYNC_WAIT_MAX_SECONDS = 10
+POLL_INITIAL_INTERVAL = 0.5
+POLL_MAX_INTERVAL = 5.0
+POLL_BACKOFF = 1.5
+FAILED_WORKFLOW_STATUSES = ("FAILED", "TERMINATED", "TIMED_OUT")
+
 
 @workflow_mcp.tool()
 async def create_workflow_definition(workflow_definition: Dict[str, Any]) -> str:
@@ -182,7 +212,16 @@ async def create_workflow_definition(workflow_definition: Dict[str, Any]) -> str
 
 
 @workflow_mcp.tool()
-async def query_workflow_executions(query: str) -> str:
+async def query_workflow_executions(
+    query: str,
+    free_text: str = "*",
+    sort: Optional[str] = None,
+    start: int = 0,
+    size: int = 100,
+    auto_page: bool = False,
+    max_results: int = 1000,
+    cursor: Optional[str] = None,
+) -> str:
     """Search for workflow (executions) based on payload and other parameters.
     The query parameter accepts exact matches using = and AND operators on the following fields: workflowId, correlationId, workflowType, and status.
     Matches using = can be written as taskType = HTTP. Matches using IN are written as status IN (SCHEDULED, IN_PROGRESS).
@@ -199,6 +238,10 @@ async def query_workflow_executions(query: str) -> str:
     Example call for FAILED or COMPLETED status and workflow named "SimpleWorkflow":
         query_workflow_executions('status IN (FAILED, COMPLETED) AND workflowType="SimpleWorkflow"')
 
+    Results are returned as {"totalHits": ..., "results": [...], "nextCursor": ...}. When nextCursor is not null there
+    are more matching executions; pass it back as the cursor argument to get the next page. The server caps the
+    number and total size of the results returned by a single call.
+
     Args:
         query: A query string, utilizing any of the following fields.
             workflowId: The id of a workflow execution.
@@ -208,20 +251,143 @@ async def query_workflow_executions(query: str) -> str:
             startTime: The start unix timestamp of a workflow.
             status: The status of a workflow execution. One of [RUNNING, PAUSED, COMPLETED, TIMED_OUT, TERMINATED, FAILED].
             endTime: The end unix timestamp of a workflow.
+        free_text: Optional free text search across execution input/output (default: "*")
+        sort: Optional sort order in the form field:ASC|DESC, for example "startTime:DESC"
+        start: The offset of the first result to return
+        size: The number of results to return in a single page (default: 100)
+        auto_page: If True, keep fetching pages until max_results executions have been collected
+        max_results: The number of results to collect when auto_page is True (default: 1000)
+        cursor: The nextCursor value from a previous call. When given, query, free_text, sort and start are ignored.
     """
-    path = f"workflow/search?query={query}"
-    return await http_proxy.http_get(path)
+    request = SearchRequest.from_cursor(cursor) if cursor else SearchRequest(query, free_text, sort, start)
+    return json.dumps(await search.search(request, max_results if auto_page else size))
+
+
+@workflow_mcp.tool()
+async def query_workflow_executions_all_clusters(
+    query: str,
+    free_text: str = "*",
+    sort: Optional[str] = None,
+    max_results_per_cluster: int = 100,
+    clusters: Optional[List[str]] = None,
+) -> str:
+    """Searches for workflow executions on every configured Conductor cluster at once, see query_workflow_executions
+    for the query syntax.
+
+    The clusters are queried concurrently and every execution is tagged with the "cluster" it came from. Results are
+    returned as {"totalHits": ..., "results": [...], "clusters": {name: {"totalHits", "nextCursor"}}, "errors": {...}}.
+    To page further through one cluster, pass its nextCursor to query_workflow_executions with that cluster.
+
+    Args:
+        query: A query string, see query_workflow_executions
+        free_text: Optional free text search across execution input/output (default: "*")
+        sort: Optional sort order in the form field:ASC|DESC, applied to the merged results as well
+        max_results_per_cluster: The number of results to collect from each cluster (default: 100)
+        clusters: Optional names of the clusters to query, every configured cluster when omitted
+    """
+    request = SearchRequest(query, free_text, sort, 0)
+    pages, errors = await fan_out(lambda: search.search(request, max_results_per_cluster), clusters)
+    results = [{**execution, "cluster": name} for name, page in pages.items() for execution in page["results"]]
+    if sort:
+        field, _, direction = sort.partition(":")
+        # executions missing the field sort last in either direction
+        present = [execution for execution in results if execution.get(field) is not None]
+        present.sort(key=lambda execution: execution[field], reverse=direction.upper() == "DESC")
+        results = present + [execution for execution in results if execution.get(field) is None]
+    return json.dumps(
+        {
+            "totalHits": sum(page["totalHits"] for page in pages.values()),
+            "results": results,
+            "clusters": {
+                name: {"totalHits": page["totalHits"], "nextCursor": page["nextCursor"]} for name, page in pages.items()
+            },
+            "errors": errors,
+        }
+    )
 
 
 @workflow_mcp.tool()
-async def get_workflow_by_id(workflow_id: str) -> str:
+async def get_workflow_by_id(
+    workflow_id: str,
+    fields: Optional[List[str]] = None,
+    task_statuses: Optional[List[str]] = None,
+    failed_tasks_only: bool = False,
+    summarize_payloads: bool = False,
+) -> str:
     """Gets a conductor workflow execution in json format based on the workflow's execution id
 
+    Executions with many tasks (e.g. large DO_WHILE loops) can be very large. Use the optional arguments to only
+    return what is needed, for example fields=["status", "reasonForIncompletion", "tasks.taskReferenceName",
+    "tasks.status"] with failed_tasks_only=True when troubleshooting. With these arguments, an execution too large
+    to return directly is parsed from a temporary file. If it is also too large to parse, an error with the summary
+    of that file is raised, and read_blob can page through it instead.
+
     Args:
         workflow_id: The uuid representing the execution of the workflow
+        fields: Optional list of dotted field paths to keep, paths through "tasks" apply to every task
+        task_statuses: Optional list of task statuses to keep, e.g. ["FAILED", "IN_PROGRESS"]
+        failed_tasks_only: If True, only keep tasks that failed, timed out or were canceled
+        summarize_payloads: If True, replace large input/output payloads with their size and a hash
     """
-    path = f"workflow/{workflow_id}?includeTasks=true&summarize=false"
-    return await http_proxy.http_get(path)
+    if not (fields or task_statuses or failed_tasks_only or summarize_payloads):
+        path = f"workflow/{workflow_id}?includeTasks=true&summarize=false"
+        return await http_proxy.http_get(path)
+
+    execution = await http_proxy.http_get_json(_execution_path(workflow_id, fields))
+    return json.dumps(_shape_execution(execution, fields, task_statuses, failed_tasks_only, summarize_payloads))
+
+
+def _execution_path(workflow_id: str, fields: Optional[List[str]]) -> str:
+    # skip downloading the task list entirely when the projection does not need it
+    include_tasks = str(projection.needs_tasks(fields)).lower()
+    return f"workflow/{workflow_id}?includeTasks={include_tasks}&summarize=false"
+
+
+def _shape_execution(
+    execution: Dict[str, Any],
+    fields: Optional[List[str]],
+    task_statuses: Optional[List[str]],
+    failed_tasks_only: bool,
+    summarize_payloads: bool,
+) -> Dict[str, Any]:
+    statuses = list(task_statuses or []) + (list(projection.FAILED_TASK_STATUSES) if failed_tasks_only else [])
+    if statuses:
+        projection.filter_tasks(execution, statuses)
+    if summarize_payloads:
+        projection.summarize_payloads(execution)
+    if fields:
+        execution = projection.project(execution, fields)
+    return execution
+
+
+@workflow_mcp.tool()
+async def get_workflows_by_ids(
+    workflow_ids: List[str],
+    fields: Optional[List[str]] = None,
+    task_statuses: Optional[List[str]] = None,
+    failed_tasks_only: bool = False,
+    summarize_payloads: bool = False,
+) -> str:
+    """Gets many conductor workflow executions in a single call, fetching them concurrently.
+
+    Use this instead of calling get_workflow_by_id once per execution. Returns a JSON list with one
+    {"id": ..., "result": {...}} entry per unique id, in the order given, or {"id": ..., "error": "..."} for
+    executions that could not be fetched.
+
+    Args:
+        workflow_ids: The uuids representing the executions of the workflows
+        fields: Optional list of dotted field paths to keep, paths through "tasks" apply to every task
+        task_statuses: Optional list of task statuses to keep, e.g. ["FAILED", "IN_PROGRESS"]
+        failed_tasks_only: If True, only keep tasks that failed, timed out or were canceled
+        summarize_payloads: If True, replace large input/output payloads with their size and a hash
+    """
+
+    async def fetch(workflow_id: str) -> Dict[str, Any]:
+        execution = await http_proxy.http_get_json(_execution_path(workflow_id, fields))
+        return _shape_execution(execution, fields, task_statuses, failed_tasks_only, summarize_payloads)
+
+    concurrency = batch_concurrency()
+    return json.dumps(await fetch_each(workflow_ids, fetch, concurrency))
 
 
 @workflow_mcp.tool()
@@ -256,6 +422,192 @@ async def start_workflow_by_name(
     return await http_proxy.http_post(path, data, additional_headers=additional_headers)
 
 
+@workflow_mcp.tool()
+async def start_workflow_and_wait(
+    workflow_name: str,
+    version: Optional[int] = None,
+    data: Dict[str, Any] = {},
+    correlation_id: Optional[str] = None,
+    wait_until_task_ref: Optional[str] = None,
+    timeout_seconds: int = 30,
+) -> str:
+    """Starts a new execution of a conductor workflow and waits for it to finish, returning its result in one call.
+
+    Use this instead of start_workflow_by_name followed by repeated get_workflow_by_id calls. Returns a JSON object
+    with the workflowId, the status and the workflow output (or reasonForIncompletion when it did not complete). If
+    the workflow is still running when the timeout expires, the current status is returned and the workflowId can be
+    used to check on it later.
+
+    Args:
+        workflow_name: The name of the workflow definition to create a new execution for
+        version: The version of the workflow definition, defaults to the latest version
+        data: A dictionary containing any arguments to pass into the workflow for creation
+        correlation_id: An optional identifier used to correlate the workflow execution with other workflows
+        wait_until_task_ref: Return as soon as the task with this reference name finishes, instead of waiting for
+            the whole workflow
+        timeout_seconds: The maximum number of seconds to wait (default: 30)
+    """
+    deadline = time.monotonic() + timeout_seconds
+    if version is None:
+        version = (await http_proxy.http_get_json(f"metadata/workflow/{workflow_name}"))["version"]
+
+    execution = await _execute_workflow(workflow_name, version, data, correlation_id, wait_until_task_ref, deadline)
+    if execution is None:
+        start_request = {"name": workflow_name, "version": version, "input": data, "correlationId": correlation_id}
+        response = await http_proxy.http_request("POST", "workflow", data=start_request)
+        if not response.is_success:
+            raise http_proxy.ConductorRequestError(response)
+        execution = {"workflowId": response.text.strip('"'), "status": "RUNNING"}
+
+    if not _wait_finished(execution, wait_until_task_ref):
+        execution = await _poll_workflow(execution["workflowId"], wait_until_task_ref, deadline)
+    return json.dumps(_final_result(execution, wait_until_task_ref))
+
+
+async def _execute_workflow(
+    name: str,
+    version: int,
+    data: Dict[str, Any],
+    correlation_id: Optional[str],
+    wait_until_task_ref: Optional[str],
+    deadline: float,
+) -> Optional[Dict[str, Any]]:
+    """Starts a workflow through the synchronous execute API, returning None when the server does not provide it"""
+    wait_seconds = max(1, min(SYNC_WAIT_MAX_SECONDS, int(deadline - time.monotonic())))
+    path = f"workflow/execute/{name}/{version}?requestId={uuid.uuid4()}&waitForSeconds={wait_seconds}"
+    if wait_until_task_ref:
+        path += f"&waitUntilTaskRef={wait_until_task_ref}"
+    start_request = {"name": name, "version": version, "input": data, "correlationId": correlation_id}
+    response = await http_proxy.http_request("POST", path, data=start_request)
+    if response.status_code in (404, 405):
+        return None
+    if not response.is_success:
+        raise http_proxy.ConductorRequestError(response)
+    return response.json()
+
+
+def _wait_finished(execution: Dict[str, Any], wait_until_task_ref: Optional[str]) -> bool:
+    if execution.get("status") in TERMINAL_WORKFLOW_STATUSES:
+        return True
+    if not wait_until_task_ref:
+        return False
+    return any(
+        task.get("referenceTaskName") == wait_until_task_ref and task.get("status") in TERMINAL_TASK_STATUSES
+        for task in execution.get("tasks") or []
+    )
+
+
+async def _poll_workflow(workflow_id: str, wait_until_task_ref: Optional[str], deadline: float) -> Dict[str, Any]:
+    """Polls an execution with a growing interval until it finishes or the deadline passes"""
+    # the task list is only needed to see whether the awaited task has finished
+    path = f"workflow/{workflow_id}?includeTasks={str(bool(wait_until_task_ref)).lower()}&summarize=false"
+    interval = POLL_INITIAL_INTERVAL
+    while True:
+        execution = await http_proxy.http_get_json(path)
+        remaining = deadline - time.monotonic()
+        if _wait_finished(execution, wait_until_task_ref) or remaining <= 0:
+            return execution
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+
+
+def _final_result(execution: Dict[str, Any], wait_until_task_ref: Optional[str]) -> Dict[str, Any]:
+    result = {
+        "workflowId": execution.get("workflowId"),
+        "status": execution.get("status"),
+        "output": execution.get("output"),
+    }
+    if execution.get("reasonForIncompletion"):
+        result["reasonForIncompletion"] = execution["reasonForIncompletion"]
+    for task in execution.get("tasks") or []:
+        if wait_until_task_ref and task.get("referenceTaskName") == wait_until_task_ref:
+            result["task"] = {"status": task.get("status"), "output": task.get("outputData")}
+    return result
+
+
+@workflow_mcp.tool()
+async def watch_workflows(
+    workflow_ids: List[str],
+    ctx: Context,
+    condition: Literal["any", "all", "first_failure"] = "all",
+    timeout_seconds: int = 60,
+) -> str:
+    """Waits on many workflow executions at once and returns when a completion condition is met.
+
+    Use this instead of calling get_workflow_by_id repeatedly while workflows run. The executions are polled from
+    the server with an interval that grows while nothing changes, and progress is reported while waiting. Returns a
+    JSON object with whether the condition was met, the elapsed seconds, a map of workflow id to status, the
+    reasonForIncompletion of the executions that did not complete and the last error fetching each execution that
+    could not be read. Watching stops early when no execution could be read in a round.
+
+    Args:
+        workflow_ids: The uuids of the workflow executions to watch
+        condition: any: return once any execution finishes. all: return once every execution finishes.
+            first_failure: return as soon as an execution fails, times out or is terminated, or once all finish
+        timeout_seconds: The maximum number of seconds to wait (default: 60)
+    """
+    started = time.monotonic()
+    deadline = started + timeout_seconds
+    statuses: Dict[str, str] = dict.fromkeys(workflow_ids, "UNKNOWN")
+    reasons: Dict[str, str] = {}
+    errors: Dict[str, str] = {}
+    concurrency = batch_concurrency()
+    interval = POLL_INITIAL_INTERVAL
+
+    while True:
+        pending = [wid for wid, status in statuses.items() if status not in WATCH_FINISHED_STATUSES]
+        executions = await gather_bounded(
+            pending,
+            lambda wid: http_proxy.http_get_json(f"workflow/{wid}?includeTasks=false&summarize=true"),
+            concurrency,
+        )
+        changed = False
+        unreadable = 0
+        for workflow_id, execution in zip(pending, executions):
+            if isinstance(execution, http_proxy.ConductorRequestError) and execution.status_code == 404:
+                status = "NOT_FOUND"
+            elif isinstance(execution, Exception):
+                errors[workflow_id] = str(execution) or type(execution).__name__
+                unreadable += 1
+                continue
+            else:
+                errors.pop(workflow_id, None)
+                status = execution.get("status", "UNKNOWN")
+                if execution.get("reasonForIncompletion"):
+                    reasons[workflow_id] = execution["reasonForIncompletion"]
+            changed = changed or status != statuses[workflow_id]
+            statuses[workflow_id] = status
+
+        finished = sum(1 for status in statuses.values() if status in WATCH_FINISHED_STATUSES)
+        met = _watch_condition_met(condition, statuses, finished)
+        remaining = deadline - time.monotonic()
+        # e.g. a rejected token or an open circuit, polling until the timeout would only hide the error
+        if met or remaining <= 0 or (pending and unreadable == len(pending)):
+            return json.dumps(
+                {
+                    "condition_met": met,
+                    "elapsed_seconds": round(time.monotonic() - started, 1),
+                    "statuses": statuses,
+                    "reasons": reasons,
+                    "errors": errors,
+                }
+            )
+
+        await ctx.report_progress(finished, len(statuses), f"{finished}/{len(statuses)} workflows finished")
+        interval = POLL_INITIAL_INTERVAL if changed else min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+        await asyncio.sleep(min(interval, remaining))
+
+
+def _watch_condition_met(condition: str, statuses: Dict[str, str], finished: int) -> bool:
+    if finished == len(statuses):
+        return True
+    if condition == "any":
+        return finished > 0
+    if condition == "first_failure":
+        return any(status in FAILED_WORKFLOW_STATUSES for status in statuses.values())
+    return False
+
+
 @workflow_mcp.tool()
 async def get_workflow_by_name(workflow_name: str) -> str:
     """Gets the metadata for a conductor workflow in json format based on that workflow's name
@@ -274,6 +626,22 @@ async def get_all_workflows() -> str:
     return await http_proxy.http_get(path)
 
 
+@workflow_mcp.tool()
+async def get_all_workflows_all_clusters(clusters: Optional[List[str]] = None) -> str:
+    """Gets a short description of the conductor workflows of every configured cluster, queried concurrently.
+
+    Returns {"workflows": [...], "errors": {...}} where every workflow is tagged with the "cluster" it is defined on.
+
+    Args:
+        clusters: Optional names of the clusters to query, every configured cluster when omitted
+    """
+    definitions, errors = await fan_out(
+        lambda: http_proxy.http_get_json("metadata/workflow?short=true&metadata=true"), clusters
+    )
+    workflows = [{**workflow, "cluster": name} for name, listed in definitions.items() for workflow in listed]
+    return json.dumps({"workflows": workflows, "errors": errors})
+
+
 @workflow_mcp.tool()
 async def pause_workflow(workflow_id: str) -> str:
     """Pauses a running workflow execution. The workflow will pause and can be resumed later.
@@ -331,3 +699,127 @@ async def retry_workflow(workflow_id: str, resume_subworkflow_tasks: bool = Fals
     """
     path = f"workflow/{workflow_id}/retry?resumeSubworkflowTasks={str(resume_subworkflow_tasks).lower()}"
     return await http_proxy.http_post(path)
+
+
+def _operation_requests(
+    operation: str, reason: Optional[str], use_latest_definitions: bool, resume_subworkflow_tasks: bool
+) -> Tuple[Optional[Tuple[str, str]], Callable[[str], Tuple[str, str]]]:
+    """Maps a control operation to its bulk (method, path), if any, and a per-id (method, path) factory"""
+    latest = str(use_latest_definitions).lower()
+    reason_param = f"?reason={reason}" if reason else ""
+    if operation == "pause":
+        return ("PUT", "workflow/bulk/pause"), lambda wid: ("PUT", f"workflow/{wid}/pause")
+    if operation == "resume":
+        return ("PUT", "workflow/bulk/resume"), lambda wid: ("PUT", f"workflow/{wid}/resume")
+    if operation == "terminate":
+        return ("POST", f"workflow/bulk/terminate{reason_param}"), lambda wid: (
+            "DELETE",
+            f"workflow/{wid}{reason_param}",
+        )
+    if operation == "restart":
+        return (
+            ("POST", f"workflow/bulk/restart?useLatestDefinitions={latest}"),
+            lambda wid: ("POST", f"workflow/{wid}/restart?useLatestDefinitions={latest}"),
+        )
+    # the bulk retry endpoint has no way to resume subworkflow tasks, so that option always fans out
+    bulk = None if resume_subworkflow_tasks else ("POST", "workflow/bulk/retry")
+    resume = str(resume_subworkflow_tasks).lower()
+    return bulk, lambda wid: ("POST", f"workflow/{wid}/retry?resumeSubworkflowTasks={resume}")
+
+
+async def _search_workflow_ids(query: str, limit: int) -> List[str]:
+    ids = []
+    async for _, _, page in search.iter_search_pages(SearchRequest(query=query), limit):
+        ids.extend(result["workflowId"] for result in page)
+    return ids
+
+
+async def _run_bulk(method: str, path: str, workflow_ids: List[str]) -> Optional[Tuple[List[str], Dict[str, str]]]:
+    """Runs one bulk request, returning None when the server has no bulk endpoint for the operation"""
+    response = await http_proxy.http_request(method, path, data=workflow_ids)
+    if response.status_code in (404, 405):
+        return None
+    if not response.is_success:
+        return [], {wid: http_proxy.error_text(response) for wid in workflow_ids}
+    body = response.json()
+    return body.get("bulkSuccessfulResults") or [], body.get("bulkErrorResults") or {}
+
+
+@workflow_mcp.tool()
+async def batch_workflow_operation(
+    operation: Literal["pause", "resume", "terminate", "restart", "retry"],
+    workflow_ids: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    max_workflows: int = 1000,
+    reason: Optional[str] = None,
+    use_latest_definitions: bool = False,
+    resume_subworkflow_tasks: bool = False,
+) -> str:
+    """Pauses, resumes, terminates, restarts or retries many workflow executions in a single call.
+
+    Use this instead of calling pause_workflow/resume_workflow/terminate_workflow/restart_workflow/retry_workflow once
+    per execution. Workflows are selected either by an explicit list of ids or by a query_workflow_executions query
+    string, e.g. 'status="FAILED" AND workflowType="SimpleWorkflow"'.
+
+    Returns a JSON summary: the number of workflows requested, the ids that succeeded and an error message per id
+    that failed.
+
+    Args:
+        operation: The control operation to apply to every selected workflow
+        workflow_ids: The uuids of the workflow executions to act on
+        query: A query string (same syntax as query_workflow_executions) used to select workflows when no ids are given
+        max_workflows: The maximum number of workflows a query may select (default: 1000)
+        reason: Optional reason, only used by terminate
+        use_latest_definitions: Only used by restart. If True, use the latest workflow definition
+        resume_subworkflow_tasks: Only used by retry. If True, resume any subworkflow tasks that were running
+    """
+    if workflow_ids:
+        ids = list(dict.fromkeys(workflow_ids))
+    elif query:
+        ids = list(dict.fromkeys(await _search_workflow_ids(query, max_workflows)))
+    else:
+        raise ValueError("Either workflow_ids or query must be provided")
+
+    bulk, single = _operation_requests(operation, reason, use_latest_definitions, resume_subworkflow_tasks)
+    concurrency = batch_concurrency()
+    succeeded: List[str] = []
+    failed: Dict[str, str] = {}
+    remaining = ids
+
+    if bulk is not None:
+        method, path = bulk
+        chunks = [ids[i : i + BULK_CHUNK_SIZE] for i in range(0, len(ids), BULK_CHUNK_SIZE)]
+        results = await gather_bounded(chunks, lambda chunk: _run_bulk(method, path, chunk), concurrency)
+        remaining = []
+        for chunk, result in zip(chunks, results):
+            if result is None:
+                remaining.extend(chunk)
+            elif isinstance(result, Exception):
+                failed.update({wid: str(result) for wid in chunk})
+            else:
+                succeeded.extend(result[0])
+                failed.update(result[1])
+
+    async def run_single(workflow_id: str) -> httpx.Response:
+        method, path = single(workflow_id)
+        return await http_proxy.http_request(method, path)
+
+    responses = await gather_bounded(remaining, run_single, concurrency)
+    for workflow_id, response in zip(remaining, responses):
+        if isinstance(response, Exception):
+            failed[workflow_id] = str(response)
+        elif response.is_success:
+            succeeded.append(workflow_id)
+        else:
+            failed[workflow_id] = http_proxy.error_text(response)
+
+    return json.dumps(
+        {
+            "operation": operation,
+            "requested": len(ids),
+            "succeeded": len(succeeded),
+            "failed": len(failed),
+            "succeeded_ids": succeeded,
+            "errors": failed,
+        }
+    )
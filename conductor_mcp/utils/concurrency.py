@@ -0,0 +1,55 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, TypeVar
+from conductor_mcp.utils import settings
+from conductor_mcp.utils.constants import CONDUCTOR_BATCH_CONCURRENCY
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_CONCURRENCY = 10
+
+
+def batch_concurrency() -> int:
+    """The number of concurrent requests batch tools send when a bulk endpoint is unavailable"""
+    return settings.get_int(CONDUCTOR_BATCH_CONCURRENCY, DEFAULT_BATCH_CONCURRENCY)
+
+
+async def gather_bounded(items: Iterable[T], fn: Callable[[T], Awaitable[Any]], limit: int) -> List[Any]:
+    """Runs fn over every item with at most `limit` calls in flight
+
+    :param items: The items to process
+    :param fn: The coroutine function applied to each item
+    :param limit: The maximum number of concurrent calls
+    :return: The results in the same order as the items. A call that raised is returned as its exception.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item: T):
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*[run(item) for item in items], return_exceptions=True)
+
+
+async def fetch_each(ids: Iterable[str], fetch: Callable[[str], Awaitable[Any]], limit: int) -> List[Dict[str, Any]]:
+    """Fetches every unique id concurrently, keeping partial results when some of the fetches fail
+
+    :param ids: The ids to fetch, duplicates are only fetched once
+    :param fetch: The coroutine function that fetches a single id
+    :param limit: The maximum number of concurrent fetches
+    :return: One {"id", "result"} or {"id", "error"} dict per unique id, in the order the ids were first given
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    results = await gather_bounded(unique_ids, fetch, limit)
+    return [
+        {"id": item_id, "error": str(result)} if isinstance(result, Exception) else {"id": item_id, "result": result}
+        for item_id, result in zip(unique_ids, results)
+    ]
@@ -10,3 +10,69 @@
 CONDUCTOR_AUTH_KEY = "CONDUCTOR_AUTH_KEY"
 CONDUCTOR_AUTH_SECRET = "CONDUCTOR_AUTH_SECRET"
 CONDUCTOR_SERVER_URL = "CONDUCTOR_SERVER_URL"
+
+# Optional named clusters besides the default one, a JSON object of name to the three connection values above
+CONDUCTOR_CLUSTERS = "CONDUCTOR_CLUSTERS"
+
+# Optional HTTP client tuning, read from the environment (or the JSON config passed to the server)
+CONDUCTOR_HTTP_MAX_CONNECTIONS = "CONDUCTOR_HTTP_MAX_CONNECTIONS"
+CONDUCTOR_HTTP_MAX_KEEPALIVE_CONNECTIONS = "CONDUCTOR_HTTP_MAX_KEEPALIVE_CONNECTIONS"
+CONDUCTOR_HTTP_KEEPALIVE_EXPIRY_SECONDS = "CONDUCTOR_HTTP_KEEPALIVE_EXPIRY_SECONDS"
+CONDUCTOR_HTTP_TIMEOUT_SECONDS = "CONDUCTOR_HTTP_TIMEOUT_SECONDS"
+CONDUCTOR_HTTP_CONNECT_TIMEOUT_SECONDS = "CONDUCTOR_HTTP_CONNECT_TIMEOUT_SECONDS"
+CONDUCTOR_HTTP2 = "CONDUCTOR_HTTP2"
+
+# Optional metadata response cache tuning
+CONDUCTOR_CACHE_TTLS = "CONDUCTOR_CACHE_TTLS"
+CONDUCTOR_CACHE_MAX_BYTES = "CONDUCTOR_CACHE_MAX_BYTES"
+
+# Optional bulk operation tuning
+CONDUCTOR_BATCH_CONCURRENCY = "CONDUCTOR_BATCH_CONCURRENCY"
+
+# Optional caps applied to workflow search results returned to the client
+CONDUCTOR_SEARCH_MAX_RESULTS = "CONDUCTOR_SEARCH_MAX_RESULTS"
+CONDUCTOR_SEARCH_MAX_BYTES = "CONDUCTOR_SEARCH_MAX_BYTES"
+
+# Optional retry and circuit breaker tuning
+CONDUCTOR_RETRY_MAX_ATTEMPTS = "CONDUCTOR_RETRY_MAX_ATTEMPTS"
+CONDUCTOR_RETRY_BASE_DELAY_SECONDS = "CONDUCTOR_RETRY_BASE_DELAY_SECONDS"
+CONDUCTOR_RETRY_MAX_DELAY_SECONDS = "CONDUCTOR_RETRY_MAX_DELAY_SECONDS"
+CONDUCTOR_CIRCUIT_FAILURE_THRESHOLD = "CONDUCTOR_CIRCUIT_FAILURE_THRESHOLD"
+CONDUCTOR_CIRCUIT_RESET_SECONDS = "CONDUCTOR_CIRCUIT_RESET_SECONDS"
+
+# Optional limits on outbound requests to Conductor
+CONDUCTOR_MAX_CONCURRENT_REQUESTS = "CONDUCTOR_MAX_CONCURRENT_REQUESTS"
+CONDUCTOR_RATE_LIMITS = "CONDUCTOR_RATE_LIMITS"
+
+# Optional encoding applied to tool responses: raw, compact or table
+CONDUCTOR_RESPONSE_ENCODING = "CONDUCTOR_RESPONSE_ENCODING"
+
+# Optional task queue depth sampling, the sampler starts with the server when CONDUCTOR_QUEUE_SAMPLER is true
+CONDUCTOR_QUEUE_SAMPLER = "CONDUCTOR_QUEUE_SAMPLER"
+CONDUCTOR_QUEUE_SAMPLE_SECONDS = "CONDUCTOR_QUEUE_SAMPLE_SECONDS"
+CONDUCTOR_QUEUE_SAMPLE_CAPACITY = "CONDUCTOR_QUEUE_SAMPLE_CAPACITY"
+
+# Optional local metadata index, stored in CONDUCTOR_CACHE_DIR
+CONDUCTOR_CACHE_DIR = "CONDUCTOR_CACHE_DIR"
+CONDUCTOR_METADATA_SYNC_SECONDS = "CONDUCTOR_METADATA_SYNC_SECONDS"
+CONDUCTOR_METADATA_SYNC_ON_START = "CONDUCTOR_METADATA_SYNC_ON_START"
+
+# Optional interval at which subscribed resources are polled for changes
+CONDUCTOR_SUBSCRIPTION_POLL_SECONDS = "CONDUCTOR_SUBSCRIPTION_POLL_SECONDS"
+CONDUCTOR_SUBSCRIPTION_MAX_WORKFLOWS = "CONDUCTOR_SUBSCRIPTION_MAX_WORKFLOWS"
+
+# Optional cap on response bodies held in memory, larger ones are spilled to temporary files (blobs)
+CONDUCTOR_MAX_RESPONSE_BYTES = "CONDUCTOR_MAX_RESPONSE_BYTES"
+CONDUCTOR_BLOB_MAX_COUNT = "CONDUCTOR_BLOB_MAX_COUNT"
+CONDUCTOR_BLOB_MAX_BYTES = "CONDUCTOR_BLOB_MAX_BYTES"
+CONDUCTOR_BLOB_MAX_PARSE_BYTES = "CONDUCTOR_BLOB_MAX_PARSE_BYTES"
+
+# Optional OpenTelemetry tracing: off, otlp or file, file mode writes JSON lines to CONDUCTOR_TRACE_FILE
+CONDUCTOR_TRACING = "CONDUCTOR_TRACING"
+CONDUCTOR_TRACE_FILE = "CONDUCTOR_TRACE_FILE"
+
+# Optional file the metrics are written to when the server shuts down
+CONDUCTOR_METRICS_FILE = "CONDUCTOR_METRICS_FILE"
+
+# Optional log level for the server, defaults to INFO
+CONDUCTOR_LOG_LEVEL = "CONDUCTOR_LOG_LEVEL"
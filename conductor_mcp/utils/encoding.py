@@ -0,0 +1,107 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+Opt-in compact encodings for the JSON returned by tools, selected with CONDUCTOR_RESPONSE_ENCODING:
+
+raw      Conductor's response text, unchanged (the default)
+compact  Minified JSON with null values, empty objects and empty lists removed
+table    compact, and every list of two or more objects becomes {"columns": [...], "rows": [[...], ...]}
+"""
+
+import json
+from typing import Any
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from mcp.types import TextContent
+from conductor_mcp.utils import metrics, settings
+from conductor_mcp.utils.constants import CONDUCTOR_RESPONSE_ENCODING
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+ENCODINGS = ("raw", "compact", "table")
+
+
+def loads(text: str) -> Any:
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def strip_empty(value: Any) -> Any:
+    """Recursively drops null values, empty objects and empty lists from objects"""
+    if isinstance(value, dict):
+        stripped = {key: strip_empty(item) for key, item in value.items()}
+        return {key: item for key, item in stripped.items() if item is not None and item != {} and item != []}
+    if isinstance(value, list):
+        return [strip_empty(item) for item in value]
+    return value
+
+
+def tabulate(value: Any) -> Any:
+    """Recursively turns lists of objects into a column list and one row of values per object"""
+    if isinstance(value, dict):
+        return {key: tabulate(item) for key, item in value.items()}
+    if not isinstance(value, list):
+        return value
+    items = [tabulate(item) for item in value]
+    if len(items) < 2 or not all(isinstance(item, dict) for item in items):
+        return items
+    columns = list(dict.fromkeys(key for item in items for key in item))
+    return {"columns": columns, "rows": [[item.get(column) for column in columns] for item in items]}
+
+
+def encode(text: str, encoding: str) -> str:
+    """Re-encodes a JSON response, returning anything that is not JSON unchanged"""
+    if encoding == "raw":
+        return text
+    try:
+        value = loads(text)
+    except ValueError:
+        return text
+    value = strip_empty(value)
+    if encoding == "table":
+        value = tabulate(value)
+    return dumps(value)
+
+
+def configured_encoding() -> str:
+    encoding = settings.get_str(CONDUCTOR_RESPONSE_ENCODING, "raw").lower()
+    if encoding not in ENCODINGS:
+        raise ValueError(f"{CONDUCTOR_RESPONSE_ENCODING} must be one of {', '.join(ENCODINGS)}, got {encoding}")
+    return encoding
+
+
+class EncodingMiddleware(Middleware):
+    """Applies the configured encoding to the text returned by every tool and records the bytes saved"""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        # read before the call, so that a bad setting never fails a tool after its side effects happened
+        encoding = configured_encoding()
+        result = await call_next(context)
+        if encoding == "raw":
+            return result
+
+        name = context.message.name
+        for block in result.content:
+            if not isinstance(block, TextContent):
+                continue
+            encoded = encode(block.text, encoding)
+            metrics.TOOL_RESPONSE_BYTES.inc(len(block.text.encode()), name=name, stage="raw")
+            metrics.TOOL_RESPONSE_BYTES.inc(len(encoded.encode()), name=name, stage=encoding)
+            if result.structured_content is not None and result.structured_content.get("result") == block.text:
+                result.structured_content["result"] = encoded
+            block.text = encoded
+        return result
@@ -0,0 +1,225 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""
+In-process metrics rendered in the Prometheus/OpenMetrics text format.
+
+The metrics are served from the conductor://server/metrics resource, from /metrics when running over http/sse, and
+can be written to CONDUCTOR_METRICS_FILE on shutdown.
+"""
+
+import bisect
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from fastmcp.resources.template import match_uri_template
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# path segments kept verbatim in endpoint templates, anything else (ids, names) becomes {id}
+STATIC_SEGMENTS = {
+    "all",
+    "bulk",
+    "decide",
+    "event",
+    "execute",
+    "log",
+    "metadata",
+    "pause",
+    "queue",
+    "rerun",
+    "restart",
+    "resume",
+    "retry",
+    "search",
+    "skiptask",
+    "taskdefs",
+    "tasks",
+    "terminate",
+    "token",
+    "workflow",
+}
+
+
+def endpoint_template(resource_path: str) -> str:
+    """Turns a resource path into a low cardinality label, e.g. workflow/{id}/pause"""
+    segments = resource_path.split("?", 1)[0].strip("/").split("/")
+    return "/".join(segment if segment in STATIC_SEGMENTS else "{id}" for segment in segments)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(tuple(str(labels[name]) for name in self.labelnames), 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}_total{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # per label set: bucket counts (last slot is +Inf), sum
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: Any):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def count(self, **labels: Any) -> int:
+        entry = self._values.get(tuple(str(labels[name]) for name in self.labelnames))
+        return sum(entry[0]) if entry else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            cumulative += counts[-1]
+            labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total[0]}")
+        return lines
+
+
+TOOL_CALLS = Counter("conductor_mcp_invocations", "Tool, resource and prompt invocations", ("kind", "name", "outcome"))
+TOOL_LATENCY = Histogram(
+    "conductor_mcp_invocation_duration_seconds", "Tool, resource and prompt latency", ("kind", "name")
+)
+UPSTREAM_LATENCY = Histogram(
+    "conductor_mcp_upstream_request_duration_seconds",
+    "Latency of each request attempt sent to Conductor",
+    ("method", "endpoint", "status"),
+)
+UPSTREAM_RESPONSE_BYTES = Histogram(
+    "conductor_mcp_upstream_response_bytes",
+    "Size of the response bodies returned by Conductor",
+    ("method", "endpoint"),
+    buckets=SIZE_BUCKETS,
+)
+TOKEN_REFRESHES = Counter("conductor_mcp_token_refreshes", "Token refreshes sent to Conductor", ("outcome",))
+TOOL_RESPONSE_BYTES = Counter(
+    "conductor_mcp_tool_response_bytes",
+    "Bytes returned by tools before (stage=raw) and after CONDUCTOR_RESPONSE_ENCODING is applied",
+    ("name", "stage"),
+)
+COALESCED_REQUESTS = Counter(
+    "conductor_mcp_upstream_gets",
+    "GET requests sent to Conductor (outcome=sent) or served by an identical request already in flight",
+    ("outcome",),
+)
+
+REGISTRY = [
+    TOOL_CALLS,
+    TOOL_LATENCY,
+    UPSTREAM_LATENCY,
+    UPSTREAM_RESPONSE_BYTES,
+    TOKEN_REFRESHES,
+    TOOL_RESPONSE_BYTES,
+    COALESCED_REQUESTS,
+]
+
+
+def render() -> str:
+    """Renders every registered metric in the OpenMetrics text format"""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+# label of resource reads that match neither a resource nor a resource template
+UNMATCHED_RESOURCE = "unmatched"
+
+
+class ResourceLabels:
+    """Labels a resource read by the resource or resource template it went through, never by the concrete URI.
+
+    Templated resources (blob pages, change feeds) would otherwise add a label set for every URI ever read.
+    """
+
+    def __init__(self):
+        self._resources: Optional[set] = None
+        self._templates: List[str] = []
+
+    async def label(self, context: MiddlewareContext) -> str:
+        uri = str(context.message.uri)
+        if self._resources is None:
+            if context.fastmcp_context is None:
+                return UNMATCHED_RESOURCE
+            server = context.fastmcp_context.fastmcp
+            self._templates = list(await server.get_resource_templates())
+            self._resources = set(await server.get_resources())
+        if uri in self._resources:
+            return uri
+        for template in self._templates:
+            if match_uri_template(uri, template) is not None:
+                return template
+        return UNMATCHED_RESOURCE
+
+
+class MetricsMiddleware(Middleware):
+    """Records the count and latency of every tool call, resource read and prompt render"""
+
+    def __init__(self):
+        self._resource_labels = ResourceLabels()
+
+    async def _observe(self, kind: str, name: str, context: MiddlewareContext, call_next: CallNext) -> Any:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await call_next(context)
+            outcome = "ok"
+            return result
+        finally:
+            TOOL_LATENCY.observe(time.perf_counter() - started, kind=kind, name=name)
+            TOOL_CALLS.inc(kind=kind, name=name, outcome=outcome)
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        return await self._observe("tool", context.message.name, context, call_next)
+
+    async def on_read_resource(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        return await self._observe("resource", await self._resource_labels.label(context), context, call_next)
+
+    async def on_get_prompt(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        return await self._observe("prompt", context.message.name, context, call_next)
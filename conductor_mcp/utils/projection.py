@@ -0,0 +1,125 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""Helpers that shrink workflow execution documents before they are handed back to the client."""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+FAILED_TASK_STATUSES = ("FAILED", "FAILED_WITH_TERMINAL_ERROR", "TIMED_OUT", "CANCELED")
+PAYLOAD_KEYS = ("input", "output", "inputData", "outputData", "variables")
+DEFAULT_SUMMARY_THRESHOLD_BYTES = 256
+
+
+def needs_tasks(fields: Optional[List[str]]) -> bool:
+    """Whether a field projection keeps any part of the execution's task list"""
+    return fields is None or any(field == "tasks" or field.startswith("tasks.") for field in fields)
+
+
+def _select(node: Any, path: List[str]) -> Any:
+    if not path:
+        return node
+    if isinstance(node, list):
+        return [_select(item, path) for item in node]
+    if not isinstance(node, dict) or path[0] not in node:
+        return None
+    return {path[0]: _select(node[path[0]], path[1:])}
+
+
+def _merge(target: Dict[str, Any], selected: Any):
+    for key, value in selected.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        elif isinstance(value, list) and isinstance(target.get(key), list):
+            for existing, item in zip(target[key], value):
+                if isinstance(existing, dict) and isinstance(item, dict):
+                    _merge(existing, item)
+        else:
+            target[key] = value
+
+
+def project(document: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """Keeps only the given dotted field paths, e.g. ["status", "tasks.taskReferenceName"]
+
+    Paths that go through a list are applied to every element of that list.
+    """
+    projected: Dict[str, Any] = {}
+    for field in fields:
+        selected = _select(document, field.split("."))
+        if isinstance(selected, dict):
+            _merge(projected, selected)
+    return projected
+
+
+def filter_tasks(execution: Dict[str, Any], statuses: Iterable[str]) -> Dict[str, Any]:
+    """Drops every task whose status is not in statuses"""
+    wanted = set(statuses)
+    if "tasks" in execution:
+        execution["tasks"] = [task for task in execution["tasks"] if task.get("status") in wanted]
+    return execution
+
+
+def summarize_payload(value: Any) -> Dict[str, Any]:
+    encoded = json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return {"_size": len(encoded), "_sha256": hashlib.sha256(encoded).hexdigest()[:16]}
+
+
+def summarize_payloads(node: Any, threshold: int = DEFAULT_SUMMARY_THRESHOLD_BYTES) -> Any:
+    """Replaces large input/output payloads with their size and a hash, recursing into tasks and sub-documents"""
+    if isinstance(node, list):
+        return [summarize_payloads(item, threshold) for item in node]
+    if not isinstance(node, dict):
+        return node
+    for key, value in node.items():
+        if key in PAYLOAD_KEYS and value:
+            summary = summarize_payload(value)
+            node[key] = summary if summary["_size"] > threshold else value
+        elif isinstance(value, (dict, list)):
+            node[key] = summarize_payloads(value, threshold)
+    return node
+
+
+# one JSONPath step: .name, .*, [index], [*], [start:end] or ['name']
+JSON_PATH_STEP = re.compile(r"\.(\w+|\*)|\[(\*|-?\d+|-?\d*:-?\d*|'[^']*'|\"[^\"]*\")\]")
+
+
+def _json_path_step(node: Any, selector: str) -> List[Any]:
+    if selector == "*":
+        if isinstance(node, dict):
+            return list(node.values())
+        return list(node) if isinstance(node, list) else []
+    if selector[0] in "'\"":
+        selector = selector[1:-1]
+    elif isinstance(node, list) and ":" in selector:
+        start, end = selector.split(":")
+        return node[int(start) if start else None : int(end) if end else None]
+    elif isinstance(node, list) and selector.lstrip("-").isdigit():
+        index = int(selector)
+        return [node[index]] if -len(node) <= index < len(node) else []
+    if isinstance(node, dict) and selector in node:
+        return [node[selector]]
+    return []
+
+
+def json_path(document: Any, expression: str) -> List[Any]:
+    """Evaluates a JSONPath subset ($, .name, ['name'], [index], [start:end] and * wildcards), returning every match"""
+    if not expression.startswith("$"):
+        raise ValueError(f"JSONPath expressions start with $, got {expression}")
+    nodes = [document]
+    position = 1
+    while position < len(expression):
+        step = JSON_PATH_STEP.match(expression, position)
+        if step is None:
+            raise ValueError(f"Unsupported JSONPath syntax at {expression[position:]}")
+        position = step.end()
+        selector = step.group(1) or step.group(2)
+        nodes = [child for node in nodes for child in _json_path_step(node, selector)]
+    return nodes
@@ -0,0 +1,40 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+"""Typed accessors for the optional tuning values the server reads from the environment."""
+
+import json
+import os
+from typing import Any
+
+
+def get_str(name: str, default: str = None) -> str:
+    value = os.environ.get(name)
+    return default if value is None or value == "" else value
+
+
+def get_int(name: str, default: int) -> int:
+    value = get_str(name)
+    return default if value is None else int(value)
+
+
+def get_float(name: str, default: float) -> float:
+    value = get_str(name)
+    return default if value is None else float(value)
+
+
+def get_bool(name: str, default: bool) -> bool:
+    value = get_str(name)
+    return default if value is None else value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_json(name: str, default: Any) -> Any:
+    """Reads a JSON encoded value, used for structured options such as per-path maps."""
+    value = get_str(name)
+    return default if value is None else json.loads(value)
@@ -0,0 +1,45 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+
+from typing import Dict, List, Sequence
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Percentile of an already sorted sequence without interpolation, 0 when it is empty
+
+    Returns the value at index round(fraction * (n - 1)), i.e. the sample closest to the linearly interpolated
+    percentile. This is not the textbook nearest-rank method, which uses ceil(fraction * n).
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def distribution(values: List[float]) -> Dict[str, float]:
+    """p50/p95/max of the values, sorting them in place"""
+    values.sort()
+    return {
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "max": values[-1] if values else 0,
+    }
+
+
+def linear_slope(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Least squares slope of ys over xs, 0 when there are fewer than two distinct xs"""
+    count = len(xs)
+    if count < 2:
+        return 0.0
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
@@ -0,0 +1,151 @@
+#  Copyright 2025 Orkes Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+#  the License. You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#  an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#  specific language governing permissions and limitations under the License.
+"""
+Optional OpenTelemetry tracing, selected with CONDUCTOR_TRACING:
+
+off   No spans are recorded (the default)
+otlp  Spans are exported to an OTLP/HTTP collector, configured with the standard OTEL_EXPORTER_OTLP_* variables
+file  Spans are appended as JSON lines to CONDUCTOR_TRACE_FILE, for when no collector is running
+
+Every tool call, resource read and prompt render is a span, with the token refreshes and Conductor requests it caused
+as child spans. The trace context is sent to Conductor in the traceparent header. Requires
+`pip install conductor-mcp[tracing]`, without it tracing stays off.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from conductor_mcp.utils import metrics, settings
+from conductor_mcp.utils.constants import CONDUCTOR_TRACE_FILE, CONDUCTOR_TRACING
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover - opentelemetry is an optional dependency
+    propagate = trace = None
+
+TRACING_MODES = ("off", "otlp", "file")
+SERVICE_NAME = "conductor-mcp"
+DEFAULT_TRACE_FILE = "conductor-mcp-traces.jsonl"
+
+_provider = None
+_tracer = None
+# the trace file of the file mode, closed on shutdown
+_trace_file = None
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def configure() -> bool:
+    """Starts exporting spans as selected by CONDUCTOR_TRACING, called once when the server starts
+
+    :return: True when spans are recorded
+    """
+    global _provider, _tracer, _trace_file
+    mode = settings.get_str(CONDUCTOR_TRACING, "off").lower()
+    if mode not in TRACING_MODES:
+        raise ValueError(f"{CONDUCTOR_TRACING} must be one of {', '.join(TRACING_MODES)}, got '{mode}'")
+    if mode == "off":
+        return False
+    if trace is None:
+        logging.warning(f"{CONDUCTOR_TRACING}={mode} requires `pip install conductor-mcp[tracing]`, tracing is off")
+        return False
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    if mode == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        exporter = OTLPSpanExporter()
+    else:
+        path = settings.get_str(CONDUCTOR_TRACE_FILE, DEFAULT_TRACE_FILE)
+        _trace_file = open(path, "a")
+        exporter = ConsoleSpanExporter(out=_trace_file, formatter=lambda span: span.to_json(indent=None) + "\n")
+    # a private provider, so that a process embedding the server keeps its own global one
+    _provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    _tracer = _provider.get_tracer("conductor_mcp")
+    logging.info(f"Exporting traces ({mode})")
+    return True
+
+
+def shutdown():
+    """Flushes the spans that are still buffered and stops exporting"""
+    global _provider, _tracer, _trace_file
+    if _provider is not None:
+        _provider.shutdown()
+    if _trace_file is not None:
+        _trace_file.close()
+    _provider = _tracer = _trace_file = None
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Optional[Any]]:
+    """Records the block as a child of the current span
+
+    :param name: The span name
+    :param kind: The OpenTelemetry span kind, i.e. internal, server or client
+    :param attributes: Attributes set when the span starts, None values are left out
+    :return: The span, or None when tracing is off
+    """
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(
+        name, kind=getattr(trace.SpanKind, kind.upper()), attributes=_present(attributes)
+    ) as current:
+        yield current
+
+
+def set_attributes(current: Optional[Any], **attributes: Any):
+    """Adds attributes to a span returned by span(), a no-op when tracing is off"""
+    if current is not None:
+        current.set_attributes(_present(attributes))
+
+
+def inject(headers: Dict[str, str]):
+    """Adds the traceparent header of the current span to an outgoing request"""
+    if _tracer is not None:
+        propagate.inject(headers)
+
+
+def _present(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+class TracingMiddleware(Middleware):
+    """Records every tool call, resource read and prompt render as a span"""
+
+    def __init__(self):
+        self._resource_labels = metrics.ResourceLabels()
+
+    async def _trace(self, kind: str, name: str, context: MiddlewareContext, call_next: CallNext) -> Any:
+        if _tracer is None:
+            return await call_next(context)
+        with span(f"{kind} {name}", kind="server", **{"mcp.kind": kind, "mcp.name": name}):
+            return await call_next(context)
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        return await self._trace("tool", context.message.name, context, call_next)
+
+    async def on_read_resource(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        if _tracer is None:
+            return await call_next(context)
+        # spans are named by the template, the concrete URI is kept as an attribute
+        name = await self._resource_labels.label(context)
+        attributes = {"mcp.kind": "resource", "mcp.name": name, "mcp.resource.uri": str(context.message.uri)}
+        with span(f"resource {name}", kind="server", **attributes):
+            return await call_next(context)
+
+    async def on_get_prompt(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        return await self._trace("prompt", context.message.name, context, call_next)